@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Dashboard 生成内存基准
+
+对比一次性拼接整页再写入（旧版做法）与 generate_dashboard 流式写入
+在不同职位数量下的峰值内存（tracemalloc，不含职位对象本身），
+并校验两者生成的页面完全一致。
+
+用法：
+    python benchmarks/dashboard_memory.py [职位数量 ...]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dashboard  # noqa: E402
+from scrapers import Job  # noqa: E402
+
+
+def make_jobs(count: int) -> list[Job]:
+    """生成测试职位"""
+    return [
+        Job(
+            title=f"Senior Research Analyst <{i}> & Strategy",
+            company=f"Company {i % 500}",
+            url=f"https://jobs.example.com/{i}",
+            source=f"Portfolio {i % 20}",
+            location="New York" if i % 3 else "",
+            job_type="Full-time" if i % 4 else "",
+            remote=i % 2 == 0,
+            scraped_at="2024-01-01T00:00:00",
+        )
+        for i in range(count)
+    ]
+
+
+def write_joined(jobs: list[Job], output_path: str) -> str:
+    """旧版做法：整页拼成一个字符串后一次写入"""
+    html = "".join(dashboard.iter_dashboard(jobs))
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return output_path
+
+
+def measure(generate, jobs: list[Job], output_path: str) -> tuple[float, float]:
+    """
+    测量一次生成的峰值内存和耗时
+
+    Returns:
+        (峰值内存 MB, 耗时秒数)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    generate(jobs, output_path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000]
+    mismatches = 0
+
+    # 固定页面中的更新时间，保证两次生成的内容可比较
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            mock.patch.object(dashboard, "datetime") as fake_datetime:
+        fake_datetime.utcnow.return_value.strftime.return_value = "2024-01-01 00:00 UTC"
+        joined_path = str(Path(temp_dir) / "joined.html")
+        streamed_path = str(Path(temp_dir) / "streamed.html")
+
+        print(f"{'jobs':>8}  {'page MB':>8}  {'joined MB':>10}  {'streamed MB':>12}  "
+              f"{'joined s':>9}  {'streamed s':>10}")
+        for count in counts:
+            jobs = make_jobs(count)
+            joined_peak, joined_time = measure(write_joined, jobs, joined_path)
+            streamed_peak, streamed_time = measure(dashboard.generate_dashboard, jobs, streamed_path)
+
+            page = Path(joined_path).read_bytes()
+            mismatches += page != Path(streamed_path).read_bytes()
+            print(f"{count:>8,}  {len(page) / 1024 / 1024:>8.1f}  {joined_peak:>10.1f}  "
+                  f"{streamed_peak:>12.2f}  {joined_time:>9.3f}  {streamed_time:>10.3f}")
+
+    print(f"mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
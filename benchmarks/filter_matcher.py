@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JobFilter 匹配基准
+
+对比旧版实现（每个关键词一个正则，逐个 re.search）
+与当前 JobFilter（单个组合正则，一次扫描）在 10 万个标题上的耗时，
+并校验两者的包含/排除判定完全一致。
+
+用法：
+    python benchmarks/filter_matcher.py [标题数量]
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config  # noqa: E402
+from filters import JobFilter  # noqa: E402
+from scrapers import Job  # noqa: E402
+
+FILLER_WORDS = [
+    "senior", "junior", "lead", "head", "of", "global", "remote", "apac",
+    "emea", "defi", "protocol", "team", "staff", "ii", "iii", "(contract)",
+    "web3", "crypto", "-", "&", "manager", "specialist",
+]
+
+
+class LegacyFilter:
+    """旧版过滤器（用于对比）"""
+
+    def __init__(self, include_keywords: list[str], exclude_keywords: list[str]):
+        self._include = [self._compile(k) for k in include_keywords]
+        self._exclude = [self._compile(k) for k in exclude_keywords]
+
+    @staticmethod
+    def _compile(keyword: str) -> re.Pattern:
+        return re.compile(rf"\b{re.escape(keyword.strip())}\b", re.IGNORECASE)
+
+    def should_include(self, job: Job) -> bool:
+        title = job.title.lower()
+        if any(p.search(title) for p in self._exclude):
+            return False
+        return any(p.search(title) for p in self._include)
+
+
+def make_titles(count: int, seed: int = 42) -> list[str]:
+    """生成测试标题（随机混合包含词、排除词和填充词）"""
+    rng = random.Random(seed)
+    vocabulary = config.INCLUDE_KEYWORDS + config.EXCLUDE_KEYWORDS
+    titles = []
+    for _ in range(count):
+        words = rng.sample(FILLER_WORDS, rng.randint(1, 3))
+        words += [rng.choice(vocabulary).strip() for _ in range(rng.randint(0, 2))]
+        rng.shuffle(words)
+        title = " ".join(words)
+        titles.append(title.title() if rng.random() < 0.5 else title)
+    return titles
+
+
+def run(job_filter, jobs: list[Job]) -> tuple[list[bool], float]:
+    """执行过滤，返回 (判定列表, 耗时秒数)"""
+    start = time.perf_counter()
+    decisions = [job_filter.should_include(job) for job in jobs]
+    return decisions, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    jobs = [
+        Job(title=title, company="Benchmark", url=f"https://example.com/{i}", source="Benchmark")
+        for i, title in enumerate(make_titles(count))
+    ]
+
+    legacy_decisions, legacy_time = run(
+        LegacyFilter(config.INCLUDE_KEYWORDS, config.EXCLUDE_KEYWORDS), jobs
+    )
+    decisions, elapsed = run(JobFilter(), jobs)
+
+    mismatches = sum(a != b for a, b in zip(legacy_decisions, decisions))
+    print(f"Titles: {count:,}, included: {sum(decisions):,}")
+    print(f"legacy   {legacy_time:8.3f}s  {count / legacy_time:>12,.0f} titles/sec")
+    print(f"matcher  {elapsed:8.3f}s  {count / elapsed:>12,.0f} titles/sec")
+    print(f"speedup  {legacy_time / elapsed:8.1f}x, mismatches: {mismatches}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Job 内存与 unique_id 吞吐基准
+
+对比旧版 Job（普通 dataclass，每次访问重新计算 unique_id）
+与当前 Job（__slots__ + 缓存 unique_id 的 16 字节摘要）在 10 万个职位下的：
+- 每个对象的内存占用（sizeof 为实例 + __dict__，bytes/job 含字段字符串，
+  +ids 为读取过 unique_id 之后；缓存的摘要会常驻内存）
+- unique_id 访问吞吐（模拟去重 / is_known / add_job / to_dict 多次读取）
+
+用法：
+    python benchmarks/job_memory.py [职位数量]
+"""
+import hashlib
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers import Job  # noqa: E402
+
+# 每个职位在一次运行中 unique_id 被读取的次数
+READS_PER_JOB = 4
+
+
+@dataclass
+class LegacyJob:
+    """旧版 Job（用于对比）"""
+    title: str
+    company: str
+    url: str
+    source: str
+    location: str = ""
+    salary: str = ""
+    job_type: str = ""
+    remote: bool = False
+    description: str = ""
+    posted_date: str = ""
+    external_id: str = ""
+    scraped_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    @property
+    def unique_id(self) -> str:
+        key = f"{self.title.lower()}|{self.company.lower()}|{self.url}"
+        return hashlib.md5(key.encode()).hexdigest()
+
+
+def make_jobs(cls, count: int) -> list:
+    """生成测试职位（字符串预先生成，只统计对象本身的开销）"""
+    return [
+        cls(
+            title=f"Senior Research Analyst {i}",
+            company=f"Company {i % 500}",
+            url=f"https://jobs.example.com/{i}",
+            source="Benchmark Portfolio",
+            scraped_at="2024-01-01T00:00:00",
+        )
+        for i in range(count)
+    ]
+
+
+def measure_memory(cls, count: int) -> tuple[float, float]:
+    """
+    测量每个职位的平均内存（字节，含字段字符串）
+
+    Returns:
+        (创建后, 读取 unique_id 后)
+    """
+    tracemalloc.start()
+    jobs = make_jobs(cls, count)
+    created = tracemalloc.get_traced_memory()[0]
+    for job in jobs:
+        job.unique_id
+    touched = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return created / count, touched / count
+
+
+def measure_throughput(cls, count: int) -> float:
+    """测量 unique_id 读取吞吐（次/秒）"""
+    jobs = make_jobs(cls, count)
+    start = time.perf_counter()
+    for _ in range(READS_PER_JOB):
+        for job in jobs:
+            job.unique_id
+    elapsed = time.perf_counter() - start
+    return count * READS_PER_JOB / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"Jobs: {count:,}, unique_id reads per job: {READS_PER_JOB}")
+    print(f"{'':<10}{'sizeof':>8}{'bytes/job':>12}{'+ids':>8}{'ids/sec':>14}")
+    for name, cls in (("legacy", LegacyJob), ("slots", Job)):
+        sample = make_jobs(cls, 1)[0]
+        shell = sys.getsizeof(sample)
+        if hasattr(sample, "__dict__"):
+            shell += sys.getsizeof(vars(sample))
+        created, touched = measure_memory(cls, count)
+        throughput = measure_throughput(cls, count)
+        print(f"{name:<10}{shell:>8}{created:>12.0f}{touched:>8.0f}{throughput:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
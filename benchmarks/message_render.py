@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+消息渲染基准
+
+对比旧版 format_telegram_message（逐字段三次链式 replace 转义，
+8 组 any(kw in title_lower) 生成标签）与 MessageRenderer 的：
+- 首次渲染（预编译标签表，标题只转一次小写）
+- 重复渲染（按 unique_id 缓存命中，模拟重试、摘要、多聊天发送）
+并校验两者输出完全一致。
+
+用法：
+    python benchmarks/message_render.py [职位数量]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from notifier.render import TAG_KEYWORDS, MessageRenderer  # noqa: E402
+from scrapers import Job  # noqa: E402
+
+# 每个职位在一次运行中被渲染的次数（发送 + 重试 + 多个聊天）
+RENDERS_PER_JOB = 3
+
+FILLER_WORDS = [
+    "senior", "junior", "lead", "head", "of", "global", "remote", "devops",
+    "defi", "protocol", "team", "<staff>", "ii", "&", "manager", "bd", "abd",
+]
+
+
+def legacy_escape_html(text: str) -> str:
+    """旧版转义"""
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+    )
+
+
+def legacy_generate_tags(title: str) -> str:
+    """旧版标签生成"""
+    tags = ["#crypto", "#web3"]
+
+    title_lower = title.lower()
+
+    if any(kw in title_lower for kw in ["research", "analyst"]):
+        tags.append("#research")
+    if any(kw in title_lower for kw in ["invest", "vc", "venture", "principal"]):
+        tags.append("#investment")
+    if any(kw in title_lower for kw in ["strateg"]):
+        tags.append("#strategy")
+    if any(kw in title_lower for kw in ["operation", "ops"]):
+        tags.append("#operations")
+    if any(kw in title_lower for kw in ["business development", " bd ", "partner"]):
+        tags.append("#bizdev")
+    if any(kw in title_lower for kw in ["growth", "marketing"]):
+        tags.append("#growth")
+    if any(kw in title_lower for kw in ["product"]):
+        tags.append("#product")
+    if any(kw in title_lower for kw in ["community"]):
+        tags.append("#community")
+
+    return " ".join(tags[:5])
+
+
+def legacy_format(job: Job) -> str:
+    """旧版 format_telegram_message"""
+    lines = [
+        f"📌 <b>{legacy_escape_html(job.title)}</b>",
+        f"🏢 {legacy_escape_html(job.company)}",
+        f"📂 <i>via {legacy_escape_html(job.source)}</i>",
+    ]
+
+    if job.location:
+        location_text = job.location
+        if job.remote:
+            location_text += " (Remote OK)"
+        lines.append(f"📍 {legacy_escape_html(location_text)}")
+    elif job.remote:
+        lines.append("📍 Remote")
+
+    if job.salary:
+        lines.append(f"💰 {legacy_escape_html(job.salary)}")
+
+    if job.job_type:
+        lines.append(f"⏰ {legacy_escape_html(job.job_type)}")
+
+    lines.extend([
+        "",
+        f"🔗 <a href=\"{job.url}\">Apply Now</a>",
+    ])
+
+    tags = legacy_generate_tags(job.title)
+    if tags:
+        lines.extend(["", tags])
+
+    return "\n".join(lines)
+
+
+def make_jobs(count: int, seed: int = 42) -> list[Job]:
+    """生成测试职位（随机混合标签关键词和填充词）"""
+    rng = random.Random(seed)
+    vocabulary = [keyword for keywords in TAG_KEYWORDS.values() for keyword in keywords]
+    vocabulary += ["Investment", "Strategic", "Operations", "Partnerships", "Analyst"]
+    jobs = []
+    for i in range(count):
+        words = rng.sample(FILLER_WORDS, rng.randint(1, 3))
+        words += [rng.choice(vocabulary) for _ in range(rng.randint(0, 3))]
+        rng.shuffle(words)
+        jobs.append(Job(
+            title=" ".join(words),
+            company=rng.choice(["Acme & Co", "Uniswap Labs", "<Stealth>"]),
+            url=f"https://example.com/jobs/{i}",
+            source="Benchmark Portfolio",
+            location=rng.choice(["", "New York", "Remote"]),
+            salary=rng.choice(["", "$150k - $200k"]),
+            remote=rng.random() < 0.3,
+        ))
+    return jobs
+
+
+def run(render, jobs: list[Job]) -> tuple[list[str], float]:
+    """每个职位渲染 RENDERS_PER_JOB 次，返回 (首次渲染结果, 耗时秒数)"""
+    start = time.perf_counter()
+    messages = [render(job) for job in jobs]
+    for _ in range(RENDERS_PER_JOB - 1):
+        for job in jobs:
+            render(job)
+    return messages, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    jobs = make_jobs(count)
+    renders = count * RENDERS_PER_JOB
+
+    legacy_messages, legacy_time = run(legacy_format, jobs)
+    renderer = MessageRenderer(max_size=count)
+    messages, elapsed = run(renderer.render, jobs)
+
+    mismatches = sum(a != b for a, b in zip(legacy_messages, messages))
+    print(f"Jobs: {count:,}, renders: {renders:,} ({RENDERS_PER_JOB} per job)")
+    print(f"legacy    {legacy_time:8.3f}s  {renders / legacy_time:>12,.0f} renders/sec")
+    print(f"renderer  {elapsed:8.3f}s  {renders / elapsed:>12,.0f} renders/sec "
+          f"(cache hits {renderer.hits:,})")
+    print(f"speedup   {legacy_time / elapsed:8.1f}x, mismatches: {mismatches}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,29 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent
 STORAGE_DIR = BASE_DIR / "storage"
 STORAGE_FILE = STORAGE_DIR / "jobs.json"
+SQLITE_FILE = STORAGE_DIR / "jobs.db"
+HTTP_CACHE_FILE = STORAGE_DIR / "http_cache.json"
+DETAIL_CACHE_FILE = STORAGE_DIR / "detail_cache.json"
+CIRCUIT_BREAKER_FILE = STORAGE_DIR / "circuit_breaker.json"
+FILTER_CACHE_FILE = STORAGE_DIR / "filter_cache.json"
+OUTBOX_FILE = STORAGE_DIR / "outbox.json"
 
 # ============== Telegram 配置 ==============
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 
+# 多聊天路由：按职位类别发送到不同聊天，未命中任何类别的发送到 TELEGRAM_CHAT_ID
+# JSON 格式，如 {"research": {"chat_id": "-100123", "keywords": ["research", "analyst"], "rate": 0.3}}
+# （rate 可选，为该聊天每秒最多发送的消息数）
+# 这里只保存原始字符串，由 NotificationRouter 解析和校验（格式错误时只影响通知，不影响抓取）
+TELEGRAM_ROUTES = os.getenv("TELEGRAM_ROUTES", "")
+
 # ============== VC Portfolio Job Boards ==============
 # 支持 Getro 和 Consider 两种平台
 # platform: "getro" 或 "consider"
+# 可选字段：
+#   collection_id: Getro collection ID（不填则从 board 页面自动发现）
+#   board_id: Consider board ID（不填则由键名推导，如 a16z_crypto -> a16z-crypto）
 
 GETRO_BOARDS = {
     # ===== Consider 平台 =====
@@ -200,11 +215,80 @@ EXCLUDE_KEYWORDS = [
     "designer", "design", "ui/ux", "ux", "graphic",
 ]
 
+# 过滤结果缓存（按标题记住包含/排除判定，关键词变化时自动失效）
+FILTER_CACHE_ENABLED = os.getenv("FILTER_CACHE_ENABLED", "true").lower() == "true"
+FILTER_CACHE_SIZE = 50000  # 最多缓存的标题数（LRU 淘汰）
+
+# ============== 存储配置 ==============
+# 存储后端："json"（storage/jobs.json）或 "sqlite"（storage/jobs.db，首次使用时自动迁移 JSON）
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").lower()
+
+# JSON 存储的追加日志模式：新记录追加到 jobs.journal（fsync），不再每次重写 jobs.json
+STORAGE_JOURNAL = os.getenv("STORAGE_JOURNAL", "false").lower() == "true"
+STORAGE_JOURNAL_MAX_BYTES = 1024 * 1024  # 日志超过该大小时压缩为新快照
+
+# JSON 存储的快照格式："json"（jobs.json）或 "binary"（jobs.bin，列式 + 字符串表，mmap 二分查找；
+# 首次使用时自动从 jobs.json 转换；始终使用追加日志模式，运行期间不加载全部记录）
+STORAGE_SNAPSHOT_FORMAT = os.getenv("STORAGE_SNAPSHOT_FORMAT", "json").lower()
+
+# 布隆过滤器预判（storage/jobs.bloom，mmap 映射）：启动时不加载全部记录，
+# 新职位无需读取历史即可判定；过滤器命中时在 jobs.idx（jobs.json 的二进制索引）上精确校验。
+# 始终使用追加日志模式，运行期间不加载全部记录
+STORAGE_BLOOM = os.getenv("STORAGE_BLOOM", "false").lower() == "true"
+STORAGE_BLOOM_ERROR_RATE = 0.01  # 目标假阳性率
+STORAGE_BLOOM_MIN_CAPACITY = 100000  # 过滤器最小设计容量
+
+# 已知职位记录的保留天数（过期后从存储中清理）
+RETENTION_DAYS = 90
+# 按数据源单独设置保留天数，如 {"a16z crypto Portfolio": 180}
+SOURCE_RETENTION_DAYS: dict[str, int] = {}
+
 # ============== 请求配置 ==============
 REQUEST_TIMEOUT = 30  # 秒
-REQUEST_DELAY = 1.5  # 请求间隔（秒），避免被封
+REQUEST_DELAY = 1.5  # 请求间隔（秒），避免被封；即每个主机令牌桶的补充速率
 MAX_RETRIES = 3  # 最大重试次数
 
+# 重试与限流配置
+RETRY_BACKOFF_BASE = 1.0  # 指数退避基数（秒）
+RETRY_BACKOFF_MAX = 30.0  # 单次等待上限（秒），Retry-After 超过该值时放弃重试
+RATE_LIMIT_BURST = 10  # 每个主机令牌桶容量（允许的突发请求数）
+# 指定主机的请求速率（次/秒），未列出的主机为 1 / REQUEST_DELAY
+# 公共 ATS API 主机被几十个 board（以及新职位的详情请求）共用，按平台实际限额设置，
+# 否则所有 board 会在同一个令牌桶前逐个排队，抵消并发爬取的效果
+HOST_RATE_LIMITS = {
+    "api.getro.com": 5.0,  # 所有 Getro board 共用同一 API 主机
+    "boards-api.greenhouse.io": 10.0,  # Greenhouse Job Board API（公开、带 CDN 缓存）
+    "api.lever.co": 10.0,  # Lever Postings API 限额约 10 次/秒
+    "jobs.ashbyhq.com": 5.0,  # Ashby 公开职位板 GraphQL 接口
+    "apply.workable.com": 2.0,  # Workable 公开接口限额较严
+}
+
+# VC Portfolio Board 分页配置
+PORTFOLIO_PAGE_SIZE = 100  # 每页职位数
+PORTFOLIO_MAX_PAGES = 50  # 每个 board 最多获取的页数
+PORTFOLIO_PAGE_CONCURRENCY = 4  # 单个 board 同时获取的页数（支持随机分页的平台）
+
+# 熔断配置：连续失败的 board（如已失效的 slug）在冷却期内直接跳过
+CIRCUIT_BREAKER_THRESHOLD = 3  # 连续失败次数阈值
+CIRCUIT_BREAKER_COOLDOWN = 12 * 3600  # 冷却时间（秒）
+
+# 并发爬取配置
+MAX_CONCURRENT_SCRAPERS = 16  # 全局最大并发爬虫数
+MAX_CONCURRENT_PER_HOST = 4  # 每个 ATS 主机的最大并发数
+
+# HTTP 连接池配置（同一 ATS 主机复用 TCP/TLS 连接）
+HTTP_POOL_CONNECTIONS = 16  # 缓存的主机连接池数量
+HTTP_POOL_MAXSIZE = MAX_CONCURRENT_PER_HOST  # 每个主机的连接池大小
+HTTP_KEEPALIVE_TIMEOUT = 30  # 空闲连接保持时间（秒）
+# 指定主机的连接池大小，如 {"boards-api.greenhouse.io": 8}
+HTTP_HOST_POOL_SIZES: dict[str, int] = {}
+
+# HTTP 校验缓存（ETag / Last-Modified / 响应体哈希，未变化时跳过解析）
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+
+# 职位详情缓存（只为通过过滤的新职位按需请求详情）
+DETAIL_CACHE_DAYS = 30  # 详情缓存保留天数
+
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -221,8 +305,31 @@ HEADERS = {
 # 每批发送的最大消息数（避免触发 Telegram 限制）
 MAX_MESSAGES_PER_BATCH = 20
 
-# 消息发送间隔（秒）
-MESSAGE_DELAY = 0.5
+# 单条消息的最大长度（Telegram 限制）
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# 渲染缓存：按 unique_id 缓存已渲染的消息，重试和摘要无需重复渲染
+RENDER_CACHE_SIZE = 5000
+
+# 摘要模式：新职位按公司或数据源分组，合并为少量消息发送
+DIGEST_MODE = os.getenv("DIGEST_MODE", "false").lower() == "true"
+DIGEST_GROUP_BY = os.getenv("DIGEST_GROUP_BY", "company").lower()  # "company" 或 "source"
+
+# 发送限流（令牌桶）：Telegram 建议单个聊天不超过约 1 条/秒，整个 Bot 不超过约 30 条/秒
+TELEGRAM_CHAT_RATE = 1.0  # 每个聊天每秒消息数
+TELEGRAM_CHAT_BURST = 3  # 每个聊天允许的突发消息数
+TELEGRAM_GLOBAL_RATE = 30.0  # 全局每秒消息数
+
+# 收到 429 时按 retry_after 暂停后重新发送
+TELEGRAM_MAX_RETRIES = 5  # 同一条消息最多重新发送次数
+TELEGRAM_RETRY_AFTER_MAX = 60  # retry_after 超过该值（秒）时放弃发送
+TELEGRAM_TIMEOUT = 10  # 单次请求超时（秒），失败的通知留在发件箱下次重发
+
+# 通知发件箱：未确认送达的通知保留到下次运行重发，超过该天数后丢弃
+OUTBOX_MAX_AGE_DAYS = 7
+
+# Telegram API 连接池大小（所有消息复用同一个 keep-alive 会话）
+TELEGRAM_POOL_SIZE = 4
 
 # ============== 日志配置 ==============
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -1,18 +1,28 @@
 """
 职位 Dashboard 生成器
 
-生成一个 HTML 页面，展示所有过滤后的职位
+生成一个 HTML 页面，展示所有过滤后的职位：
+- 职位数据以紧凑 JSON 内嵌在页面中（来源和公司名各存一份，职位中只存下标）
+- 页面只渲染视口附近的卡片（虚拟列表），筛选使用预先计算的小写搜索键，输入防抖
 """
 import json
 import os
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from scrapers.base import Job
 from filters.job_filter import JobFilter
 import config
 
 
+# 写入缓冲区大小（字节）
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# 内嵌职位数据的编码器（复用，避免每个职位重新创建）
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
 def generate_dashboard(
     jobs: list[Job],
     output_path: str = "dashboard.html",
@@ -21,6 +31,9 @@ def generate_dashboard(
     """
     生成 HTML Dashboard
     
+    页面按头部、职位数据、脚本逐块流式写入临时文件，完成后原子替换，
+    内存占用不随职位数量增长；生成失败时保留原有文件。
+    
     Args:
         jobs: 职位列表
         output_path: 输出文件路径
@@ -29,25 +42,53 @@ def generate_dashboard(
     Returns:
         输出文件路径
     """
+    temp_path = f"{output_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(iter_dashboard(jobs, title))
+        os.replace(temp_path, output_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
     
-    # 按来源分组
-    jobs_by_source = {}
-    for job in jobs:
-        source = job.source
-        if source not in jobs_by_source:
-            jobs_by_source[source] = []
-        jobs_by_source[source].append(job)
+    return output_path
+
+
+def iter_dashboard(jobs: list[Job], title: str = "Crypto Job Dashboard") -> Iterator[str]:
+    """
+    逐块生成 Dashboard HTML
+    
+    Args:
+        jobs: 职位列表
+        title: 页面标题
     
-    # 按公司分组
-    jobs_by_company = {}
+    Yields:
+        页面片段（头部、内嵌职位数据、页面脚本）
+    """
+    # 统计只保留计数，不按来源 / 公司复制职位列表
+    source_counts = Counter()
+    company_counts = Counter()
+    remote_count = 0
     for job in jobs:
-        company = job.company
-        if company not in jobs_by_company:
-            jobs_by_company[company] = []
-        jobs_by_company[company].append(job)
+        source_counts[job.source] += 1
+        company_counts[job.company] += 1
+        remote_count += job.remote
     
-    # 生成 HTML
-    html = f"""<!DOCTYPE html>
+    yield generate_header(title, len(jobs), source_counts, company_counts, remote_count)
+    yield from iter_job_data(jobs, source_counts, company_counts)
+    yield DASHBOARD_SCRIPT
+
+
+def generate_header(
+    title: str,
+    job_count: int,
+    source_counts: dict[str, int],
+    company_counts: dict[str, int],
+    remote_count: int
+) -> str:
+    """生成页面头部（样式、统计、筛选栏、职位列表容器和页脚）"""
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -173,6 +214,10 @@ def generate_dashboard(
             cursor: pointer;
         }}
         
+        .jobs-viewport {{
+            position: relative;
+        }}
+        
         .jobs-grid {{
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
@@ -180,6 +225,10 @@ def generate_dashboard(
         }}
         
         .job-card {{
+            display: flex;
+            flex-direction: column;
+            height: 17rem;
+            overflow: hidden;
             background: var(--bg-card);
             border: 1px solid var(--border);
             border-radius: 12px;
@@ -193,6 +242,10 @@ def generate_dashboard(
         }}
         
         .job-title {{
+            display: -webkit-box;
+            -webkit-line-clamp: 2;
+            -webkit-box-orient: vertical;
+            overflow: hidden;
             font-size: 1.1rem;
             font-weight: 600;
             margin-bottom: 0.5rem;
@@ -203,12 +256,17 @@ def generate_dashboard(
             font-size: 1rem;
             color: var(--accent);
             margin-bottom: 0.75rem;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
         }}
         
         .job-meta {{
             display: flex;
             flex-wrap: wrap;
             gap: 0.5rem;
+            max-height: 4.5rem;
+            overflow: hidden;
             margin-bottom: 1rem;
         }}
         
@@ -231,6 +289,8 @@ def generate_dashboard(
         }}
         
         .job-link {{
+            align-self: flex-start;
+            margin-top: auto;
             display: inline-flex;
             align-items: center;
             gap: 0.5rem;
@@ -292,19 +352,19 @@ def generate_dashboard(
             
             <div class="stats">
                 <div class="stat">
-                    <div class="stat-value">{len(jobs)}</div>
+                    <div class="stat-value">{job_count}</div>
                     <div class="stat-label">Total Jobs</div>
                 </div>
                 <div class="stat">
-                    <div class="stat-value">{len(jobs_by_company)}</div>
+                    <div class="stat-value">{len(company_counts)}</div>
                     <div class="stat-label">Companies</div>
                 </div>
                 <div class="stat">
-                    <div class="stat-value">{len(jobs_by_source)}</div>
+                    <div class="stat-value">{len(source_counts)}</div>
                     <div class="stat-label">Sources</div>
                 </div>
                 <div class="stat">
-                    <div class="stat-value">{sum(1 for j in jobs if j.remote)}</div>
+                    <div class="stat-value">{remote_count}</div>
                     <div class="stat-label">Remote Jobs</div>
                 </div>
             </div>
@@ -312,15 +372,15 @@ def generate_dashboard(
         
         <div class="filters">
             <div class="search-box">
-                <input type="text" id="searchInput" placeholder="🔍 Search jobs, companies..." onkeyup="filterJobs()">
+                <input type="text" id="searchInput" placeholder="🔍 Search jobs, companies..." oninput="scheduleFilter()">
             </div>
             <select class="filter-select" id="sourceFilter" onchange="filterJobs()">
                 <option value="">All Sources</option>
-                {generate_source_options(jobs_by_source)}
+                {generate_source_options(source_counts)}
             </select>
             <select class="filter-select" id="companyFilter" onchange="filterJobs()">
                 <option value="">All Companies</option>
-                {generate_company_options(jobs_by_company)}
+                {generate_company_options(company_counts)}
             </select>
             <select class="filter-select" id="remoteFilter" onchange="filterJobs()">
                 <option value="">All Locations</option>
@@ -329,8 +389,8 @@ def generate_dashboard(
             </select>
         </div>
         
-        <div class="jobs-grid" id="jobsGrid">
-            {generate_job_cards(jobs)}
+        <div class="jobs-viewport" id="jobsViewport">
+            <div class="jobs-grid" id="jobsGrid"></div>
         </div>
         
         <div class="no-results" id="noResults" style="display: none;">
@@ -344,122 +404,205 @@ def generate_dashboard(
         </footer>
     </div>
     
-    <script>
-        function filterJobs() {{
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const sourceFilter = document.getElementById('sourceFilter').value;
-            const companyFilter = document.getElementById('companyFilter').value;
-            const remoteFilter = document.getElementById('remoteFilter').value;
-            
-            const cards = document.querySelectorAll('.job-card');
-            let visibleCount = 0;
-            
-            cards.forEach(card => {{
-                const title = card.dataset.title.toLowerCase();
-                const company = card.dataset.company;
-                const source = card.dataset.source;
-                const isRemote = card.dataset.remote === 'true';
-                
-                let show = true;
-                
-                // Search filter
-                if (searchTerm && !title.includes(searchTerm) && !company.toLowerCase().includes(searchTerm)) {{
-                    show = false;
-                }}
-                
-                // Source filter
-                if (sourceFilter && source !== sourceFilter) {{
-                    show = false;
-                }}
-                
-                // Company filter
-                if (companyFilter && company !== companyFilter) {{
-                    show = false;
-                }}
-                
-                // Remote filter
-                if (remoteFilter === 'remote' && !isRemote) {{
-                    show = false;
-                }}
-                if (remoteFilter === 'onsite' && isRemote) {{
-                    show = false;
-                }}
-                
-                card.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
-            
-            document.getElementById('noResults').style.display = visibleCount === 0 ? 'block' : 'none';
-        }}
-    </script>
-</body>
-</html>"""
-    
-    # 写入文件
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    
-    return output_path
+"""
 
 
-def generate_source_options(jobs_by_source: dict) -> str:
-    """生成来源下拉选项"""
+def generate_source_options(source_counts: dict[str, int]) -> str:
+    """生成来源下拉选项（选项值为来源表下标，按名称排序）"""
     options = []
-    for source in sorted(jobs_by_source.keys()):
-        count = len(jobs_by_source[source])
-        options.append(f'<option value="{source}">{source} ({count})</option>')
+    for index, (source, count) in sorted(enumerate(source_counts.items()), key=lambda x: x[1][0]):
+        options.append(f'<option value="{index}">{escape_html(source)} ({count})</option>')
     return "\n                ".join(options)
 
 
-def generate_company_options(jobs_by_company: dict) -> str:
-    """生成公司下拉选项"""
+def generate_company_options(company_counts: dict[str, int]) -> str:
+    """生成公司下拉选项（选项值为公司表下标）"""
     options = []
     # 按职位数量排序
-    sorted_companies = sorted(jobs_by_company.items(), key=lambda x: -len(x[1]))
-    for company, jobs in sorted_companies[:50]:  # 只显示前50个公司
-        count = len(jobs)
-        options.append(f'<option value="{company}">{company} ({count})</option>')
+    sorted_companies = sorted(enumerate(company_counts.items()), key=lambda x: -x[1][1])
+    for index, (company, count) in sorted_companies[:50]:  # 只显示前50个公司
+        options.append(f'<option value="{index}">{escape_html(company)} ({count})</option>')
     return "\n                ".join(options)
 
 
-def generate_job_cards(jobs: list[Job]) -> str:
-    """生成职位卡片 HTML"""
-    cards = []
+def iter_job_data(
+    jobs: list[Job],
+    source_counts: dict[str, int],
+    company_counts: dict[str, int]
+) -> Iterator[str]:
+    """
+    逐块生成页面内嵌的职位数据（JSON）
+    
+    格式为 {"sources": [...], "companies": [...], "jobs": [...]}：来源和公司名各存一份，
+    每个职位为 [标题, 公司下标, 来源下标, 链接, 地点, 类型, 是否远程(0/1), 部门]。
+    
+    Args:
+        jobs: 职位列表
+        source_counts: 来源计数（键顺序即来源表顺序）
+        company_counts: 公司计数（键顺序即公司表顺序）
+    
+    Yields:
+        JSON 片段
+    """
+    source_ids = {source: index for index, source in enumerate(source_counts)}
+    company_ids = {company: index for index, company in enumerate(company_counts)}
+    
+    yield '    <script type="application/json" id="jobsData">{"sources":'
+    yield dump_json(list(source_counts))
+    yield ',"companies":'
+    yield dump_json(list(company_counts))
+    yield ',"jobs":['
     
+    separator = ""
     for job in jobs:
-        location_tag = ""
-        if job.location:
-            location_tag = f'<span class="job-tag">📍 {escape_html(job.location)}</span>'
-        
-        remote_tag = ""
-        if job.remote:
-            remote_tag = '<span class="job-tag remote">🌍 Remote</span>'
-        
-        job_type_tag = ""
-        if job.job_type:
-            job_type_tag = f'<span class="job-tag">⏰ {escape_html(job.job_type)}</span>'
-        
-        card = f"""
-            <div class="job-card" 
-                 data-title="{escape_html(job.title)}"
-                 data-company="{escape_html(job.company)}"
-                 data-source="{escape_html(job.source)}"
-                 data-remote="{str(job.remote).lower()}">
-                <h3 class="job-title">{escape_html(job.title)}</h3>
-                <p class="job-company">{escape_html(job.company)}</p>
-                <div class="job-meta">
-                    <span class="job-tag source">{escape_html(job.source)}</span>
-                    {location_tag}
-                    {remote_tag}
-                    {job_type_tag}
-                </div>
-                <a href="{job.url}" target="_blank" class="job-link">
-                    Apply Now →
-                </a>
-            </div>"""
-        cards.append(card)
+        yield separator
+        yield dump_json([
+            job.title,
+            company_ids[job.company],
+            source_ids[job.source],
+            job.url,
+            job.location,
+            job.job_type,
+            int(job.remote),
+            job.description,
+        ])
+        separator = ","
     
-    return "\n".join(cards)
+    yield "]}</script>\n"
+
+
+def dump_json(value) -> str:
+    """序列化为可内嵌在 <script> 中的紧凑 JSON（转义 <，避免提前结束标签）"""
+    return _JSON_ENCODER.encode(value).replace("<", "\\u003c")
+
+
+DASHBOARD_SCRIPT = """    <script>
+        const DEBOUNCE_MS = 150;
+        const OVERSCAN_ROWS = 3;
+        const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'};
+        
+        const data = JSON.parse(document.getElementById('jobsData').textContent);
+        const sources = data.sources;
+        const companies = data.companies;
+        const jobs = data.jobs;
+        
+        // 预先计算小写搜索键，筛选时不再逐个转换
+        const titleKeys = jobs.map(job => job[0].toLowerCase());
+        const companyKeys = companies.map(company => company.toLowerCase());
+        
+        const viewport = document.getElementById('jobsViewport');
+        const grid = document.getElementById('jobsGrid');
+        
+        let visible = [];
+        let columns = 1;
+        let rowHeight = 0;
+        let renderedRange = '';
+        let renderScheduled = false;
+        let filterTimer = null;
+        let resizeTimer = null;
+        
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+        
+        function renderCard(index) {
+            const [title, company, source, url, location, jobType, remote, department] = jobs[index];
+            let tags = `<span class="job-tag source">${escapeHtml(sources[source])}</span>`;
+            if (department) tags += `<span class="job-tag">🏷 ${escapeHtml(department)}</span>`;
+            if (location) tags += `<span class="job-tag">📍 ${escapeHtml(location)}</span>`;
+            if (remote) tags += '<span class="job-tag remote">🌍 Remote</span>';
+            if (jobType) tags += `<span class="job-tag">⏰ ${escapeHtml(jobType)}</span>`;
+            
+            return `<div class="job-card">
+                <h3 class="job-title" title="${escapeHtml(title)}">${escapeHtml(title)}</h3>
+                <p class="job-company">${escapeHtml(companies[company])}</p>
+                <div class="job-meta">${tags}</div>
+                <a href="${escapeHtml(url)}" target="_blank" class="job-link">Apply Now →</a>
+            </div>`;
+        }
+        
+        // 只渲染视口附近的行（卡片高度固定，按行高计算可见范围）
+        function renderVisible() {
+            renderScheduled = false;
+            if (!rowHeight) return;
+            
+            const offset = -viewport.getBoundingClientRect().top;
+            const firstRow = Math.max(0, Math.floor(offset / rowHeight) - OVERSCAN_ROWS);
+            const lastRow = Math.ceil((offset + window.innerHeight) / rowHeight) + OVERSCAN_ROWS;
+            const start = firstRow * columns;
+            const end = Math.min(visible.length, lastRow * columns);
+            const range = `${start}:${end}`;
+            if (range === renderedRange) return;
+            renderedRange = range;
+            
+            let html = '';
+            for (let i = start; i < end; i++) html += renderCard(visible[i]);
+            grid.innerHTML = html;
+            grid.style.transform = `translateY(${firstRow * rowHeight}px)`;
+        }
+        
+        function scheduleRender() {
+            if (renderScheduled) return;
+            renderScheduled = true;
+            requestAnimationFrame(renderVisible);
+        }
+        
+        // 渲染一张卡片测量列数和行高，再按结果数量设置容器高度
+        function layout() {
+            grid.style.transform = '';
+            grid.innerHTML = visible.length ? renderCard(visible[0]) : '';
+            
+            const style = getComputedStyle(grid);
+            const gap = parseFloat(style.rowGap) || 0;
+            columns = Math.max(1, style.gridTemplateColumns.split(' ').length);
+            rowHeight = grid.firstElementChild ? grid.firstElementChild.offsetHeight + gap : 0;
+            
+            const rows = Math.ceil(visible.length / columns);
+            viewport.style.height = rows ? `${rows * rowHeight - gap}px` : '0';
+            renderedRange = '';
+            renderVisible();
+        }
+        
+        function filterJobs() {
+            clearTimeout(filterTimer);
+            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+            const sourceFilter = document.getElementById('sourceFilter').value;
+            const companyFilter = document.getElementById('companyFilter').value;
+            const remoteFilter = document.getElementById('remoteFilter').value;
+            const sourceIndex = sourceFilter === '' ? -1 : Number(sourceFilter);
+            const companyIndex = companyFilter === '' ? -1 : Number(companyFilter);
+            
+            const matches = [];
+            for (let i = 0; i < jobs.length; i++) {
+                const job = jobs[i];
+                if (sourceIndex >= 0 && job[2] !== sourceIndex) continue;
+                if (companyIndex >= 0 && job[1] !== companyIndex) continue;
+                if (remoteFilter === 'remote' && !job[6]) continue;
+                if (remoteFilter === 'onsite' && job[6]) continue;
+                if (searchTerm && !titleKeys[i].includes(searchTerm) && !companyKeys[job[1]].includes(searchTerm)) continue;
+                matches.push(i);
+            }
+            
+            visible = matches;
+            document.getElementById('noResults').style.display = visible.length === 0 ? 'block' : 'none';
+            layout();
+        }
+        
+        function scheduleFilter() {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(filterJobs, DEBOUNCE_MS);
+        }
+        
+        window.addEventListener('scroll', scheduleRender, { passive: true });
+        window.addEventListener('resize', () => {
+            clearTimeout(resizeTimer);
+            resizeTimer = setTimeout(layout, DEBOUNCE_MS);
+        });
+        
+        filterJobs();
+    </script>
+</body>
+</html>"""
 
 
 def escape_html(text: str) -> str:
@@ -2,9 +2,13 @@
 过滤器模块
 """
 from .job_filter import JobFilter, filter_jobs, default_filter
+from .matcher import KeywordMatcher
+from .decision_cache import DecisionCache
 
 __all__ = [
     "JobFilter",
     "filter_jobs",
     "default_filter",
+    "KeywordMatcher",
+    "DecisionCache",
 ]
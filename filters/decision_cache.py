@@ -0,0 +1,152 @@
+"""
+过滤结果缓存
+
+每小时运行时，绝大多数职位标题与上次相同。按规范化标题记住包含/排除判定：
+- LRU 淘汰，最多保留 FILTER_CACHE_SIZE 个标题
+- 持久化到磁盘，跨运行复用
+- 记录关键词指纹，INCLUDE_KEYWORDS / EXCLUDE_KEYWORDS 变化时整体失效
+"""
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def keyword_fingerprint(include_keywords: list[str], exclude_keywords: list[str]) -> str:
+    """
+    计算关键词配置指纹
+
+    Args:
+        include_keywords: 包含关键词列表
+        exclude_keywords: 排除关键词列表
+
+    Returns:
+        十六进制指纹
+    """
+    payload = json.dumps(
+        {"include": include_keywords, "exclude": exclude_keywords},
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def normalize_title(title: str) -> str:
+    """规范化标题（匹配不区分大小写，首尾空白不影响单词边界）"""
+    return title.strip().lower()
+
+
+class DecisionCache:
+    """过滤判定 LRU 缓存（首次查询时才从磁盘加载）"""
+
+    def __init__(
+        self,
+        fingerprint: str,
+        cache_file: Optional[Path] = None,
+        max_size: Optional[int] = None
+    ):
+        """
+        初始化缓存
+
+        Args:
+            fingerprint: 关键词配置指纹（与文件中的不一致时丢弃旧判定）
+            cache_file: 缓存文件路径（默认使用配置）
+            max_size: 最多缓存的标题数（默认使用配置）
+        """
+        self.fingerprint = fingerprint
+        self.cache_file = cache_file or config.FILTER_CACHE_FILE
+        self.max_size = max_size or config.FILTER_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._decisions: OrderedDict[str, bool] = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+
+    def _load(self):
+        """从文件加载缓存"""
+        self._loaded = True
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load filter cache: {e}")
+            return
+
+        if data.get("fingerprint") != self.fingerprint:
+            logger.info("Filter keywords changed, discarding cached decisions")
+            self._dirty = True
+            return
+
+        self._decisions = OrderedDict(data.get("decisions", {}))
+        logger.debug(f"Loaded {len(self._decisions)} cached filter decisions")
+
+    def get(self, title: str) -> Optional[bool]:
+        """
+        获取缓存的判定
+
+        Args:
+            title: 职位标题
+
+        Returns:
+            True/False；未命中时返回 None
+        """
+        if not self._loaded:
+            self._load()
+
+        key = normalize_title(title)
+        decision = self._decisions.get(key)
+        if decision is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._decisions.move_to_end(key)
+        return decision
+
+    def put(self, title: str, decision: bool):
+        """
+        保存判定（超出容量时淘汰最久未使用的标题）
+
+        Args:
+            title: 职位标题
+            decision: 是否包含
+        """
+        if not self._loaded:
+            self._load()
+
+        self._decisions[normalize_title(title)] = decision
+        self._dirty = True
+        if len(self._decisions) > self.max_size:
+            self._decisions.popitem(last=False)
+
+    def get_hit_rate(self) -> float:
+        """获取本次运行的命中率（0-1，无查询时为 0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def save(self):
+        """保存到文件（无新判定时跳过；按 LRU 顺序写入）"""
+        if not self._dirty:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"fingerprint": self.fingerprint, "decisions": self._decisions},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            self._dirty = False
+            logger.debug(f"Saved {len(self._decisions)} filter decisions")
+        except IOError as e:
+            logger.error(f"Failed to save filter cache: {e}")
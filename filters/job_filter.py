@@ -3,11 +3,12 @@
 
 根据配置的关键词过滤职位，只保留目标类型的岗位。
 """
-import re
 import logging
 from typing import Optional
 
 from scrapers.base import Job
+from .decision_cache import DecisionCache, keyword_fingerprint
+from .matcher import KeywordMatcher
 import config
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,8 @@ class JobFilter:
     def __init__(
         self,
         include_keywords: Optional[list[str]] = None,
-        exclude_keywords: Optional[list[str]] = None
+        exclude_keywords: Optional[list[str]] = None,
+        use_cache: bool = False
     ):
         """
         初始化过滤器
@@ -27,44 +29,55 @@ class JobFilter:
         Args:
             include_keywords: 包含关键词列表（默认使用配置）
             exclude_keywords: 排除关键词列表（默认使用配置）
+            use_cache: 是否使用持久化的判定缓存
         """
         self.include_keywords = include_keywords or config.INCLUDE_KEYWORDS
         self.exclude_keywords = exclude_keywords or config.EXCLUDE_KEYWORDS
         
-        # 预编译正则表达式以提高性能
-        self._include_patterns = self._compile_patterns(self.include_keywords)
-        self._exclude_patterns = self._compile_patterns(self.exclude_keywords)
-    
-    def _compile_patterns(self, keywords: list[str]) -> list[re.Pattern]:
-        """将关键词编译为正则表达式"""
-        patterns = []
-        for keyword in keywords:
-            # 转义特殊字符，并添加单词边界
-            escaped = re.escape(keyword.strip())
-            # 使用 \b 确保是完整单词匹配（对于短词如 "bd"）
-            pattern = re.compile(rf'\b{escaped}\b', re.IGNORECASE)
-            patterns.append(pattern)
-        return patterns
+        # 预编译为单个组合正则，一次扫描同时检查排除和包含关键词
+        self._matcher = KeywordMatcher({
+            "exclude": self.exclude_keywords,
+            "include": self.include_keywords,
+        })
+        
+        self.decision_cache: Optional[DecisionCache] = None
+        if use_cache:
+            self.decision_cache = DecisionCache(
+                keyword_fingerprint(self.include_keywords, self.exclude_keywords)
+            )
     
     def should_include(self, job: Job) -> bool:
         """
         判断职位是否应该被包含
         
+        任一排除关键词命中即排除（优先于包含关键词），否则需命中至少一个包含关键词。
+        启用缓存时，相同标题直接复用上次的判定。
+        
         Args:
             job: Job 对象
         
         Returns:
             True 如果职位应该被保留
         """
-        title = job.title.lower()
+        if self.decision_cache is None:
+            return self._evaluate(job)
         
-        # 首先检查是否应该排除
-        if self._matches_any_pattern(title, self._exclude_patterns):
-            logger.debug(f"Excluded (matched exclude keyword): {job.title}")
-            return False
+        decision = self.decision_cache.get(job.title)
+        if decision is None:
+            decision = self._evaluate(job)
+            self.decision_cache.put(job.title, decision)
+        return decision
+    
+    def _evaluate(self, job: Job) -> bool:
+        """匹配关键词得出判定（单次扫描）"""
+        included = False
+        for group in self._matcher.scan(job.title):
+            if group == "exclude":
+                logger.debug(f"Excluded (matched exclude keyword): {job.title}")
+                return False
+            included = True
         
-        # 然后检查是否应该包含
-        if self._matches_any_pattern(title, self._include_patterns):
+        if included:
             logger.debug(f"Included (matched include keyword): {job.title}")
             return True
         
@@ -72,17 +85,6 @@ class JobFilter:
         logger.debug(f"Excluded (no match): {job.title}")
         return False
     
-    def _matches_any_pattern(
-        self,
-        text: str,
-        patterns: list[re.Pattern]
-    ) -> bool:
-        """检查文本是否匹配任一模式"""
-        for pattern in patterns:
-            if pattern.search(text):
-                return True
-        return False
-    
     def filter_jobs(self, jobs: list[Job]) -> list[Job]:
         """
         过滤职位列表
@@ -101,10 +103,27 @@ class JobFilter:
         )
         
         return filtered
+    
+    def save_cache(self):
+        """保存判定缓存（未启用缓存时跳过）"""
+        if self.decision_cache is not None:
+            self.decision_cache.save()
+    
+    def get_cache_stats(self) -> tuple[int, int]:
+        """
+        获取判定缓存命中统计
+        
+        Returns:
+            (命中次数, 查询次数)
+        """
+        if self.decision_cache is None:
+            return 0, 0
+        cache = self.decision_cache
+        return cache.hits, cache.hits + cache.misses
 
 
 # 默认过滤器实例
-default_filter = JobFilter()
+default_filter = JobFilter(use_cache=config.FILTER_CACHE_ENABLED)
 
 
 def filter_jobs(jobs: list[Job]) -> list[Job]:
@@ -0,0 +1,79 @@
+"""
+关键词匹配器
+
+把多组关键词编译成一个正则，一次扫描找出文本中所有组的命中：
+
+    \b(?=(?:(?P<g0>kw|...)|(?P<g1>kw|...))\b)
+
+- 整个模式包在零宽前瞻里，每个位置都会尝试匹配，
+  一个长关键词（如 "business development"）不会吞掉其中的短关键词（"development"）
+- 同一位置上排在前面的组优先，组内较长的关键词优先
+"""
+import re
+from typing import Iterator
+
+
+class KeywordMatcher:
+    """多组关键词单次扫描匹配器"""
+
+    def __init__(self, groups: dict[str, list[str]], word_boundary: bool = True):
+        """
+        初始化匹配器
+
+        Args:
+            groups: {组名: 关键词列表}，顺序即同一位置上的优先级
+            word_boundary: 是否要求完整单词匹配（False 时为子串匹配）
+        """
+        self.group_names = list(groups)
+        self.word_boundary = word_boundary
+        self._pattern = self._compile(groups)
+
+    def _compile(self, groups: dict[str, list[str]]) -> re.Pattern:
+        """编译组合正则（命名组用 g0, g1 ...，组名可以是任意字符串）"""
+        alternatives = []
+        for index, keywords in enumerate(groups.values()):
+            # 去掉首尾空格（如 " bd "），由单词边界保证完整匹配
+            stripped = {keyword.strip() for keyword in keywords} - {""}
+            if not stripped:
+                continue
+            escaped = "|".join(
+                re.escape(keyword)
+                for keyword in sorted(stripped, key=lambda k: (-len(k), k))
+            )
+            alternatives.append(f"(?P<g{index}>{escaped})")
+
+        if not alternatives:
+            # 没有关键词时永不匹配
+            return re.compile(r"(?!)")
+
+        boundary = r"\b" if self.word_boundary else ""
+        return re.compile(
+            rf"{boundary}(?=(?:{'|'.join(alternatives)}){boundary})",
+            re.IGNORECASE,
+        )
+
+    def scan(self, text: str) -> Iterator[str]:
+        """
+        按位置顺序产出每个命中的组名
+
+        Args:
+            text: 待匹配文本（无需预先转小写）
+
+        Yields:
+            组名（同一组可能多次产出）
+        """
+        names = self.group_names
+        for match in self._pattern.finditer(text):
+            yield names[int(match.lastgroup[1:])]
+
+    def find_groups(self, text: str) -> set[str]:
+        """
+        获取文本命中的所有组
+
+        Args:
+            text: 待匹配文本
+
+        Returns:
+            组名集合
+        """
+        return set(self.scan(text))
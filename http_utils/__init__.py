@@ -0,0 +1,11 @@
+"""
+HTTP 公共工具（scrapers 和 notifier 共用，不依赖任何一方）
+"""
+from .retry import RETRYABLE_STATUSES, RetryPolicy, TokenBucket, parse_retry_after
+
+__all__ = [
+    "RETRYABLE_STATUSES",
+    "RetryPolicy",
+    "TokenBucket",
+    "parse_retry_after",
+]
@@ -0,0 +1,153 @@
+"""
+HTTP 重试与限流（爬虫和通知共用）
+
+- RetryPolicy: 指数退避 + 抖动，支持 Retry-After
+- TokenBucket: 令牌桶限流，同步/异步通用
+- parse_retry_after: 解析 Retry-After 响应头
+"""
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import config
+
+# 可重试的 HTTP 状态码
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Retry-After 响应头
+
+    Args:
+        value: 秒数或 HTTP 日期
+
+    Returns:
+        需要等待的秒数；无法解析时返回 None
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """重试策略（指数退避 + 全抖动）"""
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None
+    ):
+        """
+        初始化重试策略
+
+        Args:
+            max_retries: 最大重试次数（默认使用配置）
+            backoff_base: 退避基数（秒，默认使用配置）
+            backoff_max: 单次等待上限（秒，默认使用配置）
+        """
+        self.max_retries = config.MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = backoff_base or config.RETRY_BACKOFF_BASE
+        self.backoff_max = backoff_max or config.RETRY_BACKOFF_MAX
+
+    def should_retry(self, attempt: int, status: Optional[int] = None) -> bool:
+        """
+        判断是否还应重试
+
+        Args:
+            attempt: 已完成的尝试次数（从 1 开始）
+            status: HTTP 状态码（None 表示网络异常或超时）
+
+        Returns:
+            True 如果应该重试
+        """
+        if attempt > self.max_retries:
+            return False
+        return status is None or status in RETRYABLE_STATUSES
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        计算下次重试前的等待时间
+
+        Args:
+            attempt: 已完成的尝试次数（从 1 开始）
+            retry_after: 服务端要求的等待时间（秒）
+
+        Returns:
+            等待秒数；服务端要求的等待超过上限时返回 None（放弃重试）
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.backoff_max else None
+
+        # 全抖动：在 [0, base * 2^(attempt-1)] 内随机，避免多个请求同时重试
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class TokenBucket:
+    """令牌桶限流器（线程安全，同步/异步通用）"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发请求数）
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """预留一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float):
+        """
+        暂停发放令牌（如收到 429 + Retry-After）
+
+        Args:
+            seconds: 暂停秒数
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self):
+        """获取一个令牌（同步，必要时阻塞等待）"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """获取一个令牌（异步，必要时等待）"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -9,13 +9,24 @@ import sys
 import logging
 import asyncio
 from datetime import datetime
+from typing import Optional
 
 import config
-from scrapers import create_getro_scrapers, Job
-from filters import filter_jobs
-from storage import StorageManager
-from notifier import TelegramNotifier
+from scrapers import (
+    create_all_scrapers,
+    stream_jobs_async,
+    close_client_session,
+    enrich_jobs_async,
+    apply_cached_details,
+    get_default_cache,
+    get_default_detail_cache,
+    get_default_circuit_breaker,
+    Job,
+)
+from storage import Outbox, create_storage
+from notifier import NotificationRouter, TelegramNotifier, iter_queue
 from dashboard import generate_dashboard
+from pipeline import JobPipeline
 
 
 def setup_logging():
@@ -27,52 +38,42 @@ def setup_logging():
     )
 
 
-def collect_all_jobs() -> tuple[list[Job], list[str]]:
+def report_cache_stats() -> tuple[int, int]:
     """
-    从所有数据源收集职位
+    保存 HTTP 缓存 / 详情缓存，并输出各数据源的命中统计
     
     Returns:
-        (职位列表, 数据源名称列表)
+        (命中次数, 请求次数)
     """
-    all_jobs = []
-    sources = []
+    get_default_detail_cache().save()
     
-    # 创建所有 Getro 爬虫
-    getro_scrapers = create_getro_scrapers()
+    cache = get_default_cache()
+    if not cache:
+        return 0, 0
     
-    for scraper in getro_scrapers:
-        jobs = scraper.scrape()
-        if jobs:
-            all_jobs.extend(jobs)
-            sources.append(scraper.source_name)
+    cache.save()
     
-    return all_jobs, sources
-
-
-def deduplicate_jobs(jobs: list[Job]) -> list[Job]:
-    """
-    去重职位列表
-    
-    Args:
-        jobs: 原始职位列表
-    
-    Returns:
-        去重后的职位列表
-    """
-    seen = set()
-    unique_jobs = []
-    
-    for job in jobs:
-        if job.unique_id not in seen:
-            seen.add(job.unique_id)
-            unique_jobs.append(job)
+    total_hits = 0
+    total_requests = 0
+    for source, counts in cache.get_stats().items():
+        requests_count = counts["hits"] + counts["misses"]
+        total_hits += counts["hits"]
+        total_requests += requests_count
+        logging.info(f"HTTP cache [{source}]: {counts['hits']}/{requests_count} hits")
     
-    logging.info(f"Deduplicated: {len(unique_jobs)}/{len(jobs)} unique jobs")
-    return unique_jobs
+    return total_hits, total_requests
 
 
 async def main():
     """主函数"""
+    try:
+        await run()
+    finally:
+        await close_client_session()
+
+
+async def run():
+    """执行一次完整的监控流程"""
     setup_logging()
     logger = logging.getLogger("main")
     
@@ -81,85 +82,173 @@ async def main():
     logger.info(f"Time: {datetime.utcnow().isoformat()}")
     logger.info("=" * 50)
     
-    # 1. 收集所有职位
-    logger.info("Step 1: Collecting jobs from all sources...")
-    all_jobs, sources = collect_all_jobs()
-    logger.info(f"Collected {len(all_jobs)} jobs from {len(sources)} sources")
-    
-    if not all_jobs:
-        logger.warning("No jobs collected, exiting")
-        return
+    storage = create_storage()
+    try:
+        # 一次运行中的所有存储修改（新增、过期清理）合并为一次写入
+        with storage.transaction():
+            await monitor(storage)
+    finally:
+        storage.close()
+
+
+async def monitor(storage):
+    """
+    收集、过滤并推送新职位
     
-    # 2. 去重
-    logger.info("Step 2: Deduplicating jobs...")
-    unique_jobs = deduplicate_jobs(all_jobs)
+    Args:
+        storage: 存储管理器（由调用方管理事务）
+    """
+    logger = logging.getLogger("main")
     
-    # 3. 过滤（只保留目标类型的职位）
-    logger.info("Step 3: Filtering jobs...")
-    filtered_jobs = filter_jobs(unique_jobs)
-    logger.info(f"After filtering: {len(filtered_jobs)} jobs")
+    # 检查是否首次运行（首次运行只记录，不发送通知，避免消息轰炸）
+    is_first_run = storage.is_first_run()
+    notifier = None
+    if not is_first_run:
+        try:
+            # 配置了多聊天路由时按类别分发，否则全部发送到 TELEGRAM_CHAT_ID
+            notifier = NotificationRouter() if config.TELEGRAM_ROUTES else TelegramNotifier()
+        except ValueError as e:
+            logger.error(f"Telegram configuration error: {e}")
+            logger.info("Saving jobs anyway for next run")
     
-    if not filtered_jobs:
-        logger.info("No matching jobs after filtering")
-        return
+    # 1-4. 流式收集 → 去重 → 过滤 → 检测新职位，新职位立即交给通知任务
+    logger.info("Step 1: Streaming jobs from all sources...")
+    scrapers = create_all_scrapers()
+    pipeline = JobPipeline(storage)
     
-    # 4. 检测新职位
-    logger.info("Step 4: Detecting new jobs...")
-    storage = StorageManager()
+    notify_queue: asyncio.Queue[Optional[Job]] = asyncio.Queue()
+    notify_task = None
+    outbox = None
+    delivered: list[Job] = []
+    if notifier:
+        # 新职位先进入发件箱，确认送达后才标记为已见；上次未送达的最先重发
+        outbox = Outbox()
+        retried = outbox.pending()
+        if retried:
+            logger.info(f"Retrying {len(retried)} undelivered notifications from outbox")
+        for job in retried:
+            notify_queue.put_nowait(job)
+        
+        def on_sent(job: Job):
+            outbox.ack(job)
+            delivered.append(job)
+        
+        async def enrich(job: Job):
+            # 只为通过过滤的新职位按需获取详情（部门显示在消息中）
+            await enrich_jobs_async(scrapers, [job])
+        
+        if config.DIGEST_MODE:
+            # 摘要模式：收集完所有新职位后补充详情，再分组合并发送
+            notify_task = asyncio.create_task(
+                notifier.send_digest_stream(
+                    iter_queue(notify_queue), before_send=enrich, on_sent=on_sent
+                )
+            )
+        else:
+            notify_task = asyncio.create_task(
+                notifier.send_job_stream(
+                    iter_queue(notify_queue), before_send=enrich, on_sent=on_sent
+                )
+            )
     
-    # 检查是否首次运行
-    is_first_run = storage.is_first_run()
+    try:
+        async for index, jobs in stream_jobs_async(scrapers):
+            for job in pipeline.process(index, jobs):
+                # 幂等入队：上次未送达、本次已重发的职位（无论是否已确认）不再重复发送
+                if outbox is not None and outbox.enqueue(job):
+                    notify_queue.put_nowait(job)
+    finally:
+        notify_queue.put_nowait(None)
+        if outbox is not None:
+            outbox.save()
     
-    new_jobs = storage.find_new_jobs(filtered_jobs)
+    sources = pipeline.get_sources(scrapers)
+    filtered_jobs = pipeline.filtered_jobs
+    new_jobs = pipeline.new_jobs
+    logger.info(f"Collected {pipeline.collected} jobs from {len(sources)} sources")
+    logger.info(f"Deduplicated: {pipeline.unique}/{pipeline.collected} unique jobs")
+    logger.info(f"After filtering: {len(filtered_jobs)} jobs")
     logger.info(f"Found {len(new_jobs)} new jobs")
     
-    # 5. 发送通知
-    if new_jobs:
+    # 5. 等待通知发送完成
+    if notify_task:
+        logger.info("Step 5: Waiting for notifications...")
+        try:
+            success, fail = await notify_task
+        finally:
+            await notifier.aclose()
+            outbox.save()
+        logger.info(f"Sent {success} notifications, {fail} failed")
+        
+        # 只有确认送达的才标记为已见，未送达（失败或超出数量上限）的留在发件箱下次重发
+        if delivered:
+            storage.mark_as_seen(delivered)
+        outbox_stats = outbox.get_stats()
+        logger.info(
+            f"Outbox: {outbox_stats['delivered']} delivered "
+            f"(latency avg {outbox_stats['avg_latency']:.1f}s, max {outbox_stats['max_latency']:.1f}s), "
+            f"{outbox_stats['backlog']} pending"
+        )
+        if outbox_stats["backlog"]:
+            logger.warning(
+                f"{outbox_stats['backlog']} notifications not delivered, will retry next run"
+            )
+    elif new_jobs:
         if is_first_run:
             logger.info(
                 "First run detected. Recording all jobs but not sending notifications."
             )
-            # 首次运行只记录，不发送通知（避免消息轰炸）
-            storage.mark_as_seen(new_jobs)
-            logger.info(f"Recorded {len(new_jobs)} jobs for future comparison")
-        else:
-            logger.info("Step 5: Sending notifications...")
-            
-            try:
-                notifier = TelegramNotifier()
-                success, fail = await notifier.send_job_notifications(new_jobs)
-                logger.info(f"Sent {success} notifications, {fail} failed")
-                
-                # 只有发送成功的才标记为已见
-                if success > 0:
-                    storage.mark_as_seen(new_jobs)
-                    
-            except ValueError as e:
-                logger.error(f"Telegram configuration error: {e}")
-                logger.info("Saving jobs anyway for next run")
-                storage.mark_as_seen(new_jobs)
-    else:
+        storage.mark_as_seen(new_jobs)
+        logger.info(f"Recorded {len(new_jobs)} jobs for future comparison")
+    
+    cache_hits, cache_requests = report_cache_stats()
+    pipeline.job_filter.save_cache()
+    filter_hits, filter_lookups = pipeline.job_filter.get_cache_stats()
+    if filter_lookups:
+        logger.info(f"Filter cache: {filter_hits}/{filter_lookups} hits")
+    
+    breaker = get_default_circuit_breaker()
+    breaker.save()
+    open_circuits = breaker.get_open_circuits()
+    if open_circuits:
+        logger.info(f"Skipping {len(open_circuits)} failing boards: {', '.join(open_circuits)}")
+    
+    if not pipeline.collected:
+        logger.warning("No jobs collected, exiting")
+        return
+    
+    if not filtered_jobs:
+        logger.info("No matching jobs after filtering")
+        return
+    
+    if not new_jobs:
         logger.info("No new jobs to notify")
     
     # 6. 生成 Dashboard
     logger.info("Step 6: Generating dashboard...")
     try:
+        # 已缓存详情的职位显示部门（不发送新的详情请求）
+        apply_cached_details(scrapers, filtered_jobs)
         dashboard_path = generate_dashboard(filtered_jobs, "dashboard.html")
         logger.info(f"Dashboard generated: {dashboard_path}")
     except Exception as e:
         logger.error(f"Failed to generate dashboard: {e}")
     
-    # 7. 清理旧记录（可选）
-    storage.cleanup_old_jobs(days=90)
+    # 7. 清理旧记录（保留期见 RETENTION_DAYS / SOURCE_RETENTION_DAYS）
+    storage.cleanup_old_jobs()
     
     # 8. 打印统计
     stats = storage.get_stats()
     logger.info("=" * 50)
     logger.info("Summary:")
     logger.info(f"  - Sources scraped: {len(sources)}")
-    logger.info(f"  - Total jobs collected: {len(all_jobs)}")
+    logger.info(f"  - Total jobs collected: {pipeline.collected}")
+    logger.info(f"  - HTTP cache hits: {cache_hits}/{cache_requests}")
+    logger.info(f"  - Filter cache hits: {filter_hits}/{filter_lookups}")
     logger.info(f"  - After filtering: {len(filtered_jobs)}")
     logger.info(f"  - New jobs found: {len(new_jobs)}")
+    if outbox is not None:
+        logger.info(f"  - Outbox backlog: {len(outbox)}")
     logger.info(f"  - Total jobs in storage: {stats['total_jobs']}")
     logger.info("=" * 50)
     logger.info("Crypto Job Monitor Completed")
@@ -6,9 +6,18 @@ from .telegram import (
     send_notifications,
     send_single_notification,
 )
+from .digest import pack_digests
+from .rate_limit import TelegramRateLimiter, get_default_rate_limiter
+from .router import NotificationRouter
+from .stream import iter_queue
 
 __all__ = [
     "TelegramNotifier",
+    "NotificationRouter",
     "send_notifications",
     "send_single_notification",
+    "pack_digests",
+    "TelegramRateLimiter",
+    "get_default_rate_limiter",
+    "iter_queue",
 ]
@@ -0,0 +1,130 @@
+"""
+摘要消息
+
+把多个新职位按公司或数据源分组，装箱为少量 Telegram 消息：
+- 每组一个标题，每个职位一行（标题链接 + 部门 + 地点，由 MessageRenderer 渲染并缓存）
+- 超出单条消息长度的组拆成多块（标题后标注 cont.）
+- 单独一行就超出长度的职位（超长的部门、地点或链接）依次去掉部门 / 地点、链接并截断标题，
+  组名过长时同样截断，保证每条消息都不超过 TELEGRAM_MESSAGE_LIMIT
+- 各块按长度降序首次适应装箱，消息内保持原分组顺序
+
+消息长度按 HTML 原文计算（不小于 Telegram 解析后的长度），保证不超过限制。
+"""
+from typing import Optional
+
+from .render import default_renderer, escape_html
+import config
+
+# 消息开头 "🆕 <b>N new jobs</b>" 预留的长度
+HEADER_RESERVE = 64
+
+GROUP_ICONS = {
+    "company": "🏢",
+    "source": "📂",
+}
+
+# 链接行 "• <a href=\"...\">...</a>" 除链接和标题外的长度
+LINK_OVERHEAD = len('• <a href="">') + len("</a>")
+# 截断后的标题至少保留的长度（链接过长放不下时不再显示链接）
+MIN_TITLE_LENGTH = 20
+
+
+def _truncate_text(text: str, limit: int) -> str:
+    """转义文本并截断到 limit 个字符以内（不会截断在 HTML 实体中间）"""
+    escaped = escape_html(text)
+    if len(escaped) <= limit:
+        return escaped
+
+    pieces = []
+    length = 0
+    for char in text:
+        piece = escape_html(char)
+        if length + len(piece) > limit - 1:
+            break
+        pieces.append(piece)
+        length += len(piece)
+    return "".join(pieces) + "…"
+
+
+def _fit_line(job, limit: int) -> str:
+    """渲染一行，超出 limit 时依次去掉部门 / 地点、链接并截断标题"""
+    line = default_renderer.render_line(job)
+    if len(line) <= limit:
+        return line
+
+    title_limit = limit - LINK_OVERHEAD - len(job.url)
+    if title_limit >= MIN_TITLE_LENGTH:
+        return f"• <a href=\"{job.url}\">{_truncate_text(job.title, title_limit)}</a>"
+    return "• " + _truncate_text(job.title, limit - 2)
+
+
+def _group_blocks(jobs: list, group_by: str, budget: int) -> list[tuple[str, list]]:
+    """按分组生成文本块（单组超出 budget 时拆分）"""
+    groups: dict[str, list] = {}
+    for job in jobs:
+        groups.setdefault(getattr(job, group_by) or "Unknown", []).append(job)
+
+    icon = GROUP_ICONS.get(group_by, "•")
+    blocks = []
+    for name, group_jobs in groups.items():
+        # 组名最多占一半预算，剩余空间至少放得下一行
+        title = f"{icon} <b>{_truncate_text(name, budget // 2)}</b>"
+        continued = f"{title} (cont.)"
+        line_limit = budget - len(continued) - 1
+        header = title
+        lines = [header]
+        chunk: list = []
+        length = len(header)
+        for job in group_jobs:
+            line = _fit_line(job, line_limit)
+            if chunk and length + 1 + len(line) > budget:
+                blocks.append(("\n".join(lines), chunk))
+                header = continued
+                lines, chunk, length = [header], [], len(header)
+            lines.append(line)
+            chunk.append(job)
+            length += 1 + len(line)
+        blocks.append(("\n".join(lines), chunk))
+    return blocks
+
+
+def pack_digests(
+    jobs: list,
+    group_by: Optional[str] = None,
+    max_length: Optional[int] = None
+) -> list[tuple[str, list]]:
+    """
+    把职位装箱为摘要消息
+
+    Args:
+        jobs: Job 对象列表
+        group_by: 分组字段 "company" 或 "source"（默认使用配置）
+        max_length: 单条消息最大长度（默认使用配置）
+
+    Returns:
+        [(消息文本, 消息包含的职位)]
+    """
+    group_by = group_by or config.DIGEST_GROUP_BY
+    budget = (max_length or config.TELEGRAM_MESSAGE_LIMIT) - HEADER_RESERVE
+    blocks = _group_blocks(jobs, group_by, budget)
+
+    # 首次适应递减：大块先放，小块填入已有消息的剩余空间
+    bins: list[list] = []  # [已用长度, [块下标]]
+    order = sorted(range(len(blocks)), key=lambda index: len(blocks[index][0]), reverse=True)
+    for index in order:
+        size = len(blocks[index][0])
+        for bin_ in bins:
+            if bin_[0] + 2 + size <= budget:
+                bin_[0] += 2 + size
+                bin_[1].append(index)
+                break
+        else:
+            bins.append([size, [index]])
+
+    messages = []
+    for _, indexes in bins:
+        indexes.sort()
+        message_jobs = [job for index in indexes for job in blocks[index][1]]
+        body = "\n\n".join(blocks[index][0] for index in indexes)
+        messages.append((f"🆕 <b>{len(message_jobs)} new jobs</b>\n\n{body}", message_jobs))
+    return messages
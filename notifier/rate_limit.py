@@ -0,0 +1,119 @@
+"""
+Telegram 发送限流
+
+Telegram 对单个聊天（约 1 条/秒）和整个 Bot（约 30 条/秒）分别限速。
+每个聊天一个令牌桶，另有一个全局令牌桶，发送前两者都要取得令牌。
+
+收到 429 时按 retry_after 暂停该聊天的令牌桶并把速率减半，
+之后每次发送成功逐步恢复到配置速率（加性增、乘性减）。
+"""
+import logging
+from typing import Optional
+
+from http_utils import TokenBucket
+import config
+
+logger = logging.getLogger(__name__)
+
+# 速率下限（占配置速率的比例）
+MIN_RATE_RATIO = 0.1
+# 每次发送成功恢复的速率（占配置速率的比例）
+RECOVERY_RATIO = 0.1
+
+
+class TelegramRateLimiter:
+    """Telegram 发送限流器（每个聊天一个令牌桶 + 全局令牌桶）"""
+
+    def __init__(
+        self,
+        chat_rate: Optional[float] = None,
+        chat_burst: Optional[float] = None,
+        global_rate: Optional[float] = None
+    ):
+        """
+        初始化限流器
+
+        Args:
+            chat_rate: 每个聊天每秒的消息数（默认使用配置）
+            chat_burst: 每个聊天允许的突发消息数（默认使用配置）
+            global_rate: 全局每秒的消息数（默认使用配置）
+        """
+        self.chat_rate = chat_rate or config.TELEGRAM_CHAT_RATE
+        self.chat_burst = chat_burst or config.TELEGRAM_CHAT_BURST
+        self.global_rate = global_rate or config.TELEGRAM_GLOBAL_RATE
+        self.global_bucket = TokenBucket(self.global_rate, self.global_rate)
+        self._chat_buckets: dict[str, TokenBucket] = {}
+        self._chat_rates: dict[str, float] = {}
+
+    def configure_chat(self, chat_id: str, rate: float, burst: Optional[float] = None):
+        """
+        为单个聊天设置独立的速率（如频道比私聊限制更严）
+
+        Args:
+            chat_id: Chat ID
+            rate: 每秒消息数
+            burst: 允许的突发消息数（默认使用全局配置）
+        """
+        self._chat_rates[chat_id] = rate
+        self._chat_buckets[chat_id] = TokenBucket(rate, burst or self.chat_burst)
+
+    def get_bucket(self, chat_id: str) -> TokenBucket:
+        """
+        获取聊天的令牌桶（不存在时创建）
+
+        Args:
+            chat_id: Chat ID
+
+        Returns:
+            TokenBucket
+        """
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.chat_rate, self.chat_burst)
+        return bucket
+
+    def get_chat_rate(self, chat_id: str) -> float:
+        """聊天的配置速率（每秒消息数）"""
+        return self._chat_rates.get(chat_id, self.chat_rate)
+
+    async def acquire(self, chat_id: str):
+        """
+        等待发送许可（聊天令牌 + 全局令牌）
+
+        Args:
+            chat_id: Chat ID
+        """
+        await self.get_bucket(chat_id).acquire_async()
+        await self.global_bucket.acquire_async()
+
+    def on_success(self, chat_id: str):
+        """发送成功：逐步恢复被降低的速率"""
+        bucket = self.get_bucket(chat_id)
+        chat_rate = self.get_chat_rate(chat_id)
+        if bucket.rate < chat_rate:
+            bucket.rate = min(chat_rate, bucket.rate + chat_rate * RECOVERY_RATIO)
+
+    def on_retry_after(self, chat_id: str, seconds: float):
+        """
+        收到 429：暂停该聊天并降低速率
+
+        Args:
+            chat_id: Chat ID
+            seconds: 服务端要求的等待时间（秒）
+        """
+        bucket = self.get_bucket(chat_id)
+        bucket.pause(seconds)
+        bucket.rate = max(self.get_chat_rate(chat_id) * MIN_RATE_RATIO, bucket.rate / 2)
+        logger.debug(f"Chat {chat_id} rate lowered to {bucket.rate:.2f}/s")
+
+
+_default_rate_limiter: Optional[TelegramRateLimiter] = None
+
+
+def get_default_rate_limiter() -> TelegramRateLimiter:
+    """获取默认的共享限流器（同一进程内的所有通知器共用全局限额）"""
+    global _default_rate_limiter
+
+    if _default_rate_limiter is None:
+        _default_rate_limiter = TelegramRateLimiter()
+    return _default_rate_limiter
@@ -0,0 +1,166 @@
+"""
+消息渲染
+
+把 Job 渲染为 Telegram HTML 消息（通知模块直接调用 default_renderer，Job 数据模型不依赖本模块）：
+- 共用一个 HTML 转义函数（实测 str.translate / re.sub 的单次遍历都比三次 C 实现的
+  replace 慢，无特殊字符时 replace 直接返回原字符串，因此保留 replace）
+- 标签分类预编译为 (关键词, 标签) 平铺表，标题只转一次小写，已命中的标签跳过其余关键词
+  （子串匹配，与旧版 `keyword in title_lower` 语义一致；这么短的关键词表用 C 实现的
+  子串查找比组合正则的逐位置扫描更快，因此不复用 JobFilter 的 KeywordMatcher）
+- 渲染结果按 unique_id 缓存（LRU），重试、摘要和多聊天发送不会重复渲染
+- 职位有部门 / 团队（description，Greenhouse 由详情请求补充）时一并显示
+
+缓存以 unique_id 为键，渲染后不应再修改职位的其他字段（补充详情应在发送前完成）。
+"""
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import config
+
+# 标签及其关键词（按输出顺序，子串匹配）
+TAG_KEYWORDS = {
+    "#research": ["research", "analyst"],
+    "#investment": ["invest", "vc", "venture", "principal"],
+    "#strategy": ["strateg"],
+    "#operations": ["operation", "ops"],
+    "#bizdev": ["business development", " bd ", "partner"],
+    "#growth": ["growth", "marketing"],
+    "#product": ["product"],
+    "#community": ["community"],
+}
+BASE_TAGS = ["#crypto", "#web3"]
+MAX_TAGS = 5
+
+# 预编译的 (关键词, 标签) 平铺表
+_TAG_TABLE = tuple(
+    (keyword, tag) for tag, keywords in TAG_KEYWORDS.items() for keyword in keywords
+)
+
+# 摘要行中职位标题的最大长度
+MAX_TITLE_LENGTH = 200
+
+MESSAGE_HEADER = "📌 <b>{title}</b>\n🏢 {company}\n📂 <i>via {source}</i>"
+
+
+def escape_html(text: str) -> str:
+    """转义 HTML 特殊字符"""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+class MessageRenderer:
+    """职位消息渲染器（按 unique_id 缓存渲染结果）"""
+
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        初始化渲染器
+
+        Args:
+            max_size: 每种消息最多缓存的职位数（默认使用配置）
+        """
+        self.max_size = max_size or config.RENDER_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._messages: OrderedDict[str, str] = OrderedDict()
+        self._lines: OrderedDict[str, str] = OrderedDict()
+
+    def _cached(self, cache: OrderedDict, job, render: Callable) -> str:
+        """从缓存获取渲染结果（未命中时渲染并缓存）"""
+        key = job.unique_id
+        text = cache.get(key)
+        if text is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return text
+
+        self.misses += 1
+        text = cache[key] = render(job)
+        if len(cache) > self.max_size:
+            cache.popitem(last=False)
+        return text
+
+    def get_tags(self, title: str) -> str:
+        """
+        生成标签
+
+        Args:
+            title: 职位标题
+
+        Returns:
+            空格分隔的标签（最多 MAX_TAGS 个）
+        """
+        title_lower = title.lower()
+        tags = list(BASE_TAGS)
+        for keyword, tag in _TAG_TABLE:
+            if tag is not tags[-1] and keyword in title_lower:
+                tags.append(tag)
+        return " ".join(tags[:MAX_TAGS])
+
+    def _render_message(self, job) -> str:
+        """渲染完整的职位消息"""
+        parts = [MESSAGE_HEADER.format(
+            title=escape_html(job.title),
+            company=escape_html(job.company),
+            source=escape_html(job.source),
+        )]
+
+        if job.description:
+            parts.append(f"🏷 {escape_html(job.description)}")
+        if job.location:
+            location_text = job.location + (" (Remote OK)" if job.remote else "")
+            parts.append(f"📍 {escape_html(location_text)}")
+        elif job.remote:
+            parts.append("📍 Remote")
+        if job.salary:
+            parts.append(f"💰 {escape_html(job.salary)}")
+        if job.job_type:
+            parts.append(f"⏰ {escape_html(job.job_type)}")
+
+        parts.append(f"\n🔗 <a href=\"{job.url}\">Apply Now</a>")
+
+        tags = self.get_tags(job.title)
+        if tags:
+            parts.append(f"\n{tags}")
+        return "\n".join(parts)
+
+    def _render_line(self, job) -> str:
+        """渲染摘要中的一行"""
+        title = job.title
+        if len(title) > MAX_TITLE_LENGTH:
+            title = title[:MAX_TITLE_LENGTH - 1] + "…"
+        line = f"• <a href=\"{job.url}\">{escape_html(title)}</a>"
+
+        if job.description:
+            line += f" · {escape_html(job.description)}"
+        if job.location:
+            location = job.location + (" (Remote OK)" if job.remote else "")
+            line += f" · {escape_html(location)}"
+        elif job.remote:
+            line += " · Remote"
+        return line
+
+    def render(self, job) -> str:
+        """
+        渲染职位消息
+
+        Args:
+            job: Job 对象
+
+        Returns:
+            Telegram HTML 消息
+        """
+        return self._cached(self._messages, job, self._render_message)
+
+    def render_line(self, job) -> str:
+        """
+        渲染摘要中的一行
+
+        Args:
+            job: Job 对象
+
+        Returns:
+            形如 "• <a href=...>标题</a> · 部门 · 地点" 的 HTML 文本
+        """
+        return self._cached(self._lines, job, self._render_line)
+
+
+default_renderer = MessageRenderer()
@@ -0,0 +1,255 @@
+"""
+多聊天通知路由
+
+按职位类别把通知分发到不同的 Telegram 聊天（如研究、投资、BD 各一个群）：
+- 每个类别一组关键词，标题命中即发送到该类别的聊天；未命中任何类别的发送到默认聊天
+- 每个聊天一个发送任务，并发发送，共用一个通知器的连接池
+- 每个聊天有独立的令牌桶（可单独配置速率），一个聊天被限流不会拖慢其他聊天
+
+一个职位的所有目标聊天都发送成功后才算送达（on_sent），否则下次运行重发。
+"""
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
+
+from filters.matcher import KeywordMatcher
+from .rate_limit import TelegramRateLimiter, get_default_rate_limiter
+from .stream import iter_queue
+from .telegram import TelegramNotifier
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def parse_routes(routes: Union[str, dict, None]) -> dict[str, dict]:
+    """
+    解析并校验路由配置
+
+    Args:
+        routes: JSON 字符串（如环境变量 TELEGRAM_ROUTES）或已解析的字典；空值表示没有路由
+
+    Returns:
+        {类别: {"chat_id": ..., "keywords": [...], "rate": ...}}
+
+    Raises:
+        ValueError: JSON 格式错误、缺少 chat_id、keywords 不是字符串列表或 rate 不是正数
+    """
+    if not routes:
+        return {}
+    if isinstance(routes, str):
+        try:
+            routes = json.loads(routes)
+        except ValueError as e:
+            raise ValueError(f"TELEGRAM_ROUTES is not valid JSON: {e}") from None
+    if not isinstance(routes, dict):
+        raise ValueError("TELEGRAM_ROUTES must be a JSON object of {category: route}")
+
+    for name, route in routes.items():
+        if not isinstance(route, dict):
+            raise ValueError(f"Route {name!r} must be an object")
+        if not route.get("chat_id"):
+            raise ValueError(f"Route {name!r} has no chat_id")
+        keywords = route.get("keywords", [])
+        if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+            raise ValueError(f"Route {name!r}: keywords must be a list of strings")
+        rate = route.get("rate")
+        if rate is not None and (
+            isinstance(rate, bool) or not isinstance(rate, (int, float)) or rate <= 0
+        ):
+            raise ValueError(f"Route {name!r}: rate must be a positive number")
+    return routes
+
+
+class NotificationRouter:
+    """多聊天通知路由器（接口与 TelegramNotifier 的流式发送一致）"""
+
+    def __init__(
+        self,
+        routes: Union[str, dict[str, dict], None] = None,
+        default_chat_id: Optional[str] = None,
+        bot_token: Optional[str] = None,
+        rate_limiter: Optional[TelegramRateLimiter] = None
+    ):
+        """
+        初始化路由器
+
+        Args:
+            routes: {类别: {"chat_id": ..., "keywords": [...], "rate": 每秒消息数（可选）}}
+                    或其 JSON 字符串（默认使用配置 TELEGRAM_ROUTES）
+            default_chat_id: 未命中任何类别时的聊天（默认使用配置，空字符串表示丢弃）
+            bot_token: Bot Token（默认使用配置）
+            rate_limiter: 发送限流器（默认使用进程内共享的限流器）
+
+        Raises:
+            ValueError: 路由配置无效（见 parse_routes），或没有任何可发送的聊天
+        """
+        self.routes = parse_routes(config.TELEGRAM_ROUTES if routes is None else routes)
+        self.default_chat_id = (
+            config.TELEGRAM_CHAT_ID if default_chat_id is None else default_chat_id
+        )
+        chat_ids = [route["chat_id"] for route in self.routes.values()]
+        if not chat_ids and not self.default_chat_id:
+            raise ValueError("No Telegram chats configured for routing.")
+
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        for route in self.routes.values():
+            if route.get("rate"):
+                self.rate_limiter.configure_chat(route["chat_id"], route["rate"])
+
+        # 所有聊天共用一个通知器（一个会话和连接池），发送时指定 chat_id
+        self.notifier = TelegramNotifier(
+            bot_token, self.default_chat_id or chat_ids[0], self.rate_limiter
+        )
+        # 每个类别单独一个匹配器：同一关键词出现在多个类别时，各类别都能命中
+        self._matchers = [
+            (route["chat_id"], KeywordMatcher({name: route.get("keywords", [])}))
+            for name, route in self.routes.items()
+        ]
+
+    async def __aenter__(self) -> "NotificationRouter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """关闭共享的连接池"""
+        await self.notifier.aclose()
+
+    def route(self, job) -> list[str]:
+        """
+        计算职位的目标聊天
+
+        Args:
+            job: Job 对象
+
+        Returns:
+            Chat ID 列表（按配置顺序，去重）
+        """
+        chat_ids = []
+        for chat_id, matcher in self._matchers:
+            if chat_id not in chat_ids and matcher.find_groups(job.title):
+                chat_ids.append(chat_id)
+        if not chat_ids and self.default_chat_id:
+            chat_ids.append(self.default_chat_id)
+        return chat_ids
+
+    def _track_delivery(
+        self,
+        on_sent: Optional[Callable[[object], None]]
+    ) -> tuple[Callable[[object, int], None], Callable[[object], None]]:
+        """
+        创建送达跟踪器
+
+        Returns:
+            (登记职位的目标数量, 单个聊天发送成功的回调)
+        """
+        remaining: dict[str, int] = {}
+
+        def expect(job, count: int):
+            remaining[job.unique_id] = count
+            if count == 0 and on_sent:
+                # 没有目标聊天（未配置默认聊天）的职位视为已处理
+                on_sent(job)
+
+        def delivered(job):
+            remaining[job.unique_id] -= 1
+            if remaining[job.unique_id] == 0 and on_sent:
+                on_sent(job)
+
+        return expect, delivered
+
+    async def send_job_stream(
+        self,
+        jobs: AsyncIterator,
+        max_messages: Optional[int] = None,
+        before_send: Optional[Callable[[object], Awaitable]] = None,
+        on_sent: Optional[Callable[[object], None]] = None
+    ) -> tuple[int, int]:
+        """
+        边产生边分发职位通知（每个聊天一个并发发送任务）
+
+        Args:
+            jobs: Job 对象的异步迭代器
+            max_messages: 每个聊天的最大发送数量（默认使用配置）
+            before_send: 分发前对每个职位调用的协程函数（如补充详情）
+            on_sent: 职位在所有目标聊天都发送成功后的回调
+
+        Returns:
+            (成功消息数, 失败消息数)，为所有聊天之和
+        """
+        expect, delivered = self._track_delivery(on_sent)
+        queues: dict[str, asyncio.Queue] = {}
+        tasks: list[asyncio.Task] = []
+
+        try:
+            async for job in jobs:
+                chat_ids = self.route(job)
+                expect(job, len(chat_ids))
+                if not chat_ids:
+                    continue
+                if before_send:
+                    await before_send(job)
+
+                for chat_id in chat_ids:
+                    if chat_id not in queues:
+                        queues[chat_id] = asyncio.Queue()
+                        tasks.append(asyncio.create_task(self.notifier.send_job_stream(
+                            iter_queue(queues[chat_id]),
+                            max_messages,
+                            on_sent=delivered,
+                            chat_id=chat_id,
+                        )))
+                    queues[chat_id].put_nowait(job)
+        finally:
+            for queue in queues.values():
+                queue.put_nowait(None)
+
+        results = await asyncio.gather(*tasks)
+        logger.info(f"Routed notifications to {len(queues)} chats")
+        return sum(success for success, _ in results), sum(fail for _, fail in results)
+
+    async def send_digest_stream(
+        self,
+        jobs: AsyncIterator,
+        group_by: Optional[str] = None,
+        max_messages: Optional[int] = None,
+        before_send: Optional[Callable[[object], Awaitable]] = None,
+        on_sent: Optional[Callable[[object], None]] = None
+    ) -> tuple[int, int]:
+        """
+        收集完所有职位后按聊天分组，各聊天并发发送摘要
+
+        Args:
+            jobs: Job 对象的异步迭代器
+            group_by: 分组字段 "company" 或 "source"（默认使用配置）
+            max_messages: 每个聊天的最大发送消息数（默认使用配置）
+            before_send: 装箱前对每个有目标聊天的职位调用的协程函数（如补充详情，并发执行）
+            on_sent: 职位在所有目标聊天都发送成功后的回调
+
+        Returns:
+            (成功消息数, 失败消息数)，为所有聊天之和
+        """
+        expect, delivered = self._track_delivery(on_sent)
+        chat_jobs: dict[str, list] = {}
+        routed = []
+        async for job in jobs:
+            chat_ids = self.route(job)
+            expect(job, len(chat_ids))
+            if chat_ids:
+                routed.append(job)
+            for chat_id in chat_ids:
+                chat_jobs.setdefault(chat_id, []).append(job)
+
+        if before_send:
+            await asyncio.gather(*(before_send(job) for job in routed))
+
+        results = await asyncio.gather(*(
+            self.notifier.send_digest(
+                chat_job_list, group_by, max_messages, on_sent=delivered, chat_id=chat_id
+            )
+            for chat_id, chat_job_list in chat_jobs.items()
+        ))
+        logger.info(f"Routed digests to {len(chat_jobs)} chats")
+        return sum(success for success, _ in results), sum(fail for _, fail in results)
@@ -0,0 +1,24 @@
+"""
+通知流工具
+
+抓取管道通过 asyncio.Queue 把新职位交给通知任务，发送端以异步迭代器消费。
+"""
+import asyncio
+from typing import AsyncIterator
+
+
+async def iter_queue(queue: asyncio.Queue) -> AsyncIterator:
+    """
+    把队列转为异步迭代器（收到 None 时结束）
+
+    Args:
+        queue: asyncio.Queue
+
+    Yields:
+        队列中的元素
+    """
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+        yield item
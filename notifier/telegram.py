@@ -2,23 +2,64 @@
 Telegram 通知模块
 
 负责将新职位推送到 Telegram。
+
+通知器持有一个长连接的 aiohttp 会话（TCPConnector keep-alive），
+所有消息复用同一个 TCP/TLS 连接。可作为异步上下文管理器使用：
+
+    async with TelegramNotifier() as notifier:
+        await notifier.send_job_notifications(jobs)
+
+发送节奏由 TelegramRateLimiter 控制（每个聊天 + 全局令牌桶），不再固定间隔等待；
+收到 429 时按响应中的 parameters.retry_after 暂停后重新发送，而不是计为失败。
 """
 import asyncio
+import json
 import logging
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Mapping, Optional
+
+import aiohttp
 
+from http_utils import RetryPolicy, parse_retry_after
+from .digest import pack_digests
+from .render import default_renderer
+from .rate_limit import TelegramRateLimiter, get_default_rate_limiter
 import config
 
 logger = logging.getLogger(__name__)
 
 
+def get_retry_after(body: str, headers: Mapping[str, str]) -> Optional[float]:
+    """
+    解析 429 响应要求的等待时间
+    
+    优先使用响应体中的 parameters.retry_after，其次是 Retry-After 响应头
+    （响应体中的值缺失或不是数字时）。
+    
+    Args:
+        body: 响应体文本
+        headers: 响应头
+    
+    Returns:
+        等待秒数；无法解析时返回 None
+    """
+    try:
+        retry_after = json.loads(body).get("parameters", {}).get("retry_after")
+    except (ValueError, AttributeError):
+        retry_after = None
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return parse_retry_after(headers.get("Retry-After"))
+
+
 class TelegramNotifier:
     """Telegram 通知器"""
     
     def __init__(
         self,
         bot_token: Optional[str] = None,
-        chat_id: Optional[str] = None
+        chat_id: Optional[str] = None,
+        rate_limiter: Optional[TelegramRateLimiter] = None
     ):
         """
         初始化 Telegram 通知器
@@ -26,10 +67,24 @@ class TelegramNotifier:
         Args:
             bot_token: Bot Token（默认使用配置）
             chat_id: Chat ID（默认使用配置）
+            rate_limiter: 发送限流器（默认使用进程内共享的限流器）
         """
         self.bot_token = bot_token or config.TELEGRAM_BOT_TOKEN
         self.chat_id = chat_id or config.TELEGRAM_CHAT_ID
         self._validate_config()
+        self.api_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.retry_policy = RetryPolicy(
+            max_retries=config.TELEGRAM_MAX_RETRIES,
+            backoff_max=config.TELEGRAM_RETRY_AFTER_MAX,
+        )
+    
+    async def __aenter__(self) -> "TelegramNotifier":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     def _validate_config(self):
         """验证配置"""
@@ -44,62 +99,113 @@ class TelegramNotifier:
                 "Please set it as an environment variable."
             )
     
-    async def send_message(self, text: str) -> bool:
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        获取 aiohttp 会话（不存在或已关闭时创建）
+        
+        必须在事件循环内调用。
+        
+        Returns:
+            aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=config.TELEGRAM_POOL_SIZE,
+                keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=config.TELEGRAM_TIMEOUT),
+            )
+            logger.debug("Created Telegram client session")
+        
+        return self._session
+    
+    async def aclose(self):
+        """关闭会话和连接池"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def send_message(self, text: str, chat_id: Optional[str] = None) -> bool:
         """
         发送消息
         
+        发送前等待限流许可；收到 429 时按 retry_after 暂停该聊天后重新发送，
+        重试次数或等待时间超出上限时才计为失败。
+        
         Args:
             text: 消息文本（支持 HTML 格式）
+            chat_id: 目标 Chat ID（默认使用配置）
         
         Returns:
             True 如果发送成功
         """
-        import aiohttp
-        
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        chat_id = chat_id or self.chat_id
+        url = f"{self.api_url}/sendMessage"
         payload = {
-            "chat_id": self.chat_id,
+            "chat_id": chat_id,
             "text": text,
             "parse_mode": "HTML",
             "disable_web_page_preview": False,
         }
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=30) as response:
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire(chat_id)
+            
+            try:
+                async with self.get_session().post(url, json=payload) as response:
                     if response.status == 200:
+                        self.rate_limiter.on_success(chat_id)
                         return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            f"Telegram API error: {response.status} - {error_text}"
-                        )
-                        return False
-        
-        except asyncio.TimeoutError:
-            logger.error("Telegram API timeout")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to send Telegram message: {e}")
+                    status = response.status
+                    error_text = await response.text()
+                    headers = response.headers
+            
+            except asyncio.TimeoutError:
+                logger.error("Telegram API timeout")
+                return False
+            except Exception as e:
+                logger.error(f"Failed to send Telegram message: {e}")
+                return False
+            
+            if status == 429 and self.retry_policy.should_retry(attempt, status):
+                delay = self.retry_policy.get_delay(
+                    attempt, get_retry_after(error_text, headers)
+                )
+                if delay is not None:
+                    logger.warning(
+                        f"Telegram rate limited chat {chat_id}, retrying in {delay:.1f}s"
+                    )
+                    self.rate_limiter.on_retry_after(chat_id, delay)
+                    continue
+            
+            logger.error(
+                f"Telegram API error: {status} - {error_text}"
+            )
             return False
     
-    async def send_job_notification(self, job) -> bool:
+    async def send_job_notification(self, job, chat_id: Optional[str] = None) -> bool:
         """
         发送职位通知
         
         Args:
             job: Job 对象
+            chat_id: 目标 Chat ID（默认使用配置）
         
         Returns:
             True 如果发送成功
         """
-        message = job.format_telegram_message()
-        return await self.send_message(message)
+        message = default_renderer.render(job)
+        return await self.send_message(message, chat_id)
     
     async def send_job_notifications(
         self,
         jobs: list,
-        max_messages: Optional[int] = None
+        max_messages: Optional[int] = None,
+        on_sent: Optional[Callable[[object], None]] = None
     ) -> tuple[int, int]:
         """
         批量发送职位通知
@@ -107,6 +213,7 @@ class TelegramNotifier:
         Args:
             jobs: Job 对象列表
             max_messages: 最大发送数量（默认使用配置）
+            on_sent: 每个职位发送成功后的回调（如记录已送达的职位）
         
         Returns:
             (成功数量, 失败数量)
@@ -128,11 +235,66 @@ class TelegramNotifier:
         for job in jobs_to_send:
             if await self.send_job_notification(job):
                 success_count += 1
+                if on_sent:
+                    on_sent(job)
             else:
                 fail_count += 1
+        
+        logger.info(
+            f"Sent {success_count} notifications, {fail_count} failed"
+        )
+        
+        return success_count, fail_count
+    
+    async def send_job_stream(
+        self,
+        jobs: AsyncIterator,
+        max_messages: Optional[int] = None,
+        before_send: Optional[Callable[[object], Awaitable]] = None,
+        on_sent: Optional[Callable[[object], None]] = None,
+        chat_id: Optional[str] = None
+    ) -> tuple[int, int]:
+        """
+        边产生边发送职位通知（爬虫仍在运行时即可开始发送）
+        
+        超出数量上限的职位会被消费但不发送。
+        
+        Args:
+            jobs: Job 对象的异步迭代器
+            max_messages: 最大发送数量（默认使用配置）
+            before_send: 发送前对每个职位调用的协程函数（如补充详情）
+            on_sent: 每个职位发送成功后的回调（如记录已送达的职位）
+            chat_id: 目标 Chat ID（默认使用配置）
+        
+        Returns:
+            (成功数量, 失败数量)
+        """
+        max_messages = max_messages or config.MAX_MESSAGES_PER_BATCH
+        
+        success_count = 0
+        fail_count = 0
+        skipped_count = 0
+        
+        async for job in jobs:
+            if success_count + fail_count >= max_messages:
+                skipped_count += 1
+                continue
+            
+            if before_send:
+                await before_send(job)
             
-            # 避免触发 Telegram 速率限制
-            await asyncio.sleep(config.MESSAGE_DELAY)
+            if await self.send_job_notification(job, chat_id):
+                success_count += 1
+                if on_sent:
+                    on_sent(job)
+            else:
+                fail_count += 1
+        
+        if skipped_count:
+            logger.warning(
+                f"Too many jobs ({success_count + fail_count + skipped_count}), "
+                f"only sent first {max_messages}"
+            )
         
         logger.info(
             f"Sent {success_count} notifications, {fail_count} failed"
@@ -140,6 +302,84 @@ class TelegramNotifier:
         
         return success_count, fail_count
     
+    async def send_digest(
+        self,
+        jobs: list,
+        group_by: Optional[str] = None,
+        max_messages: Optional[int] = None,
+        on_sent: Optional[Callable[[object], None]] = None,
+        chat_id: Optional[str] = None
+    ) -> tuple[int, int]:
+        """
+        以摘要形式发送职位通知（按公司或数据源分组，多个职位合并为一条消息）
+        
+        Args:
+            jobs: Job 对象列表
+            group_by: 分组字段 "company" 或 "source"（默认使用配置）
+            max_messages: 最大发送消息数（默认使用配置）
+            on_sent: 每个职位所在消息发送成功后的回调
+            chat_id: 目标 Chat ID（默认使用配置）
+        
+        Returns:
+            (成功消息数, 失败消息数)
+        """
+        max_messages = max_messages or config.MAX_MESSAGES_PER_BATCH
+        messages = pack_digests(jobs, group_by)
+        
+        if len(messages) > max_messages:
+            logger.warning(
+                f"Too many digest messages ({len(messages)}), "
+                f"only sending first {max_messages}"
+            )
+        
+        success_count = 0
+        fail_count = 0
+        
+        for text, message_jobs in messages[:max_messages]:
+            if await self.send_message(text, chat_id):
+                success_count += 1
+                if on_sent:
+                    for job in message_jobs:
+                        on_sent(job)
+            else:
+                fail_count += 1
+        
+        logger.info(
+            f"Sent {success_count} digest messages ({len(jobs)} jobs), {fail_count} failed"
+        )
+        
+        return success_count, fail_count
+    
+    async def send_digest_stream(
+        self,
+        jobs: AsyncIterator,
+        group_by: Optional[str] = None,
+        max_messages: Optional[int] = None,
+        before_send: Optional[Callable[[object], Awaitable]] = None,
+        on_sent: Optional[Callable[[object], None]] = None,
+        chat_id: Optional[str] = None
+    ) -> tuple[int, int]:
+        """
+        收集完所有职位后以摘要形式发送
+        
+        Args:
+            jobs: Job 对象的异步迭代器
+            group_by: 分组字段 "company" 或 "source"（默认使用配置）
+            max_messages: 最大发送消息数（默认使用配置）
+            before_send: 装箱前对每个职位调用的协程函数（如补充详情，并发执行）
+            on_sent: 每个职位所在消息发送成功后的回调
+            chat_id: 目标 Chat ID（默认使用配置）
+        
+        Returns:
+            (成功消息数, 失败消息数)
+        """
+        collected = [job async for job in jobs]
+        if not collected:
+            return 0, 0
+        if before_send:
+            await asyncio.gather(*(before_send(job) for job in collected))
+        return await self.send_digest(collected, group_by, max_messages, on_sent, chat_id)
+    
     async def send_summary(
         self,
         new_jobs_count: int,
@@ -177,8 +417,11 @@ def send_notifications(jobs: list) -> tuple[int, int]:
     Returns:
         (成功数量, 失败数量)
     """
-    notifier = TelegramNotifier()
-    return asyncio.run(notifier.send_job_notifications(jobs))
+    async def run() -> tuple[int, int]:
+        async with TelegramNotifier() as notifier:
+            return await notifier.send_job_notifications(jobs)
+    
+    return asyncio.run(run())
 
 
 def send_single_notification(job) -> bool:
@@ -191,5 +434,8 @@ def send_single_notification(job) -> bool:
     Returns:
         True 如果发送成功
     """
-    notifier = TelegramNotifier()
-    return asyncio.run(notifier.send_job_notification(job))
+    async def run() -> bool:
+        async with TelegramNotifier() as notifier:
+            return await notifier.send_job_notification(job)
+    
+    return asyncio.run(run())
@@ -0,0 +1,167 @@
+"""
+流式处理管道
+
+爬虫每返回一批职位就立即经过 去重 → 过滤 → 新职位检测，
+新职位马上交给通知任务发送，无需等待最慢的 board 爬完。
+
+各阶段都是生成器，可以单独组合使用：
+    new_jobs = detect_new(filter_stream(deduplicate(jobs, seen), job_filter), storage)
+"""
+import logging
+from typing import Iterable, Iterator, Optional
+
+from filters import JobFilter, default_filter
+from scrapers import Job
+from storage import StorageManager
+
+logger = logging.getLogger(__name__)
+
+
+def deduplicate(jobs: Iterable[Job], seen: set[str]) -> Iterator[Job]:
+    """
+    去重（跨批次共享 seen 集合）
+
+    Args:
+        jobs: 职位流
+        seen: 已出现过的 unique_id 集合（就地更新）
+
+    Yields:
+        首次出现的职位
+    """
+    for job in jobs:
+        unique_id = job.unique_id
+        if unique_id not in seen:
+            seen.add(unique_id)
+            yield job
+
+
+def filter_stream(jobs: Iterable[Job], job_filter: JobFilter) -> Iterator[Job]:
+    """
+    过滤（只保留目标类型的职位）
+
+    Args:
+        jobs: 职位流
+        job_filter: 过滤器
+
+    Yields:
+        通过过滤的职位
+    """
+    for job in jobs:
+        if job_filter.should_include(job):
+            yield job
+
+
+def detect_new(jobs: Iterable[Job], storage: StorageManager) -> Iterator[Job]:
+    """
+    新职位检测（整批交给 find_new_jobs，SQLite 后端可按批查询）
+
+    Args:
+        jobs: 职位流
+        storage: 存储管理器
+
+    Yields:
+        存储中不存在的职位
+    """
+    yield from storage.find_new_jobs(list(jobs))
+
+
+class JobPipeline:
+    """增量处理管道（记录各阶段统计）"""
+
+    def __init__(self, storage: StorageManager, job_filter: Optional[JobFilter] = None):
+        """
+        初始化管道
+
+        Args:
+            storage: 存储管理器
+            job_filter: 过滤器（默认使用全局过滤器）
+        """
+        self.storage = storage
+        self.job_filter = job_filter or default_filter
+        self.collected = 0
+        self.new_jobs: list[Job] = []
+        # unique_id -> 保留副本的爬虫下标
+        self._seen: dict[str, int] = {}
+        # unique_id -> (爬虫下标, 职位)
+        self._filtered: dict[str, tuple[int, Job]] = {}
+        self._new_positions: dict[str, int] = {}
+        self._source_indexes: set[int] = set()
+
+    def _count(self, jobs: Iterable[Job]) -> Iterator[Job]:
+        """统计进入管道的职位数"""
+        for job in jobs:
+            self.collected += 1
+            yield job
+
+    def _deduplicate(self, index: int, jobs: Iterable[Job]) -> Iterator[Job]:
+        """
+        跨 board 去重：重复职位保留爬虫下标最小的副本，结果与完成顺序无关
+
+        较小下标的副本晚到时只替换已记录的副本（过滤只看标题，判定不变），
+        不再重复产出；已交给通知任务的仍是先到的副本。
+        """
+        for job in jobs:
+            unique_id = job.unique_id
+            kept = self._seen.get(unique_id)
+            if kept is None:
+                self._seen[unique_id] = index
+                yield job
+            elif index < kept:
+                self._seen[unique_id] = index
+                if unique_id in self._filtered:
+                    self._filtered[unique_id] = (index, job)
+                position = self._new_positions.get(unique_id)
+                if position is not None:
+                    self.new_jobs[position] = job
+
+    def _keep(self, index: int, jobs: Iterable[Job]) -> Iterator[Job]:
+        """保留通过过滤的职位（供 Dashboard 使用）"""
+        for job in jobs:
+            self._filtered[job.unique_id] = (index, job)
+            yield job
+
+    def process(self, index: int, jobs: Iterable[Job]) -> Iterator[Job]:
+        """
+        处理一批职位
+
+        Args:
+            index: 产生这批职位的爬虫下标
+            jobs: 职位列表
+
+        Yields:
+            新职位
+        """
+        self._source_indexes.add(index)
+        stream = self._deduplicate(index, self._count(jobs))
+        stream = self._keep(index, filter_stream(stream, self.job_filter))
+        for job in detect_new(stream, self.storage):
+            self._new_positions[job.unique_id] = len(self.new_jobs)
+            self.new_jobs.append(job)
+            yield job
+
+    @property
+    def unique(self) -> int:
+        """去重后的职位数"""
+        return len(self._seen)
+
+    @property
+    def filtered_jobs(self) -> list[Job]:
+        """通过过滤的职位（按爬虫顺序排列，保证 Dashboard 输出确定）"""
+        return [job for _, job in sorted(self._filtered.values(), key=lambda item: item[0])]
+
+    def get_sources(self, scrapers: list) -> list[str]:
+        """
+        获取产出过职位的数据源名称（按爬虫顺序）
+
+        Args:
+            scrapers: 爬虫列表
+
+        Returns:
+            数据源名称列表
+        """
+        return [
+            scraper.source_name
+            for index, scraper in enumerate(scrapers)
+            if index in self._source_indexes
+        ]
+
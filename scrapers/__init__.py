@@ -1,32 +1,81 @@
 """
 爬虫模块
 """
+from typing import Optional
+
 from .base import BaseScraper, Job
 from .getro import (
+    ApiScraper,
     GreenhouseScraper,
     AshbyScraper,
     LeverScraper,
     WorkableScraper,
+    PortfolioBoardScraper,
+    GetroScraper,
+    ConsiderScraper,
     create_getro_scrapers,
     create_vc_portfolio_scrapers,
 )
+from .cache import ResponseCache, DetailCache, get_default_cache, get_default_detail_cache
+from .engine import (
+    ScrapeEngine,
+    stream_jobs_async,
+    enrich_jobs_async,
+    apply_cached_details,
+)
+from http_utils import RetryPolicy, TokenBucket
+from .retry import CircuitBreaker, get_default_circuit_breaker
+from .http import (
+    HttpTransport,
+    get_default_transport,
+    set_default_transport,
+    get_client_session,
+    close_client_session,
+)
 
 
-def create_all_scrapers() -> list[BaseScraper]:
-    """创建所有爬虫"""
+def create_all_scrapers(transport: Optional[HttpTransport] = None) -> list[BaseScraper]:
+    """
+    创建所有爬虫
+    
+    Args:
+        transport: HTTP 传输层（默认使用共享传输层）
+    """
     scrapers = []
-    scrapers.extend(create_vc_portfolio_scrapers())
+    scrapers.extend(create_vc_portfolio_scrapers(transport))
+    scrapers.extend(create_getro_scrapers(transport))
     return scrapers
 
 
 __all__ = [
     "BaseScraper",
     "Job",
+    "ApiScraper",
     "GreenhouseScraper",
     "AshbyScraper",
     "LeverScraper",
     "WorkableScraper",
+    "PortfolioBoardScraper",
+    "GetroScraper",
+    "ConsiderScraper",
     "create_getro_scrapers",
     "create_vc_portfolio_scrapers",
     "create_all_scrapers",
+    "ScrapeEngine",
+    "stream_jobs_async",
+    "enrich_jobs_async",
+    "apply_cached_details",
+    "ResponseCache",
+    "DetailCache",
+    "get_default_cache",
+    "get_default_detail_cache",
+    "RetryPolicy",
+    "TokenBucket",
+    "CircuitBreaker",
+    "get_default_circuit_breaker",
+    "HttpTransport",
+    "get_default_transport",
+    "set_default_transport",
+    "get_client_session",
+    "close_client_session",
 ]
\ No newline at end of file
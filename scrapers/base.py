@@ -2,18 +2,28 @@
 爬虫基类和 Job 数据模型
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
+import asyncio
 import hashlib
 import logging
 
+from .http import HttpTransport, get_default_transport
+from .retry import CircuitBreaker
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
-    """职位数据模型"""
+    """
+    职位数据模型
+    
+    使用 __slots__ 减少每个对象的内存占用；unique_id 首次访问时计算并缓存 16 字节的 md5 摘要
+    （比缓存 32 字符的十六进制字符串小），读取时再转为十六进制，
+    因此 title / company / url 创建后不应再修改。
+    """
     
     # 必填字段
     title: str
@@ -28,20 +38,26 @@ class Job:
     remote: bool = False
     description: str = ""
     posted_date: str = ""
+    external_id: str = ""  # ATS 平台内部的职位 ID（用于按需获取详情）
     
     # 元数据
     scraped_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     
+    # unique_id 的摘要缓存（不参与初始化、比较和序列化）
+    _digest: bytes = field(default=b"", init=False, repr=False, compare=False)
+    
     @property
     def unique_id(self) -> str:
         """生成唯一标识符，用于去重"""
-        # 使用 title + company + url 生成唯一ID
-        key = f"{self.title.lower()}|{self.company.lower()}|{self.url}"
-        return hashlib.md5(key.encode()).hexdigest()
+        if not self._digest:
+            # 使用 title + company + url 生成唯一ID
+            key = f"{self.title.lower()}|{self.company.lower()}|{self.url}"
+            self._digest = hashlib.md5(key.encode()).digest()
+        return self._digest.hex()
     
     def to_dict(self) -> dict:
         """转换为字典"""
-        data = asdict(self)
+        data = {name: getattr(self, name) for name in _JOB_FIELDS}
         data["unique_id"] = self.unique_id
         return data
     
@@ -51,90 +67,39 @@ class Job:
         # 移除 unique_id，因为它是计算属性
         data = {k: v for k, v in data.items() if k != "unique_id"}
         return cls(**data)
-    
-    def format_telegram_message(self) -> str:
-        """格式化为 Telegram 消息"""
-        lines = [
-            f"📌 <b>{self._escape_html(self.title)}</b>",
-            f"🏢 {self._escape_html(self.company)}",
-            f"📂 <i>via {self._escape_html(self.source)}</i>",
-        ]
-        
-        if self.location:
-            location_text = self.location
-            if self.remote:
-                location_text += " (Remote OK)"
-            lines.append(f"📍 {self._escape_html(location_text)}")
-        elif self.remote:
-            lines.append("📍 Remote")
-        
-        if self.salary:
-            lines.append(f"💰 {self._escape_html(self.salary)}")
-        
-        if self.job_type:
-            lines.append(f"⏰ {self._escape_html(self.job_type)}")
-        
-        lines.extend([
-            "",
-            f"🔗 <a href=\"{self.url}\">Apply Now</a>",
-        ])
-        
-        # 添加标签
-        tags = self._generate_tags()
-        if tags:
-            lines.extend(["", tags])
-        
-        return "\n".join(lines)
-    
-    def _escape_html(self, text: str) -> str:
-        """转义 HTML 特殊字符"""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
-    
-    def _generate_tags(self) -> str:
-        """生成标签"""
-        tags = ["#crypto", "#web3"]
-        
-        title_lower = self.title.lower()
-        
-        if any(kw in title_lower for kw in ["research", "analyst"]):
-            tags.append("#research")
-        if any(kw in title_lower for kw in ["invest", "vc", "venture", "principal"]):
-            tags.append("#investment")
-        if any(kw in title_lower for kw in ["strateg"]):
-            tags.append("#strategy")
-        if any(kw in title_lower for kw in ["operation", "ops"]):
-            tags.append("#operations")
-        if any(kw in title_lower for kw in ["business development", " bd ", "partner"]):
-            tags.append("#bizdev")
-        if any(kw in title_lower for kw in ["growth", "marketing"]):
-            tags.append("#growth")
-        if any(kw in title_lower for kw in ["product"]):
-            tags.append("#product")
-        if any(kw in title_lower for kw in ["community"]):
-            tags.append("#community")
-        
-        return " ".join(tags[:5])  # 最多5个标签
+
+
+_JOB_FIELDS = tuple(f.name for f in fields(Job) if f.init)
 
 
 class BaseScraper(ABC):
     """爬虫基类"""
     
-    def __init__(self, name: str, source_name: str):
+    def __init__(
+        self,
+        name: str,
+        source_name: str,
+        transport: Optional[HttpTransport] = None
+    ):
         """
         初始化爬虫
         
         Args:
             name: 爬虫名称（用于日志）
             source_name: 数据源名称（显示在消息中）
+            transport: HTTP 传输层（默认使用共享传输层）
         """
         self.name = name
         self.source_name = source_name
+        self._transport = transport
+        self.circuit_breaker: Optional[CircuitBreaker] = None  # 子类按需启用熔断
         self.logger = logging.getLogger(f"scraper.{name}")
     
+    @property
+    def transport(self) -> HttpTransport:
+        """HTTP 传输层（未注入时使用共享传输层）"""
+        return self._transport or get_default_transport()
+    
     @abstractmethod
     def fetch_jobs(self) -> list[Job]:
         """
@@ -160,3 +125,121 @@ class BaseScraper(ABC):
         except Exception as e:
             self.logger.error(f"Error scraping {self.name}: {e}")
             return []
+    
+    def _circuit_open(self) -> bool:
+        """检查熔断器，处于冷却期时跳过本次爬取"""
+        if self.circuit_breaker and not self.circuit_breaker.allow(self.name):
+            self.logger.info(f"Circuit open, skipping {self.name}")
+            return True
+        return False
+    
+    def _record_outcome(self, success: bool):
+        """向熔断器报告本次爬取结果"""
+        if not self.circuit_breaker:
+            return
+        if success:
+            self.circuit_breaker.record_success(self.name)
+        else:
+            self.circuit_breaker.record_failure(self.name)
+    
+    def owns(self, job: Job) -> bool:
+        """
+        判断职位是否来自本爬虫
+        
+        Args:
+            job: Job 对象
+        
+        Returns:
+            True 如果职位由本爬虫产生
+        """
+        return job.source == self.source_name
+    
+    def enrich_jobs(self, jobs: list[Job]) -> list[Job]:
+        """
+        补充职位详情（列表接口未返回的字段）
+        
+        默认不做任何事，需要二次请求详情的爬虫可覆盖。
+        
+        Args:
+            jobs: 本爬虫产生的职位列表
+        
+        Returns:
+            补充详情后的职位列表
+        """
+        return jobs
+    
+    async def enrich_jobs_async(self, jobs: list[Job], session=None) -> list[Job]:
+        """
+        异步补充职位详情
+        
+        默认在线程中运行同步 enrich_jobs。
+        
+        Args:
+            jobs: 本爬虫产生的职位列表
+            session: aiohttp.ClientSession（默认使用传输层的会话）
+        
+        Returns:
+            补充详情后的职位列表
+        """
+        return await asyncio.to_thread(self.enrich_jobs, jobs)
+    
+    def apply_cached_details(self, jobs: list[Job]) -> list[Job]:
+        """
+        只用已缓存的详情补充职位（不发送请求，供 Dashboard 使用）
+        
+        默认不做任何事，需要二次请求详情的爬虫可覆盖。
+        
+        Args:
+            jobs: 本爬虫产生的职位列表
+        
+        Returns:
+            补充详情后的职位列表
+        """
+        return jobs
+
+    async def fetch_jobs_async(self, session=None) -> list[Job]:
+        """
+        异步获取职位列表
+
+        默认在线程中运行同步 fetch_jobs，子类可覆盖为原生异步实现。
+
+        Args:
+            session: aiohttp.ClientSession（默认使用传输层的会话）
+
+        Returns:
+            Job 对象列表
+        """
+        return await asyncio.to_thread(self.fetch_jobs)
+
+    async def scrape_async(self, session=None) -> list[Job]:
+        """
+        异步执行爬取（带错误处理）
+
+        Args:
+            session: aiohttp.ClientSession（默认使用传输层的会话）
+
+        Returns:
+            Job 对象列表
+        """
+        try:
+            self.logger.info(f"Starting scrape: {self.name}")
+            jobs = await self.fetch_jobs_async(session)
+            self.logger.info(f"Scraped {len(jobs)} jobs from {self.name}")
+            return jobs
+        except Exception as e:
+            self.logger.error(f"Error scraping {self.name}: {e}")
+            return []
+
+    async def stream_async(self, session=None) -> AsyncIterator[list[Job]]:
+        """
+        逐批产出职位（默认整个 board 作为一批）
+        
+        Args:
+            session: aiohttp.ClientSession（默认使用传输层的会话）
+        
+        Yields:
+            职位列表
+        """
+        jobs = await self.scrape_async(session)
+        if jobs:
+            yield jobs
@@ -0,0 +1,323 @@
+"""
+HTTP 校验缓存
+
+为每个爬虫记录上次响应的 ETag / Last-Modified / 响应体哈希，
+以及上次解析出的职位列表：
+- 下次请求带上 If-None-Match / If-Modified-Since
+- 收到 304 或响应体哈希不变时，直接复用上次的职位列表，跳过解析
+
+大多数整点运行都没有新职位，这样可以省掉绝大部分下载和解析开销。
+
+DetailCache 缓存按需获取的职位详情（如 Greenhouse 的部门信息），
+同一职位只请求一次详情。
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from .base import Job
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def request_fingerprint(request: dict[str, Any]) -> str:
+    """
+    计算请求参数指纹（请求参数变化时缓存失效）
+
+    Args:
+        request: build_request() 返回的请求参数
+
+    Returns:
+        十六进制指纹
+    """
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def body_hash(body: bytes) -> str:
+    """计算响应体哈希"""
+    return hashlib.sha256(body).hexdigest()
+
+
+class ResponseCache:
+    """HTTP 校验缓存（按爬虫名称存储）"""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        初始化缓存
+
+        Args:
+            cache_file: 缓存文件路径（默认使用配置）
+        """
+        self.cache_file = cache_file or config.HTTP_CACHE_FILE
+        self._entries: dict[str, dict] = {}
+        self._stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """从文件加载缓存"""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                self._entries = json.load(f).get("entries", {})
+            logger.debug(f"Loaded {len(self._entries)} HTTP cache entries")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load HTTP cache: {e}")
+            self._entries = {}
+
+    def save(self):
+        """保存到文件（无变化时跳过）"""
+        if not self._dirty:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"entries": self._entries, "updated_at": datetime.utcnow().isoformat()},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            self._dirty = False
+            logger.debug(f"Saved {len(self._entries)} HTTP cache entries")
+        except IOError as e:
+            logger.error(f"Failed to save HTTP cache: {e}")
+
+    def _get_entry(self, key: str, request: dict[str, Any]) -> Optional[dict]:
+        """获取与当前请求参数匹配的缓存条目"""
+        entry = self._entries.get(key)
+        if entry and entry.get("fingerprint") == request_fingerprint(request):
+            return entry
+        return None
+
+    def conditional_headers(self, key: str, request: dict[str, Any]) -> dict[str, str]:
+        """
+        生成条件请求头
+
+        Args:
+            key: 缓存键（爬虫名称）
+            request: 请求参数
+
+        Returns:
+            If-None-Match / If-Modified-Since 请求头（无缓存时为空）
+        """
+        entry = self._get_entry(key, request)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get_jobs(
+        self,
+        key: str,
+        request: dict[str, Any],
+        content_hash: Optional[str] = None
+    ) -> Optional[list[Job]]:
+        """
+        获取缓存的职位列表
+
+        Args:
+            key: 缓存键（爬虫名称）
+            request: 请求参数
+            content_hash: 响应体哈希（None 表示 304，无需比较）
+
+        Returns:
+            职位列表；未命中时返回 None
+        """
+        entry = self._get_entry(key, request)
+        if not entry:
+            return None
+        if content_hash is not None and entry.get("body_hash") != content_hash:
+            return None
+
+        return [Job.from_dict(data) for data in entry.get("jobs", [])]
+
+    def store(
+        self,
+        key: str,
+        request: dict[str, Any],
+        headers,
+        content_hash: str,
+        jobs: list[Job]
+    ):
+        """
+        保存响应校验信息和解析结果
+
+        Args:
+            key: 缓存键（爬虫名称）
+            request: 请求参数
+            headers: 响应头（大小写不敏感映射）
+            content_hash: 响应体哈希
+            jobs: 解析出的职位列表
+        """
+        entry = {
+            "fingerprint": request_fingerprint(request),
+            "etag": headers.get("ETag", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+            "body_hash": content_hash,
+            "jobs": [self._serialize(job) for job in jobs],
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def refresh_validators(self, key: str, headers):
+        """响应体未变但校验头更新时，刷新 ETag / Last-Modified"""
+        entry = self._entries.get(key)
+        if not entry:
+            return
+
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if (etag, last_modified) != (entry.get("etag"), entry.get("last_modified")):
+            with self._lock:
+                entry["etag"] = etag
+                entry["last_modified"] = last_modified
+                self._dirty = True
+
+    @staticmethod
+    def _serialize(job: Job) -> dict:
+        """序列化职位（去掉每次运行都会变化的字段）"""
+        data = job.to_dict()
+        data.pop("unique_id", None)
+        data.pop("scraped_at", None)
+        return data
+
+    def record(self, source: str, hit: bool):
+        """
+        记录一次缓存查询结果
+
+        Args:
+            source: 数据源名称
+            hit: 是否命中
+        """
+        with self._lock:
+            self._stats[source]["hits" if hit else "misses"] += 1
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        获取各数据源的缓存命中统计
+
+        Returns:
+            {数据源: {"hits": 命中次数, "misses": 未命中次数}}
+        """
+        return {source: dict(counts) for source, counts in sorted(self._stats.items())}
+
+
+class DetailCache:
+    """职位详情缓存（按职位键存储，过期自动清理）"""
+
+    def __init__(self, cache_file: Optional[Path] = None, max_age_days: Optional[int] = None):
+        """
+        初始化详情缓存
+
+        Args:
+            cache_file: 缓存文件路径（默认使用配置）
+            max_age_days: 条目最长保留天数（默认使用配置）
+        """
+        self.cache_file = cache_file or config.DETAIL_CACHE_FILE
+        self.max_age_days = max_age_days or config.DETAIL_CACHE_DAYS
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """从文件加载缓存"""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                self._entries = json.load(f).get("entries", {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load detail cache: {e}")
+            self._entries = {}
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        获取缓存的详情
+
+        Args:
+            key: 职位键
+
+        Returns:
+            详情字典；未命中时返回 None
+        """
+        entry = self._entries.get(key)
+        return entry.get("data") if entry else None
+
+    def put(self, key: str, data: dict):
+        """
+        保存详情
+
+        Args:
+            key: 职位键
+            data: 详情字典
+        """
+        with self._lock:
+            self._entries[key] = {
+                "data": data,
+                "fetched_at": datetime.utcnow().isoformat(),
+            }
+            self._dirty = True
+
+    def save(self):
+        """清理过期条目并保存到文件（无变化时跳过）"""
+        cutoff = (datetime.utcnow() - timedelta(days=self.max_age_days)).isoformat()
+        expired = [
+            key for key, entry in self._entries.items()
+            if entry.get("fetched_at", "") < cutoff
+        ]
+        for key in expired:
+            del self._entries[key]
+        if not self._dirty and not expired:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({"entries": self._entries}, f, ensure_ascii=False, separators=(",", ":"))
+            self._dirty = False
+        except IOError as e:
+            logger.error(f"Failed to save detail cache: {e}")
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_detail_cache: Optional[DetailCache] = None
+
+
+def get_default_cache() -> Optional[ResponseCache]:
+    """获取默认的共享缓存（配置关闭时返回 None）"""
+    global _default_cache
+
+    if not config.HTTP_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        _default_cache = ResponseCache()
+    return _default_cache
+
+
+def get_default_detail_cache() -> DetailCache:
+    """获取默认的共享详情缓存"""
+    global _default_detail_cache
+
+    if _default_detail_cache is None:
+        _default_detail_cache = DetailCache()
+    return _default_detail_cache
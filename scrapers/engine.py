@@ -0,0 +1,188 @@
+"""
+并发爬取引擎
+
+并发执行所有爬虫，同时限制：
+- 全局并发数（同时进行的爬虫数量）
+- 每个 ATS 主机的并发数（避免同时打爆 boards-api.greenhouse.io 等单一主机）
+
+在事件循环中运行（同步爬虫在线程中执行），每批职位一到就流式产出（stream_async），
+下游无需等待最慢的 board 即可开始处理。
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+
+from .base import BaseScraper, Job
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def get_scraper_host(scraper: BaseScraper) -> str:
+    """
+    获取爬虫请求的主机名（用于按主机限流）
+
+    Args:
+        scraper: 爬虫实例
+
+    Returns:
+        主机名；无 api_url 的爬虫使用爬虫名称
+    """
+    api_url = getattr(scraper, "api_url", "")
+    return urlparse(api_url).netloc or scraper.name
+
+
+class ScrapeEngine:
+    """并发爬取引擎"""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_host: Optional[int] = None
+    ):
+        """
+        初始化爬取引擎
+
+        Args:
+            max_concurrency: 全局最大并发数（默认使用配置）
+            max_per_host: 每个主机最大并发数（默认使用配置）
+        """
+        self.max_concurrency = max_concurrency or config.MAX_CONCURRENT_SCRAPERS
+        self.max_per_host = max_per_host or config.MAX_CONCURRENT_PER_HOST
+
+    async def stream_async(
+        self,
+        scrapers: list[BaseScraper],
+        session=None
+    ) -> AsyncIterator[tuple[int, list[Job]]]:
+        """
+        在事件循环中并发执行所有爬虫，每批职位一到就产出
+
+        普通 board 整个作为一批，分页 board 每页一批，
+        下游无需等待最慢的 board 即可开始处理。
+
+        Args:
+            scrapers: 爬虫列表
+            session: aiohttp.ClientSession（默认各爬虫使用自己传输层的会话）
+
+        Yields:
+            (爬虫下标, 职位列表)，按完成顺序
+        """
+        if not scrapers:
+            return
+
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits = {
+            get_scraper_host(scraper): asyncio.Semaphore(self.max_per_host)
+            for scraper in scrapers
+        }
+        queue: asyncio.Queue[tuple[int, Optional[list[Job]]]] = asyncio.Queue()
+
+        async def scrape_one(index: int, scraper: BaseScraper):
+            try:
+                async with host_limits[get_scraper_host(scraper)], global_limit:
+                    async for jobs in scraper.stream_async(session):
+                        await queue.put((index, jobs))
+            finally:
+                # None 表示该爬虫已结束
+                await queue.put((index, None))
+
+        logger.info(
+            f"Scraping {len(scrapers)} sources "
+            f"(concurrency={self.max_concurrency}, per_host={self.max_per_host})"
+        )
+
+        tasks = [
+            asyncio.create_task(scrape_one(index, scraper))
+            for index, scraper in enumerate(scrapers)
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                index, jobs = await queue.get()
+                if jobs is None:
+                    remaining -= 1
+                elif jobs:
+                    yield index, jobs
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def stream_jobs_async(
+    scrapers: list[BaseScraper],
+    max_concurrency: Optional[int] = None,
+    max_per_host: Optional[int] = None,
+    session=None
+) -> AsyncIterator[tuple[int, list[Job]]]:
+    """
+    流式收集职位（便捷函数）
+
+    Args:
+        scrapers: 爬虫列表
+        max_concurrency: 全局最大并发数
+        max_per_host: 每个主机最大并发数
+        session: aiohttp.ClientSession（默认各爬虫使用自己传输层的会话）
+
+    Yields:
+        (爬虫下标, 职位列表)，按完成顺序
+    """
+    engine = ScrapeEngine(max_concurrency, max_per_host)
+    async for index, jobs in engine.stream_async(scrapers, session):
+        yield index, jobs
+
+
+def _group_by_scraper(
+    scrapers: list[BaseScraper],
+    jobs: list[Job]
+) -> list[tuple[BaseScraper, list[Job]]]:
+    """把职位分配给产生它的爬虫"""
+    groups: dict[int, list[Job]] = defaultdict(list)
+    for job in jobs:
+        for index, scraper in enumerate(scrapers):
+            if scraper.owns(job):
+                groups[index].append(job)
+                break
+
+    return [(scrapers[index], owned) for index, owned in groups.items()]
+
+
+async def enrich_jobs_async(
+    scrapers: list[BaseScraper],
+    jobs: list[Job],
+    session=None
+) -> list[Job]:
+    """
+    在事件循环中为职位按需补充详情（只应对通过过滤的新职位调用）
+
+    Args:
+        scrapers: 爬虫列表
+        jobs: 需要补充详情的职位
+        session: aiohttp.ClientSession（默认各爬虫使用自己传输层的会话）
+
+    Returns:
+        原职位列表（详情已就地补充）
+    """
+    await asyncio.gather(*(
+        scraper.enrich_jobs_async(owned, session)
+        for scraper, owned in _group_by_scraper(scrapers, jobs)
+    ))
+    return jobs
+
+
+def apply_cached_details(scrapers: list[BaseScraper], jobs: list[Job]) -> list[Job]:
+    """
+    用已缓存的详情补充职位（不发送请求，供 Dashboard 显示部门）
+
+    Args:
+        scrapers: 爬虫列表
+        jobs: 职位列表
+
+    Returns:
+        原职位列表（已缓存的详情已就地补充）
+    """
+    for scraper, owned in _group_by_scraper(scrapers, jobs):
+        scraper.apply_cached_details(owned)
+    return jobs
@@ -5,241 +5,425 @@
 - Greenhouse API: 大多数加密公司使用
 - Ashby API: 新兴 ATS，Paradigm 等使用
 - Lever API: 部分公司使用
+- Getro / Consider: VC 投资组合聚合 Job Board（config.GETRO_BOARDS）
 """
-import requests
-import time
-import re
-from typing import Optional
+import asyncio
+import json
+import logging
+import math
+from abc import abstractmethod
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterator, NamedTuple, Optional
 from bs4 import BeautifulSoup
 
 from .base import BaseScraper, Job
+from .cache import ResponseCache, body_hash, get_default_cache, get_default_detail_cache
+from .http import HttpTransport
+from .retry import get_default_circuit_breaker
 import config
 
+logger = logging.getLogger(__name__)
 
-class GreenhouseScraper(BaseScraper):
+
+class ApiScraper(BaseScraper):
     """
-    Greenhouse Job Board API 爬虫
+    JSON API 爬虫基类
     
-    公共 API 文档: https://developers.greenhouse.io/job-board.html
-    API 格式: https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs
+    子类只需描述请求（build_request）和解析响应（parse_jobs），
+    同步（requests）和异步（aiohttp）两条路径共用同一套逻辑。
+    设置 cache 后自动使用条件请求并复用未变化的解析结果。
+    连续失败的 board 由 circuit_breaker 熔断，冷却期内直接跳过。
     """
     
-    def __init__(self, company_name: str, board_token: str, source_name: str = None):
-        super().__init__(
-            name=f"greenhouse_{board_token}",
-            source_name=source_name or company_name
-        )
+    platform = ""  # 平台名称（用于日志）
+    
+    def __init__(
+        self,
+        name: str,
+        source_name: str,
+        company_name: str,
+        slug: str,
+        api_url: str,
+        transport: Optional[HttpTransport] = None
+    ):
+        super().__init__(name=name, source_name=source_name, transport=transport)
         self.company_name = company_name
-        self.board_token = board_token
-        self.api_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
+        self.slug = slug
+        self.api_url = api_url
+        self.cache: Optional[ResponseCache] = get_default_cache()
+        self.circuit_breaker = get_default_circuit_breaker()
+    
+    def owns(self, job: Job) -> bool:
+        return job.source == self.source_name and job.company == self.company_name
+    
+    def build_request(self) -> dict[str, Any]:
+        """
+        构建请求参数（requests 与 aiohttp 通用）
+        
+        Returns:
+            包含 method, url, params, json, headers 的字典
+        """
+        return {
+            "method": "GET",
+            "url": self.api_url,
+            "headers": {"Accept": "application/json"},
+        }
+    
+    @abstractmethod
+    def parse_jobs(self, data: Any) -> list[Job]:
+        """
+        解析 API 响应
+        
+        Args:
+            data: 解码后的 JSON 数据
+        
+        Returns:
+            Job 对象列表
+        """
+        pass
+    
+    def _with_validators(self, request: dict[str, Any]) -> dict[str, Any]:
+        """为请求附加条件请求头（If-None-Match / If-Modified-Since）"""
+        if not self.cache:
+            return request
+        
+        validators = self.cache.conditional_headers(self.name, request)
+        if not validators:
+            return request
+        return {**request, "headers": {**request.get("headers", {}), **validators}}
+    
+    def _process_response(
+        self,
+        request: dict[str, Any],
+        status: int,
+        headers,
+        body: bytes
+    ) -> list[Job]:
+        """
+        处理响应（同步/异步路径共用）
+        
+        304 或响应体哈希不变时直接复用缓存的职位列表，否则解析并写入缓存。
+        
+        Args:
+            request: 原始请求参数（不含条件请求头）
+            status: HTTP 状态码
+            headers: 响应头
+            body: 响应体
+        
+        Returns:
+            Job 对象列表
+        """
+        if status == 304 and self.cache:
+            jobs = self.cache.get_jobs(self.name, request)
+            if jobs is not None:
+                self.cache.record(self.source_name, hit=True)
+                self._record_outcome(True)
+                self.logger.info(f"[{self.slug}] Not modified, reused {len(jobs)} cached jobs")
+                return jobs
+        
+        if status != 200:
+            self._record_outcome(False)
+            self.logger.warning(f"[{self.slug}] HTTP {status}")
+            return []
+        
+        content_hash = None
+        if self.cache:
+            content_hash = body_hash(body)
+            jobs = self.cache.get_jobs(self.name, request, content_hash)
+            if jobs is not None:
+                self.cache.refresh_validators(self.name, headers)
+                self.cache.record(self.source_name, hit=True)
+                self._record_outcome(True)
+                self.logger.info(f"[{self.slug}] Unchanged body, reused {len(jobs)} cached jobs")
+                return jobs
+        
+        jobs = self.parse_jobs(json.loads(body))
+        
+        if self.cache:
+            self.cache.store(self.name, request, headers, content_hash, jobs)
+            self.cache.record(self.source_name, hit=False)
+        
+        self._record_outcome(True)
+        self.logger.info(f"[{self.slug}] Found {len(jobs)} jobs via {self.platform} API")
+        return jobs
     
     def fetch_jobs(self) -> list[Job]:
         """获取职位列表"""
         jobs = []
         
+        if self._circuit_open():
+            return jobs
+        
         try:
-            # Greenhouse API 支持 content=true 参数获取完整职位描述
-            response = requests.get(
-                self.api_url,
-                params={"content": "true"},
-                headers={"Accept": "application/json"},
-                timeout=config.REQUEST_TIMEOUT
+            request = self.build_request()
+            response = self.transport.request(**self._with_validators(request))
+            jobs = self._process_response(
+                request, response.status_code, response.headers, response.content
             )
             
-            if response.status_code != 200:
-                self.logger.warning(f"[{self.board_token}] HTTP {response.status_code}")
-                return []
-            
-            data = response.json()
-            job_list = data.get("jobs", [])
-            
-            for job_data in job_list:
-                title = job_data.get("title", "")
-                job_id = job_data.get("id")
-                absolute_url = job_data.get("absolute_url", "")
-                
-                if not title or not absolute_url:
-                    continue
-                
-                # 提取地点
-                location_data = job_data.get("location", {})
-                location = location_data.get("name", "") if isinstance(location_data, dict) else ""
-                
-                # 提取部门
-                departments = job_data.get("departments", [])
-                department = departments[0].get("name", "") if departments else ""
-                
-                # 检查是否远程
-                remote = "remote" in location.lower() if location else False
-                
-                jobs.append(Job(
-                    title=title,
-                    company=self.company_name,
-                    url=absolute_url,
-                    source=self.source_name,
-                    location=location,
-                    remote=remote,
-                    description=department,  # 用部门作为额外信息
-                ))
+        except Exception as e:
+            self._record_outcome(False)
+            self.logger.error(f"[{self.slug}] {self.platform} API error: {e}")
+        
+        return jobs
+    
+    async def fetch_jobs_async(self, session=None) -> list[Job]:
+        """异步获取职位列表（通过传输层的 aiohttp 连接池）"""
+        jobs = []
+        
+        if self._circuit_open():
+            return jobs
+        
+        try:
+            request = self.build_request()
+            async with self.transport.request_async(
+                session=session,
+                **self._with_validators(request)
+            ) as response:
+                status = response.status
+                headers = response.headers
+                body = await response.read()
             
-            self.logger.info(f"[{self.board_token}] Found {len(jobs)} jobs via Greenhouse API")
+            jobs = self._process_response(request, status, headers, body)
             
         except Exception as e:
-            self.logger.error(f"[{self.board_token}] Greenhouse API error: {e}")
+            self._record_outcome(False)
+            self.logger.error(f"[{self.slug}] {self.platform} API error: {e!r}")
         
         return jobs
 
 
-class AshbyScraper(BaseScraper):
+class GreenhouseScraper(ApiScraper):
     """
-    Ashby Job Board API 爬虫
+    Greenhouse Job Board API 爬虫
     
-    API 格式: https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams
+    公共 API 文档: https://developers.greenhouse.io/job-board.html
+    API 格式: https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs
+    
+    两级获取：
+    - 列表接口（不带 content=true）只用于检测新职位
+    - 详情接口 /jobs/{id} 只为通过过滤的新职位按需请求，并写入详情缓存
     """
     
-    def __init__(self, company_name: str, board_slug: str, source_name: str = None):
+    platform = "Greenhouse"
+    
+    def __init__(
+        self,
+        company_name: str,
+        board_token: str,
+        source_name: str = None,
+        transport: Optional[HttpTransport] = None
+    ):
         super().__init__(
-            name=f"ashby_{board_slug}",
-            source_name=source_name or company_name
+            name=f"greenhouse_{board_token}",
+            source_name=source_name or company_name,
+            company_name=company_name,
+            slug=board_token,
+            api_url=f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs",
+            transport=transport,
         )
-        self.company_name = company_name
-        self.board_slug = board_slug
-        self.api_url = "https://jobs.ashbyhq.com/api/non-user-graphql"
+        self.board_token = board_token
+        self.detail_cache = get_default_detail_cache()
     
-    def fetch_jobs(self) -> list[Job]:
-        """获取职位列表"""
+    def parse_jobs(self, data: Any) -> list[Job]:
+        # 列表接口不带 content=true：不返回职位描述和部门，体积小得多
         jobs = []
         
-        try:
-            # Ashby 使用 GraphQL API
-            query = {
-                "operationName": "ApiJobBoardWithTeams",
-                "variables": {
-                    "organizationHostedJobsPageName": self.board_slug
-                },
-                "query": """
-                query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
-                    jobBoard: jobBoardWithTeams(
-                        organizationHostedJobsPageName: $organizationHostedJobsPageName
-                    ) {
-                        teams {
-                            name
-                            jobs {
-                                id
-                                title
-                                locationName
-                                employmentType
-                                isRemote
-                            }
-                        }
-                    }
-                }
-                """
-            }
+        for job_data in data.get("jobs", []):
+            title = job_data.get("title", "")
+            job_id = job_data.get("id")
+            absolute_url = job_data.get("absolute_url", "")
             
-            response = requests.post(
-                self.api_url,
-                json=query,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
-                timeout=config.REQUEST_TIMEOUT
-            )
+            if not title or not absolute_url:
+                continue
             
-            if response.status_code != 200:
-                self.logger.warning(f"[{self.board_slug}] HTTP {response.status_code}")
-                return []
+            # 提取地点
+            location_data = job_data.get("location", {})
+            location = location_data.get("name", "") if isinstance(location_data, dict) else ""
             
-            data = response.json()
-            job_board = data.get("data", {}).get("jobBoard", {})
-            teams = job_board.get("teams", []) if job_board else []
+            # 检查是否远程
+            remote = "remote" in location.lower() if location else False
             
-            for team in teams:
-                team_name = team.get("name", "")
-                team_jobs = team.get("jobs", [])
-                
-                for job_data in team_jobs:
-                    title = job_data.get("title", "")
-                    job_id = job_data.get("id", "")
-                    location = job_data.get("locationName", "")
-                    employment_type = job_data.get("employmentType", "")
-                    is_remote = job_data.get("isRemote", False)
-                    
-                    if not title or not job_id:
-                        continue
-                    
-                    # 构建职位 URL
-                    job_url = f"https://jobs.ashbyhq.com/{self.board_slug}/{job_id}"
-                    
-                    jobs.append(Job(
-                        title=title,
-                        company=self.company_name,
-                        url=job_url,
-                        source=self.source_name,
-                        location=location,
-                        remote=is_remote,
-                        job_type=employment_type,
-                        description=team_name,  # 用团队名作为额外信息
-                    ))
+            jobs.append(Job(
+                title=title,
+                company=self.company_name,
+                url=absolute_url,
+                source=self.source_name,
+                location=location,
+                remote=remote,
+                external_id=str(job_id) if job_id is not None else "",
+            ))
+        
+        return jobs
+    
+    def _detail_key(self, job: Job) -> str:
+        """详情缓存键"""
+        return f"{self.name}:{job.external_id}"
+    
+    def _detail_url(self, job: Job) -> str:
+        """单个职位详情接口"""
+        return f"{self.api_url}/{job.external_id}"
+    
+    @staticmethod
+    def _parse_detail(data: dict) -> dict:
+        """从详情响应中提取需要的字段"""
+        departments = data.get("departments", [])
+        return {"department": departments[0].get("name", "") if departments else ""}
+    
+    def _apply_detail(self, job: Job, detail: dict):
+        """把详情写回 Job"""
+        job.description = detail.get("department", "")  # 用部门作为额外信息
+    
+    def _pending_jobs(self, jobs: list[Job]) -> list[Job]:
+        """应用已缓存的详情，返回仍需请求详情的职位"""
+        pending = []
+        for job in jobs:
+            if not job.external_id:
+                continue
+            detail = self.detail_cache.get(self._detail_key(job))
+            if detail is None:
+                pending.append(job)
+            else:
+                self._apply_detail(job, detail)
+        return pending
+    
+    def apply_cached_details(self, jobs: list[Job]) -> list[Job]:
+        """只用详情缓存补充部门（未缓存的职位保持不变）"""
+        self._pending_jobs(jobs)
+        return jobs
+    
+    def enrich_jobs(self, jobs: list[Job]) -> list[Job]:
+        """按需获取职位详情（部门），结果写入详情缓存"""
+        for job in self._pending_jobs(jobs):
+            try:
+                response = self.transport.request(
+                    "GET", self._detail_url(job), headers={"Accept": "application/json"}
+                )
+                if response.status_code != 200:
+                    self.logger.warning(f"[{self.board_token}] Detail HTTP {response.status_code}")
+                    continue
+                detail = self._parse_detail(response.json())
+            except Exception as e:
+                self.logger.error(f"[{self.board_token}] Detail fetch error: {e}")
+                continue
             
-            self.logger.info(f"[{self.board_slug}] Found {len(jobs)} jobs via Ashby API")
+            self.detail_cache.put(self._detail_key(job), detail)
+            self._apply_detail(job, detail)
+        
+        return jobs
+    
+    async def enrich_jobs_async(self, jobs: list[Job], session=None) -> list[Job]:
+        """异步按需获取职位详情（部门），结果写入详情缓存"""
+        
+        async def fetch_detail(job: Job):
+            try:
+                async with self.transport.request_async(
+                    "GET",
+                    self._detail_url(job),
+                    session=session,
+                    headers={"Accept": "application/json"},
+                ) as response:
+                    if response.status != 200:
+                        self.logger.warning(f"[{self.board_token}] Detail HTTP {response.status}")
+                        return
+                    detail = self._parse_detail(await response.json(content_type=None))
+            except Exception as e:
+                self.logger.error(f"[{self.board_token}] Detail fetch error: {e!r}")
+                return
             
-        except Exception as e:
-            self.logger.error(f"[{self.board_slug}] Ashby API error: {e}")
+            self.detail_cache.put(self._detail_key(job), detail)
+            self._apply_detail(job, detail)
         
+        await asyncio.gather(*(fetch_detail(job) for job in self._pending_jobs(jobs)))
         return jobs
 
 
-class LeverScraper(BaseScraper):
+class AshbyScraper(ApiScraper):
     """
-    Lever Job Board API 爬虫
+    Ashby Job Board API 爬虫
     
-    API 格式: https://api.lever.co/v0/postings/{company}
+    API 格式: https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams
     """
     
-    def __init__(self, company_name: str, lever_slug: str, source_name: str = None):
+    platform = "Ashby"
+    
+    def __init__(
+        self,
+        company_name: str,
+        board_slug: str,
+        source_name: str = None,
+        transport: Optional[HttpTransport] = None
+    ):
         super().__init__(
-            name=f"lever_{lever_slug}",
-            source_name=source_name or company_name
+            name=f"ashby_{board_slug}",
+            source_name=source_name or company_name,
+            company_name=company_name,
+            slug=board_slug,
+            api_url="https://jobs.ashbyhq.com/api/non-user-graphql",
+            transport=transport,
         )
-        self.company_name = company_name
-        self.lever_slug = lever_slug
-        self.api_url = f"https://api.lever.co/v0/postings/{lever_slug}"
+        self.board_slug = board_slug
     
-    def fetch_jobs(self) -> list[Job]:
-        """获取职位列表"""
+    def build_request(self) -> dict[str, Any]:
+        # Ashby 使用 GraphQL API
+        query = {
+            "operationName": "ApiJobBoardWithTeams",
+            "variables": {
+                "organizationHostedJobsPageName": self.board_slug
+            },
+            "query": """
+            query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
+                jobBoard: jobBoardWithTeams(
+                    organizationHostedJobsPageName: $organizationHostedJobsPageName
+                ) {
+                    teams {
+                        name
+                        jobs {
+                            id
+                            title
+                            locationName
+                            employmentType
+                            isRemote
+                        }
+                    }
+                }
+            }
+            """
+        }
+        
+        return {
+            "method": "POST",
+            "url": self.api_url,
+            "json": query,
+            "headers": {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        }
+    
+    def parse_jobs(self, data: Any) -> list[Job]:
         jobs = []
         
-        try:
-            response = requests.get(
-                self.api_url,
-                headers={"Accept": "application/json"},
-                timeout=config.REQUEST_TIMEOUT
-            )
-            
-            if response.status_code != 200:
-                self.logger.warning(f"[{self.lever_slug}] HTTP {response.status_code}")
-                return []
-            
-            job_list = response.json()
+        job_board = data.get("data", {}).get("jobBoard", {})
+        teams = job_board.get("teams", []) if job_board else []
+        
+        for team in teams:
+            team_name = team.get("name", "")
+            team_jobs = team.get("jobs", [])
             
-            for job_data in job_list:
-                title = job_data.get("text", "")
-                job_url = job_data.get("hostedUrl", "")
+            for job_data in team_jobs:
+                title = job_data.get("title", "")
+                job_id = job_data.get("id", "")
+                location = job_data.get("locationName", "")
+                employment_type = job_data.get("employmentType", "")
+                is_remote = job_data.get("isRemote", False)
                 
-                if not title or not job_url:
+                if not title or not job_id:
                     continue
                 
-                # 提取分类信息
-                categories = job_data.get("categories", {})
-                location = categories.get("location", "")
-                team = categories.get("team", "")
-                commitment = categories.get("commitment", "")  # Full-time, Part-time 等
-                
-                # 检查是否远程
-                workplace_type = job_data.get("workplaceType", "")
-                remote = workplace_type == "remote" or "remote" in location.lower()
+                # 构建职位 URL
+                job_url = f"https://jobs.ashbyhq.com/{self.board_slug}/{job_id}"
                 
                 jobs.append(Job(
                     title=title,
@@ -247,94 +431,556 @@ class LeverScraper(BaseScraper):
                     url=job_url,
                     source=self.source_name,
                     location=location,
-                    remote=remote,
-                    job_type=commitment,
-                    description=team,
+                    remote=is_remote,
+                    job_type=employment_type,
+                    description=team_name,  # 用团队名作为额外信息
+                    external_id=job_id,
                 ))
+        
+        return jobs
+
+
+class LeverScraper(ApiScraper):
+    """
+    Lever Job Board API 爬虫
+    
+    API 格式: https://api.lever.co/v0/postings/{company}
+    """
+    
+    platform = "Lever"
+    
+    def __init__(
+        self,
+        company_name: str,
+        lever_slug: str,
+        source_name: str = None,
+        transport: Optional[HttpTransport] = None
+    ):
+        super().__init__(
+            name=f"lever_{lever_slug}",
+            source_name=source_name or company_name,
+            company_name=company_name,
+            slug=lever_slug,
+            api_url=f"https://api.lever.co/v0/postings/{lever_slug}",
+            transport=transport,
+        )
+        self.lever_slug = lever_slug
+    
+    def parse_jobs(self, data: Any) -> list[Job]:
+        jobs = []
+        
+        for job_data in data:
+            title = job_data.get("text", "")
+            job_url = job_data.get("hostedUrl", "")
             
-            self.logger.info(f"[{self.lever_slug}] Found {len(jobs)} jobs via Lever API")
+            if not title or not job_url:
+                continue
             
-        except Exception as e:
-            self.logger.error(f"[{self.lever_slug}] Lever API error: {e}")
+            # 提取分类信息
+            categories = job_data.get("categories", {})
+            location = categories.get("location", "")
+            team = categories.get("team", "")
+            commitment = categories.get("commitment", "")  # Full-time, Part-time 等
+            
+            # 检查是否远程
+            workplace_type = job_data.get("workplaceType", "")
+            remote = workplace_type == "remote" or "remote" in location.lower()
+            
+            jobs.append(Job(
+                title=title,
+                company=self.company_name,
+                url=job_url,
+                source=self.source_name,
+                location=location,
+                remote=remote,
+                job_type=commitment,
+                description=team,
+                external_id=job_data.get("id", ""),
+            ))
         
         return jobs
 
 
-class WorkableScraper(BaseScraper):
+class WorkableScraper(ApiScraper):
     """
     Workable Job Board 爬虫
     
     API 格式: https://apply.workable.com/api/v1/widget/accounts/{subdomain}
     """
     
-    def __init__(self, company_name: str, subdomain: str, source_name: str = None):
+    platform = "Workable"
+    
+    def __init__(
+        self,
+        company_name: str,
+        subdomain: str,
+        source_name: str = None,
+        transport: Optional[HttpTransport] = None
+    ):
         super().__init__(
             name=f"workable_{subdomain}",
-            source_name=source_name or company_name
+            source_name=source_name or company_name,
+            company_name=company_name,
+            slug=subdomain,
+            api_url=f"https://apply.workable.com/api/v1/widget/accounts/{subdomain}",
+            transport=transport,
         )
-        self.company_name = company_name
         self.subdomain = subdomain
-        self.api_url = f"https://apply.workable.com/api/v1/widget/accounts/{subdomain}"
+    
+    def parse_jobs(self, data: Any) -> list[Job]:
+        jobs = []
+        
+        for job_data in data.get("jobs", []):
+            title = job_data.get("title", "")
+            shortcode = job_data.get("shortcode", "")
+            
+            if not title or not shortcode:
+                continue
+            
+            # 构建职位 URL
+            job_url = f"https://apply.workable.com/{self.subdomain}/j/{shortcode}/"
+            
+            # 提取地点
+            location_data = job_data.get("location", {})
+            city = location_data.get("city", "")
+            country = location_data.get("country", "")
+            location = f"{city}, {country}".strip(", ")
+            
+            # 检查远程
+            remote = job_data.get("remote", False)
+            
+            jobs.append(Job(
+                title=title,
+                company=self.company_name,
+                url=job_url,
+                source=self.source_name,
+                location=location,
+                remote=remote,
+                external_id=shortcode,
+            ))
+        
+        return jobs
+
+
+class BoardPage(NamedTuple):
+    """一页搜索结果"""
+    
+    jobs: list[Job]  # 解析出的职位
+    count: int  # 本页原始条目数（用于判断是否最后一页）
+    total: Optional[int] = None  # 职位总数（平台返回时）
+    cursor: Optional[str] = None  # 下一页游标（游标分页的平台）
+
+
+class PortfolioBoardScraper(BaseScraper):
+    """
+    VC 投资组合 Job Board 爬虫基类（分页 JSON 搜索接口）
+    
+    这些 board 每个都有上千个职位，按页获取：
+    - iter_pages / iter_pages_async 逐页产出职位，调用方可边取边处理
+    - 返回的页不足 page_size、达到总数或 max_pages 时提前结束
+    """
+    
+    platform = ""  # 平台名称（用于日志和爬虫名称）
+    uses_cursor = False  # 是否使用游标分页（无游标时结束）
+    
+    def __init__(
+        self,
+        board_key: str,
+        board_config: dict,
+        transport: Optional[HttpTransport] = None
+    ):
+        """
+        初始化爬虫
+        
+        Args:
+            board_key: config.GETRO_BOARDS 中的键
+            board_config: board 配置（name, base_url, platform 等）
+            transport: HTTP 传输层（默认使用共享传输层）
+        """
+        super().__init__(
+            name=f"{self.platform}_{board_key}",
+            source_name=board_config["name"],
+            transport=transport,
+        )
+        self.board_key = board_key
+        self.base_url = board_config["base_url"].rstrip("/")
+        self.page_size = config.PORTFOLIO_PAGE_SIZE
+        self.max_pages = config.PORTFOLIO_MAX_PAGES
+        self.circuit_breaker = get_default_circuit_breaker()
+    
+    def prepare(self):
+        """分页前的准备工作（如发现 board ID），默认无需准备"""
+        pass
+    
+    async def prepare_async(self, session=None):
+        """异步版 prepare"""
+        pass
+    
+    @abstractmethod
+    def build_page_request(self, page: int, cursor: Optional[str]) -> dict[str, Any]:
+        """
+        构建分页请求参数
+        
+        Args:
+            page: 页码（从 0 开始）
+            cursor: 上一页返回的游标（游标分页的平台使用）
+        
+        Returns:
+            包含 method, url, json, headers 的字典
+        """
+        pass
+    
+    @abstractmethod
+    def parse_page(self, data: Any) -> BoardPage:
+        """
+        解析一页响应
+        
+        Args:
+            data: 解码后的 JSON 数据
+        
+        Returns:
+            BoardPage
+        """
+        pass
+    
+    def _is_last_page(self, page: int, result: BoardPage) -> bool:
+        """判断是否可以提前结束分页"""
+        if result.count < self.page_size or page + 1 >= self.max_pages:
+            return True
+        if self.uses_cursor and not result.cursor:
+            return True
+        return result.total is not None and (page + 1) * self.page_size >= result.total
+    
+    def _request_page(self, page: int, cursor: Optional[str]) -> Any:
+        """同步请求一页"""
+        response = self.transport.request(**self.build_page_request(page, cursor))
+        response.raise_for_status()
+        return response.json()
+    
+    async def _request_page_async(self, page: int, cursor: Optional[str], session=None) -> Any:
+        """异步请求一页"""
+        request = self.build_page_request(page, cursor)
+        async with self.transport.request_async(session=session, **request) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+    
+    def iter_pages(self) -> Iterator[list[Job]]:
+        """
+        逐页获取职位（同步，顺序分页）
+        
+        Yields:
+            每页的职位列表
+        """
+        self.prepare()
+        cursor = None
+        
+        for page in range(self.max_pages):
+            result = self.parse_page(self._request_page(page, cursor))
+            yield result.jobs
+            if self._is_last_page(page, result):
+                break
+            cursor = result.cursor
+    
+    async def iter_pages_async(self, session=None) -> AsyncIterator[list[Job]]:
+        """
+        逐页获取职位（异步，默认顺序分页，支持随机访问的平台可覆盖为并发）
+        
+        Yields:
+            每页的职位列表
+        """
+        await self.prepare_async(session)
+        cursor = None
+        
+        for page in range(self.max_pages):
+            result = self.parse_page(await self._request_page_async(page, cursor, session))
+            yield result.jobs
+            if self._is_last_page(page, result):
+                break
+            cursor = result.cursor
     
     def fetch_jobs(self) -> list[Job]:
-        """获取职位列表"""
+        """获取职位列表（出错时保留已获取的页）"""
+        jobs = []
+        
+        if self._circuit_open():
+            return jobs
+        
+        try:
+            for page_jobs in self.iter_pages():
+                jobs.extend(page_jobs)
+            self._record_outcome(True)
+            self.logger.info(f"[{self.board_key}] Found {len(jobs)} jobs via {self.platform}")
+        except Exception as e:
+            self._record_outcome(False)
+            self.logger.error(f"[{self.board_key}] {self.platform} error after {len(jobs)} jobs: {e}")
+        
+        return jobs
+    
+    async def fetch_jobs_async(self, session=None) -> list[Job]:
+        """异步获取职位列表（出错时保留已获取的页）"""
         jobs = []
+        async for page_jobs in self.stream_async(session):
+            jobs.extend(page_jobs)
+        return jobs
+    
+    async def stream_async(self, session=None) -> AsyncIterator[list[Job]]:
+        """逐页产出职位（出错时结束，已产出的页保留）"""
+        if self._circuit_open():
+            return
         
+        count = 0
         try:
-            response = requests.get(
-                self.api_url,
-                headers={"Accept": "application/json"},
-                timeout=config.REQUEST_TIMEOUT
+            async for page_jobs in self.iter_pages_async(session):
+                count += len(page_jobs)
+                yield page_jobs
+            self._record_outcome(True)
+            self.logger.info(f"[{self.board_key}] Found {count} jobs via {self.platform}")
+        except Exception as e:
+            self._record_outcome(False)
+            self.logger.error(
+                f"[{self.board_key}] {self.platform} error after {count} jobs: {e!r}"
             )
+
+
+class GetroScraper(PortfolioBoardScraper):
+    """
+    Getro 平台 Job Board 爬虫
+    
+    board 页面的 __NEXT_DATA__ 中包含 collection ID（结果写入详情缓存，只需发现一次），
+    职位通过搜索接口按页获取：
+    POST https://api.getro.com/api/v2/collections/{collection_id}/search/jobs
+    
+    搜索接口支持按页码随机访问，异步路径以有限并发同时获取多页。
+    """
+    
+    platform = "getro"
+    
+    def __init__(
+        self,
+        board_key: str,
+        board_config: dict,
+        transport: Optional[HttpTransport] = None
+    ):
+        super().__init__(board_key, board_config, transport)
+        self.api_url = "https://api.getro.com/api/v2/collections"
+        self.collection_id = str(board_config.get("collection_id", ""))
+        self.page_concurrency = config.PORTFOLIO_PAGE_CONCURRENCY
+        self.detail_cache = get_default_detail_cache()
+    
+    @property
+    def _collection_cache_key(self) -> str:
+        return f"{self.name}:collection"
+    
+    def _load_cached_collection_id(self) -> bool:
+        """从缓存读取 collection ID"""
+        if not self.collection_id:
+            cached = self.detail_cache.get(self._collection_cache_key)
+            self.collection_id = cached.get("collection_id", "") if cached else ""
+        return bool(self.collection_id)
+    
+    def _parse_collection_id(self, html: str) -> str:
+        """从 board 页面的 __NEXT_DATA__ 中提取 collection ID"""
+        soup = BeautifulSoup(html, "html.parser")
+        script = soup.find("script", id="__NEXT_DATA__")
+        if not script or not script.string:
+            raise ValueError("__NEXT_DATA__ not found on board page")
+        
+        page_props = json.loads(script.string).get("props", {}).get("pageProps", {})
+        collection_id = (page_props.get("network") or {}).get("id")
+        if not collection_id:
+            raise ValueError("collection id not found in __NEXT_DATA__")
+        
+        collection_id = str(collection_id)
+        self.detail_cache.put(self._collection_cache_key, {"collection_id": collection_id})
+        return collection_id
+    
+    def prepare(self):
+        if self._load_cached_collection_id():
+            return
+        response = self.transport.request("GET", f"{self.base_url}/jobs")
+        response.raise_for_status()
+        self.collection_id = self._parse_collection_id(response.text)
+    
+    async def prepare_async(self, session=None):
+        if self._load_cached_collection_id():
+            return
+        async with self.transport.request_async(
+            "GET", f"{self.base_url}/jobs", session=session
+        ) as response:
+            response.raise_for_status()
+            html = await response.text()
+        self.collection_id = self._parse_collection_id(html)
+    
+    def build_page_request(self, page: int, cursor: Optional[str]) -> dict[str, Any]:
+        return {
+            "method": "POST",
+            "url": f"{self.api_url}/{self.collection_id}/search/jobs",
+            "json": {
+                "hitsPerPage": self.page_size,
+                "page": page,
+                "filters": "",
+                "query": "",
+            },
+            "headers": {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        }
+    
+    def parse_page(self, data: Any) -> BoardPage:
+        results = data.get("results", {})
+        hits = results.get("jobs", [])
+        jobs = []
+        
+        for job_data in hits:
+            title = job_data.get("title", "")
+            job_url = job_data.get("url", "")
+            organization = job_data.get("organization") or {}
+            company = organization.get("name", "")
             
-            if response.status_code != 200:
-                self.logger.warning(f"[{self.subdomain}] HTTP {response.status_code}")
-                return []
+            if not title or not job_url or not company:
+                continue
             
-            data = response.json()
-            job_list = data.get("jobs", [])
+            location = ", ".join(str(loc) for loc in job_data.get("locations") or [])
+            remote = job_data.get("work_mode") == "remote" or "remote" in location.lower()
             
-            for job_data in job_list:
-                title = job_data.get("title", "")
-                shortcode = job_data.get("shortcode", "")
-                
-                if not title or not shortcode:
-                    continue
-                
-                # 构建职位 URL
-                job_url = f"https://apply.workable.com/{self.subdomain}/j/{shortcode}/"
-                
-                # 提取地点
-                location_data = job_data.get("location", {})
-                city = location_data.get("city", "")
-                country = location_data.get("country", "")
-                location = f"{city}, {country}".strip(", ")
-                
-                # 检查远程
-                remote = job_data.get("remote", False)
+            posted_date = ""
+            created_at = job_data.get("created_at")
+            if isinstance(created_at, (int, float)):
+                posted_date = datetime.utcfromtimestamp(created_at).date().isoformat()
+            
+            jobs.append(Job(
+                title=title,
+                company=company,
+                url=job_url,
+                source=self.source_name,
+                location=location,
+                remote=remote,
+                posted_date=posted_date,
+                external_id=str(job_data.get("id", "")),
+            ))
+        
+        return BoardPage(jobs, len(hits), results.get("count"))
+    
+    async def iter_pages_async(self, session=None) -> AsyncIterator[list[Job]]:
+        """
+        并发分页：先取第一页得到总数，再以 page_concurrency 的窗口并发获取后续页
+        
+        按页码顺序产出；遇到不足一页的结果时取消剩余请求并结束。
+        """
+        await self.prepare_async(session)
+        
+        first = self.parse_page(await self._request_page_async(0, None, session))
+        yield first.jobs
+        if self._is_last_page(0, first):
+            return
+        
+        last_page = self.max_pages - 1
+        if first.total is not None:
+            last_page = min(last_page, math.ceil(first.total / self.page_size) - 1)
+        
+        async def fetch_page(page: int) -> BoardPage:
+            return self.parse_page(await self._request_page_async(page, None, session))
+        
+        pending: deque[asyncio.Task] = deque()
+        next_page = 1
+        try:
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < self.page_concurrency:
+                    pending.append(asyncio.create_task(fetch_page(next_page)))
+                    next_page += 1
                 
-                jobs.append(Job(
-                    title=title,
-                    company=self.company_name,
-                    url=job_url,
-                    source=self.source_name,
-                    location=location,
-                    remote=remote,
-                ))
+                result = await pending.popleft()
+                yield result.jobs
+                if result.count < self.page_size:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class ConsiderScraper(PortfolioBoardScraper):
+    """
+    Consider 平台 Job Board 爬虫
+    
+    API 格式: POST {base_url}/api-boards/search-jobs
+    
+    Consider 使用游标（meta.sequence）分页，同一 board 只能顺序翻页，
+    并发来自多个 board 同时进行。
+    """
+    
+    platform = "consider"
+    uses_cursor = True
+    
+    def __init__(
+        self,
+        board_key: str,
+        board_config: dict,
+        transport: Optional[HttpTransport] = None
+    ):
+        super().__init__(board_key, board_config, transport)
+        self.api_url = f"{self.base_url}/api-boards/search-jobs"
+        self.board_id = board_config.get("board_id") or board_key.replace("_", "-")
+    
+    def build_page_request(self, page: int, cursor: Optional[str]) -> dict[str, Any]:
+        meta = {"size": self.page_size}
+        if cursor:
+            meta["sequence"] = cursor
+        
+        return {
+            "method": "POST",
+            "url": self.api_url,
+            "json": {
+                "meta": meta,
+                "board": {"id": self.board_id, "isParent": True},
+                "query": {"promoteFeatured": True},
+                "grouped": False,
+            },
+            "headers": {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        }
+    
+    def parse_page(self, data: Any) -> BoardPage:
+        hits = data.get("jobs", [])
+        jobs = []
+        
+        for job_data in hits:
+            title = job_data.get("title", "")
+            job_url = job_data.get("url") or job_data.get("applyUrl", "")
+            company = job_data.get("companyName", "")
             
-            self.logger.info(f"[{self.subdomain}] Found {len(jobs)} jobs via Workable API")
+            if not title or not job_url or not company:
+                continue
             
-        except Exception as e:
-            self.logger.error(f"[{self.subdomain}] Workable API error: {e}")
+            location = ", ".join(str(loc) for loc in job_data.get("locations") or [])
+            remote = bool(job_data.get("remote")) or "remote" in location.lower()
+            
+            jobs.append(Job(
+                title=title,
+                company=company,
+                url=job_url,
+                source=self.source_name,
+                location=location,
+                remote=remote,
+                external_id=str(job_data.get("jobId", "")),
+            ))
         
-        return jobs
+        cursor = (data.get("meta") or {}).get("sequence")
+        return BoardPage(jobs, len(hits), data.get("total"), cursor)
 
 
-def create_vc_portfolio_scrapers() -> list[BaseScraper]:
+def create_vc_portfolio_scrapers(
+    transport: Optional[HttpTransport] = None
+) -> list[BaseScraper]:
     """
     创建 VC 投资组合公司的爬虫
     
     这些是 Top Crypto VC 投资的公司，使用各种 ATS 平台
+    
+    Args:
+        transport: HTTP 传输层（默认使用共享传输层）
     """
     scrapers = []
     
@@ -397,7 +1043,7 @@ def create_vc_portfolio_scrapers() -> list[BaseScraper]:
     ]
     
     for company_name, board_token, source_name in greenhouse_companies:
-        scrapers.append(GreenhouseScraper(company_name, board_token, source_name))
+        scrapers.append(GreenhouseScraper(company_name, board_token, source_name, transport))
     
     # ============ Ashby 公司 ============
     ashby_companies = [
@@ -414,7 +1060,7 @@ def create_vc_portfolio_scrapers() -> list[BaseScraper]:
     ]
     
     for company_name, board_slug, source_name in ashby_companies:
-        scrapers.append(AshbyScraper(company_name, board_slug, source_name))
+        scrapers.append(AshbyScraper(company_name, board_slug, source_name, transport))
     
     # ============ Lever 公司 ============
     lever_companies = [
@@ -432,7 +1078,7 @@ def create_vc_portfolio_scrapers() -> list[BaseScraper]:
     ]
     
     for company_name, lever_slug, source_name in lever_companies:
-        scrapers.append(LeverScraper(company_name, lever_slug, source_name))
+        scrapers.append(LeverScraper(company_name, lever_slug, source_name, transport))
     
     # ============ Workable 公司 ============
     workable_companies = [
@@ -441,12 +1087,35 @@ def create_vc_portfolio_scrapers() -> list[BaseScraper]:
     ]
     
     for company_name, subdomain, source_name in workable_companies:
-        scrapers.append(WorkableScraper(company_name, subdomain, source_name))
+        scrapers.append(WorkableScraper(company_name, subdomain, source_name, transport))
     
     return scrapers
 
 
-# 保持向后兼容
-def create_getro_scrapers() -> list[BaseScraper]:
-    """向后兼容函数"""
-    return create_vc_portfolio_scrapers()
+def create_getro_scrapers(
+    transport: Optional[HttpTransport] = None
+) -> list[BaseScraper]:
+    """
+    创建 VC 投资组合 Job Board 爬虫（config.GETRO_BOARDS 中启用的 board）
+    
+    Args:
+        transport: HTTP 传输层（默认使用共享传输层）
+    """
+    scraper_classes = {
+        "getro": GetroScraper,
+        "consider": ConsiderScraper,
+    }
+    
+    scrapers = []
+    for board_key, board_config in config.GETRO_BOARDS.items():
+        if not board_config.get("enabled", True):
+            continue
+        
+        scraper_class = scraper_classes.get(board_config.get("platform", "getro"))
+        if scraper_class is None:
+            logger.warning(f"Unknown platform for board {board_key}: {board_config.get('platform')}")
+            continue
+        
+        scrapers.append(scraper_class(board_key, board_config, transport))
+    
+    return scrapers
@@ -0,0 +1,330 @@
+"""
+HTTP 传输层
+
+所有爬虫通过 HttpTransport 发送请求：
+- 同步路径：requests.Session + 按主机挂载的 HTTPAdapter 连接池（keep-alive）
+- 异步路径：aiohttp.ClientSession + TCPConnector 连接池（keep-alive）
+
+同一主机（如 boards-api.greenhouse.io）的请求复用已建立的 TCP/TLS 连接。
+transport 可注入到每个爬虫，host_overrides 可把 ATS 主机指向本地 stub 服务器。
+
+每个请求经过按主机的令牌桶限流，遇到超时、网络错误、429/5xx 时按
+RetryPolicy 指数退避重试（优先遵循 Retry-After）。
+"""
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_utils import RetryPolicy, TokenBucket, parse_retry_after
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class HttpTransport:
+    """共享的 HTTP 传输层（连接池按主机划分）"""
+
+    def __init__(
+        self,
+        pool_maxsize: Optional[int] = None,
+        host_pool_sizes: Optional[dict[str, int]] = None,
+        keepalive_timeout: Optional[float] = None,
+        host_overrides: Optional[dict[str, str]] = None,
+        headers: Optional[dict[str, str]] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        初始化传输层
+
+        Args:
+            pool_maxsize: 每个主机的默认连接池大小（默认使用配置）
+            host_pool_sizes: 指定主机的连接池大小，如 {"boards-api.greenhouse.io": 8}
+            keepalive_timeout: 空闲连接保持时间（秒，默认使用配置）
+            host_overrides: 主机重定向，如 {"api.lever.co": "http://127.0.0.1:8080"}
+            headers: 默认请求头（默认使用配置）
+            retry_policy: 重试策略（默认使用配置）
+        """
+        self.pool_maxsize = pool_maxsize or config.HTTP_POOL_MAXSIZE
+        self.host_pool_sizes = (
+            config.HTTP_HOST_POOL_SIZES if host_pool_sizes is None else host_pool_sizes
+        )
+        self.keepalive_timeout = keepalive_timeout or config.HTTP_KEEPALIVE_TIMEOUT
+        self.host_overrides = host_overrides or {}
+        self.headers = headers or config.HEADERS
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        self._session = self._create_session()
+        self._client_session: Optional[aiohttp.ClientSession] = None
+        self._rate_limiters: dict[str, TokenBucket] = {}
+        self._rate_limiters_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        """创建带连接池的 requests 会话"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+
+        # 默认适配器：每个主机一个连接池，池大小为 pool_maxsize
+        default_adapter = HTTPAdapter(
+            pool_connections=config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", default_adapter)
+        session.mount("http://", default_adapter)
+
+        # 为高频主机单独挂载更大的连接池
+        for host, size in self.host_pool_sizes.items():
+            session.mount(
+                f"https://{host}/",
+                HTTPAdapter(pool_connections=1, pool_maxsize=size),
+            )
+
+        return session
+
+    def resolve_url(self, url: str) -> str:
+        """
+        应用主机重定向
+
+        Args:
+            url: 原始 URL
+
+        Returns:
+            重定向后的 URL（无匹配时原样返回）
+        """
+        if not self.host_overrides:
+            return url
+
+        parts = urlsplit(url)
+        override = self.host_overrides.get(parts.netloc)
+        if not override:
+            return url
+
+        target = urlsplit(override)
+        path = target.path.rstrip("/") + parts.path
+        return urlunsplit((target.scheme, target.netloc, path, parts.query, parts.fragment))
+
+    def get_rate_limiter(self, url: str) -> TokenBucket:
+        """
+        获取 URL 所在主机的令牌桶（速率见 HOST_RATE_LIMITS，默认 1 / REQUEST_DELAY）
+
+        Args:
+            url: 请求 URL（按重定向前的主机限流）
+
+        Returns:
+            TokenBucket
+        """
+        host = urlsplit(url).netloc
+        with self._rate_limiters_lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = TokenBucket(
+                    rate=config.HOST_RATE_LIMITS.get(host, 1 / config.REQUEST_DELAY),
+                    capacity=config.RATE_LIMIT_BURST,
+                )
+            return self._rate_limiters[host]
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        rate_limiter: TokenBucket,
+        status: Optional[int] = None,
+        headers=None
+    ) -> Optional[float]:
+        """
+        计算重试等待时间
+
+        Args:
+            attempt: 已完成的尝试次数
+            rate_limiter: 所在主机的令牌桶
+            status: HTTP 状态码（None 表示网络异常或超时）
+            headers: 响应头
+
+        Returns:
+            等待秒数；不应重试时返回 None
+        """
+        if not self.retry_policy.should_retry(attempt, status):
+            return None
+
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        delay = self.retry_policy.get_delay(attempt, retry_after)
+        if delay is not None and retry_after is not None:
+            # 服务端要求等待时，同主机的其他请求也一起暂停
+            rate_limiter.pause(delay)
+        return delay
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送同步请求（限流 + 重试）
+
+        Args:
+            method: HTTP 方法
+            url: 请求 URL
+            **kwargs: 透传给 requests（params, json, headers 等）
+
+        Returns:
+            requests.Response（重试耗尽时返回最后一次响应）
+        """
+        kwargs.setdefault("timeout", config.REQUEST_TIMEOUT)
+        rate_limiter = self.get_rate_limiter(url)
+        target = self.resolve_url(url)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            rate_limiter.acquire()
+
+            try:
+                response = self._session.request(method, target, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._retry_delay(attempt, rate_limiter)
+                if delay is None:
+                    raise
+                logger.info(f"Retrying {url} in {delay:.1f}s (attempt {attempt}): {e!r}")
+                time.sleep(delay)
+                continue
+
+            delay = self._retry_delay(attempt, rate_limiter, response.status_code, response.headers)
+            if delay is None:
+                return response
+
+            logger.info(
+                f"Retrying {url} in {delay:.1f}s (attempt {attempt}): HTTP {response.status_code}"
+            )
+            response.close()
+            time.sleep(delay)
+
+    def get_client_session(self) -> aiohttp.ClientSession:
+        """
+        获取 aiohttp 会话（不存在或已关闭时创建）
+
+        必须在事件循环内调用。
+
+        Returns:
+            aiohttp.ClientSession
+        """
+        if self._client_session is None or self._client_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=config.MAX_CONCURRENT_SCRAPERS,
+                limit_per_host=config.MAX_CONCURRENT_PER_HOST,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._client_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT),
+            )
+            logger.debug("Created aiohttp client session")
+
+        return self._client_session
+
+    @asynccontextmanager
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        发送异步请求（限流 + 重试）
+
+        Args:
+            method: HTTP 方法
+            url: 请求 URL
+            session: 指定 aiohttp 会话（默认使用本传输层的会话）
+            **kwargs: 透传给 aiohttp（params, json, headers 等）
+
+        Yields:
+            aiohttp.ClientResponse（响应体已读取；重试耗尽时为最后一次响应）
+        """
+        session = session or self.get_client_session()
+        rate_limiter = self.get_rate_limiter(url)
+        target = self.resolve_url(url)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            await rate_limiter.acquire_async()
+
+            response = None
+            try:
+                response = await session.request(method, target, **kwargs)
+                delay = self._retry_delay(attempt, rate_limiter, response.status, response.headers)
+                if delay is None:
+                    # 响应体也在重试范围内读取，读取超时或连接中断同样会重试
+                    await response.read()
+                    break
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+                if response is not None:
+                    response.release()
+                delay = self._retry_delay(attempt, rate_limiter)
+                if delay is None:
+                    raise
+                logger.info(f"Retrying {url} in {delay:.1f}s (attempt {attempt}): {e!r}")
+                await asyncio.sleep(delay)
+                continue
+
+            logger.info(
+                f"Retrying {url} in {delay:.1f}s (attempt {attempt}): HTTP {response.status}"
+            )
+            response.release()
+            await asyncio.sleep(delay)
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def close(self):
+        """关闭同步连接池"""
+        self._session.close()
+
+    async def aclose(self):
+        """关闭所有连接池"""
+        if self._client_session is not None and not self._client_session.closed:
+            await self._client_session.close()
+        self._client_session = None
+        self.close()
+
+
+_default_transport: Optional[HttpTransport] = None
+
+
+def get_default_transport() -> HttpTransport:
+    """获取默认的共享传输层"""
+    global _default_transport
+
+    if _default_transport is None:
+        _default_transport = HttpTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: Optional[HttpTransport]):
+    """
+    替换默认传输层（如测试时指向本地 stub 服务器）
+
+    Args:
+        transport: 新的传输层，None 表示恢复为按需创建
+    """
+    global _default_transport
+    _default_transport = transport
+
+
+def get_client_session() -> aiohttp.ClientSession:
+    """获取默认传输层的 aiohttp 会话"""
+    return get_default_transport().get_client_session()
+
+
+async def close_client_session():
+    """关闭默认传输层的所有连接"""
+    global _default_transport
+
+    if _default_transport is not None:
+        await _default_transport.aclose()
+    _default_transport = None
@@ -0,0 +1,122 @@
+"""
+熔断器
+
+CircuitBreaker: 连续失败的 board 在冷却期内直接跳过（状态持久化到磁盘）。
+重试退避和令牌桶限流见 http_utils/retry.py（与通知模块共用）。
+"""
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    熔断器（按 board 记录连续失败次数）
+
+    连续失败达到阈值后进入冷却期，冷却期内跳过该 board；
+    冷却结束后放行一次试探请求，成功则恢复，失败则重新冷却。
+    """
+
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        threshold: Optional[int] = None,
+        cooldown: Optional[float] = None
+    ):
+        """
+        初始化熔断器
+
+        Args:
+            state_file: 状态文件路径（默认使用配置）
+            threshold: 连续失败阈值（默认使用配置）
+            cooldown: 冷却时间（秒，默认使用配置）
+        """
+        self.state_file = state_file or config.CIRCUIT_BREAKER_FILE
+        self.threshold = threshold or config.CIRCUIT_BREAKER_THRESHOLD
+        self.cooldown = cooldown or config.CIRCUIT_BREAKER_COOLDOWN
+        self._state: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """从文件加载熔断状态"""
+        if not self.state_file.exists():
+            return
+
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                self._state = json.load(f).get("boards", {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load circuit breaker state: {e}")
+            self._state = {}
+
+    def save(self):
+        """保存熔断状态（无变化时跳过）"""
+        if not self._dirty:
+            return
+
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump({"boards": self._state}, f, ensure_ascii=False, separators=(",", ":"))
+            self._dirty = False
+        except IOError as e:
+            logger.error(f"Failed to save circuit breaker state: {e}")
+
+    def allow(self, key: str) -> bool:
+        """
+        判断是否允许请求
+
+        Args:
+            key: board 标识（爬虫名称）
+
+        Returns:
+            False 如果处于冷却期
+        """
+        entry = self._state.get(key)
+        if not entry:
+            return True
+        return time.time() >= entry.get("open_until", 0)
+
+    def record_success(self, key: str):
+        """记录一次成功（重置失败计数）"""
+        if key in self._state:
+            with self._lock:
+                self._state.pop(key, None)
+                self._dirty = True
+
+    def record_failure(self, key: str):
+        """记录一次失败（达到阈值时熔断）"""
+        with self._lock:
+            entry = self._state.setdefault(key, {"failures": 0, "open_until": 0})
+            entry["failures"] += 1
+            if entry["failures"] >= self.threshold:
+                entry["open_until"] = time.time() + self.cooldown
+                logger.warning(
+                    f"Circuit opened for {key} after {entry['failures']} consecutive failures"
+                )
+            self._dirty = True
+
+    def get_open_circuits(self) -> list[str]:
+        """获取当前处于冷却期的 board 列表"""
+        return sorted(key for key in self._state if not self.allow(key))
+
+
+_default_breaker: Optional[CircuitBreaker] = None
+
+
+def get_default_circuit_breaker() -> CircuitBreaker:
+    """获取默认的共享熔断器"""
+    global _default_breaker
+
+    if _default_breaker is None:
+        _default_breaker = CircuitBreaker()
+    return _default_breaker
@@ -1,8 +1,48 @@
 """
 存储模块
 """
+import logging
+from typing import Optional
+
 from .manager import StorageManager
+from .outbox import Outbox
+from .snapshot import binary_to_json, json_to_binary
+from .sqlite import SQLiteStorageManager, migrate_json_to_sqlite
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def create_storage(backend: Optional[str] = None):
+    """
+    按配置创建存储管理器
+    
+    SQLite 数据库不存在时，先从 jobs.json 一次性迁移已知职位。
+    
+    Args:
+        backend: "json" 或 "sqlite"（默认使用配置）
+    
+    Returns:
+        StorageManager 或 SQLiteStorageManager
+    """
+    backend = backend or config.STORAGE_BACKEND
+    
+    if backend == "sqlite":
+        if not config.SQLITE_FILE.exists():
+            migrate_json_to_sqlite()
+        return SQLiteStorageManager()
+    
+    if backend != "json":
+        logger.warning(f"Unknown storage backend {backend!r}, using json")
+    return StorageManager()
+
 
 __all__ = [
     "StorageManager",
+    "Outbox",
+    "SQLiteStorageManager",
+    "migrate_json_to_sqlite",
+    "json_to_binary",
+    "binary_to_json",
+    "create_storage",
 ]
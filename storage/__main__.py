@@ -0,0 +1,39 @@
+"""
+存储格式转换工具
+
+用法：
+    python -m storage to-binary [jobs.json] [jobs.bin]
+    python -m storage to-json [jobs.bin] [jobs.json]
+    python -m storage to-sqlite [jobs.json] [jobs.db]
+"""
+import logging
+import sys
+from pathlib import Path
+
+from .snapshot import binary_to_json, json_to_binary
+from .sqlite import migrate_json_to_sqlite
+import config
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+
+    binary_file = config.STORAGE_FILE.with_suffix(".bin")
+    commands = {
+        "to-binary": (json_to_binary, config.STORAGE_FILE, binary_file),
+        "to-json": (binary_to_json, binary_file, config.STORAGE_FILE),
+        "to-sqlite": (migrate_json_to_sqlite, config.STORAGE_FILE, config.SQLITE_FILE),
+    }
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        print("Usage: python -m storage to-binary|to-json|to-sqlite [source] [target]")
+        sys.exit(1)
+
+    convert, source, target = commands[sys.argv[1]]
+    paths = [Path(arg) for arg in sys.argv[2:4]]
+    source, target = (paths + [source, target][len(paths):])[:2]
+    count = convert(source, target)
+    print(f"Converted {count} jobs: {source} -> {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+布隆过滤器（mmap 映射的磁盘文件）
+
+记录所有已见职位的 unique_id。启动时只映射文件，不读取全部记录：
+- 过滤器说"不存在"时一定是新职位，无需加载记录
+- 过滤器说"存在"时（真阳性或少量假阳性）再做精确校验
+
+文件格式（小端）：
+    magic "JMBF" | version u8 | 3 字节填充 | num_bits u64 | num_hashes u32 | 4 字节填充 | items u64
+    之后是 num_bits / 8 字节的位数组
+"""
+import hashlib
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+
+MAGIC = b"JMBF"
+VERSION = 1
+HEADER = struct.Struct("<4sB3xQI4xQ")
+
+
+def optimal_size(capacity: int, error_rate: float) -> tuple[int, int]:
+    """
+    计算位数组大小和哈希函数个数
+
+    Args:
+        capacity: 预计元素数量
+        error_rate: 目标假阳性率
+
+    Returns:
+        (位数, 哈希函数个数)
+    """
+    capacity = max(capacity, 1)
+    num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+    num_bits = (num_bits + 7) // 8 * 8
+    num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+    return num_bits, num_hashes
+
+
+class BloomFilter:
+    """mmap 映射的布隆过滤器"""
+
+    def __init__(self, path: Path):
+        """
+        打开已有的过滤器文件
+
+        Args:
+            path: 文件路径
+
+        Raises:
+            ValueError: 文件格式不正确
+        """
+        self.path = path
+        self._file = open(path, "r+b")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty bloom filter file: {path}")
+
+        magic, version, self.num_bits, self.num_hashes, _ = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Invalid bloom filter file: {path}")
+        if len(self._mmap) != HEADER.size + self.num_bits // 8:
+            self.close()
+            raise ValueError(f"Truncated bloom filter file: {path}")
+
+    @classmethod
+    def create(cls, path: Path, capacity: int, error_rate: float) -> "BloomFilter":
+        """
+        创建空过滤器文件（原子替换已有文件）
+
+        Args:
+            path: 文件路径
+            capacity: 预计元素数量
+            error_rate: 目标假阳性率
+
+        Returns:
+            BloomFilter
+        """
+        num_bits, num_hashes = optimal_size(capacity, error_rate)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, num_bits, num_hashes, 0))
+            f.truncate(HEADER.size + num_bits // 8)
+        os.replace(temp_path, path)
+        return cls(path)
+
+    @property
+    def items(self) -> int:
+        """记录的元素数量（由调用方维护）"""
+        return HEADER.unpack_from(self._mmap)[4]
+
+    @items.setter
+    def items(self, value: int):
+        magic, version, num_bits, num_hashes, _ = HEADER.unpack_from(self._mmap)
+        HEADER.pack_into(self._mmap, 0, magic, version, num_bits, num_hashes, max(value, 0))
+
+    @property
+    def capacity(self) -> int:
+        """按当前大小估算的设计容量"""
+        return int(self.num_bits * math.log(2) / self.num_hashes)
+
+    def _positions(self, key: str) -> list[int]:
+        """计算元素对应的位位置（双重哈希）"""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str):
+        """添加元素"""
+        buffer = self._mmap
+        for position in self._positions(key):
+            index = HEADER.size + (position >> 3)
+            buffer[index] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        """判断元素是否可能存在（False 表示一定不存在）"""
+        buffer = self._mmap
+        for position in self._positions(key):
+            if not buffer[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def flush(self):
+        """把修改写回磁盘"""
+        self._mmap.flush()
+
+    def close(self):
+        """关闭映射和文件"""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
@@ -0,0 +1,95 @@
+"""
+过期索引
+
+按 added_at 的日期把职位 ID 分桶（{"2024-01-05": [id, ...]}），随快照一起保存。
+清理时只查看早于最短保留期的桶，不再逐条解析所有记录的 added_at。
+"""
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+import config
+
+# 缺少 added_at 的旧记录视为很早添加
+DEFAULT_ADDED_AT = "2020-01-01"
+
+
+def get_retention_cutoffs(
+    days: Optional[int] = None,
+    now: Optional[datetime] = None
+) -> tuple[str, dict[str, str]]:
+    """
+    计算各数据源的过期截止时间
+
+    Args:
+        days: 默认保留天数（默认使用配置 RETENTION_DAYS）
+        now: 当前时间（默认 UTC 当前时间）
+
+    Returns:
+        (默认截止时间, {数据源: 截止时间})，均为 ISO 格式字符串，
+        added_at 不晚于截止时间的记录视为过期
+    """
+    now = now or datetime.utcnow()
+    days = days or config.RETENTION_DAYS
+    default_cutoff = (now - timedelta(days=days)).isoformat()
+    source_cutoffs = {
+        source: (now - timedelta(days=source_days)).isoformat()
+        for source, source_days in config.SOURCE_RETENTION_DAYS.items()
+    }
+    return default_cutoff, source_cutoffs
+
+
+class ExpiryIndex:
+    """按天分桶的过期索引"""
+
+    def __init__(self, buckets: Optional[dict[str, list[str]]] = None):
+        """
+        初始化索引
+
+        Args:
+            buckets: 已保存的分桶数据 {日期: [职位 ID]}
+        """
+        self._buckets: dict[str, set[str]] = {
+            day: set(job_ids) for day, job_ids in (buckets or {}).items()
+        }
+
+    @classmethod
+    def build(cls, known_jobs: dict[str, dict]) -> "ExpiryIndex":
+        """从职位记录重建索引（旧快照没有索引时使用）"""
+        index = cls()
+        for job_id, job_data in known_jobs.items():
+            index.add(job_id, job_data.get("added_at", DEFAULT_ADDED_AT))
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(job_ids) for job_ids in self._buckets.values())
+
+    def add(self, job_id: str, added_at: str):
+        """登记职位"""
+        self._buckets.setdefault(added_at[:10], set()).add(job_id)
+
+    def remove(self, job_id: str, added_at: str):
+        """移除职位"""
+        day = added_at[:10]
+        job_ids = self._buckets.get(day)
+        if job_ids is not None:
+            job_ids.discard(job_id)
+            if not job_ids:
+                del self._buckets[day]
+
+    def candidates(self, cutoff: str) -> Iterator[str]:
+        """
+        产出可能过期的职位 ID
+
+        Args:
+            cutoff: 最早的截止时间（ISO 格式），晚于该日期的桶不会被访问
+
+        Yields:
+            职位 ID
+        """
+        cutoff_day = cutoff[:10]
+        for day in sorted(day for day in self._buckets if day <= cutoff_day):
+            yield from list(self._buckets[day])
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """转换为可序列化的字典"""
+        return {day: sorted(job_ids) for day, job_ids in sorted(self._buckets.items())}
@@ -2,14 +2,46 @@
 存储管理器
 
 负责保存和读取已知职位数据，用于检测新职位。
+
+日志模式（STORAGE_JOURNAL）下：
+- 新增/删除记录以 JSON 行追加到 jobs.journal 并 fsync，不再重写整个 jobs.json
+- 启动时加载压缩后的快照 jobs.json，再重放日志
+- 日志超过 STORAGE_JOURNAL_MAX_BYTES 时在后台线程压缩：
+  先把日志轮转为 jobs.journal.1，再原子写入新快照，最后删除 jobs.journal.1。
+  重放是幂等的，任何一步中断都不会丢失记录。
+
+transaction() 把一次运行中的所有修改合并为一次写入：
+快照模式下是一次紧凑的原子写入（临时文件 + 重命名），日志模式下是一次追加 + fsync；
+没有任何修改时不写文件。
+
+快照中同时保存按天分桶的过期索引（见 expiry.py），清理时只访问已过期的桶，
+并支持按数据源配置保留天数（SOURCE_RETENTION_DAYS）。
+
+布隆过滤器模式（STORAGE_BLOOM）下，启动时只 mmap 映射 jobs.bloom，不加载记录：
+is_known 对过滤器判定不存在的职位直接返回 False，过滤器命中时在映射的快照上精确校验。
+JSON 快照另外保存一份二进制格式的索引 jobs.idx（每次写入 jobs.json 后更新，缺失或过期时重新生成），
+按下述二进制快照的方式映射和使用。
+
+二进制快照格式（STORAGE_SNAPSHOT_FORMAT=binary，见 snapshot.py）下，快照保存为 jobs.bin 并通过 mmap 映射。
+有映射的快照时始终使用日志模式，整个运行期间都不解码全部记录：
+- 精确校验直接在快照上二分查找，再叠加日志中的增删
+- 新增、删除只追加到日志（并记入内存中的增删汇总）
+- 清理只读取快照中已过期日期桶的行
+- 压缩在后台线程中从磁盘读取旧快照并重放轮转的日志后写入新快照
 """
 import json
 import logging
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from scrapers.base import Job
+from .bloom import BloomFilter
+from .expiry import DEFAULT_ADDED_AT, ExpiryIndex, get_retention_cutoffs
+from .snapshot import SnapshotReader, json_to_binary, read_snapshot, write_snapshot
 import config
 
 logger = logging.getLogger(__name__)
@@ -18,30 +50,159 @@ logger = logging.getLogger(__name__)
 class StorageManager:
     """存储管理器"""
     
-    def __init__(self, storage_file: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_file: Optional[Path] = None,
+        journal: Optional[bool] = None,
+        bloom: Optional[bool] = None,
+        snapshot_format: Optional[str] = None
+    ):
         """
         初始化存储管理器
         
         Args:
             storage_file: 存储文件路径（默认使用配置）
+            journal: 是否使用追加日志模式（默认使用配置）
+            bloom: 是否使用布隆过滤器预判（默认使用配置）
+            snapshot_format: 快照格式 "json" 或 "binary"（默认使用配置）
         """
         self.storage_file = storage_file or config.STORAGE_FILE
+        self.journal = config.STORAGE_JOURNAL if journal is None else journal
+        self.journal_file = self.storage_file.with_suffix(".journal")
+        self._rotated_journal_file = self.storage_file.with_suffix(".journal.1")
+        self.bloom_file = self.storage_file.with_suffix(".bloom")
+        self.binary = (snapshot_format or config.STORAGE_SNAPSHOT_FORMAT) == "binary"
+        use_bloom = config.STORAGE_BLOOM if bloom is None else bloom
+        if self.binary or use_bloom:
+            # 修改只追加到日志，快照只在压缩时重写
+            self.journal = True
+        self.snapshot_file = self.storage_file.with_suffix(".bin") if self.binary else self.storage_file
+        # 映射的快照：二进制格式即快照本身，JSON 格式（布隆过滤器模式）为由 jobs.json 生成的 jobs.idx
+        self.index_file = self.snapshot_file if self.binary else self.storage_file.with_suffix(".idx")
+        self._write_index = use_bloom and not self.binary
         self._ensure_storage_dir()
         self._known_jobs: dict[str, dict] = {}
-        self._load()
+        self._expiry = ExpiryIndex()
+        self._lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+        self._dirty = False
+        self._pending: list[dict] = []  # 日志模式下待追加的记录
+        self._transaction_depth = 0
+        self._loaded = False
+        self.bloom: Optional[BloomFilter] = None
+        self._reader: Optional[SnapshotReader] = None
+        self._overlay: Optional[dict[str, Optional[dict]]] = None  # 未加载时日志中的增删
+        
+        if self.binary or use_bloom:
+            self._reader = self._open_snapshot()
+        
+        if use_bloom:
+            self.bloom = self._open_bloom()
+            if self.bloom is None:
+                self._rebuild_bloom()
+        if self.bloom is None and self._reader is None:
+            self._ensure_loaded()
     
     def _ensure_storage_dir(self):
         """确保存储目录存在"""
         storage_dir = self.storage_file.parent
         storage_dir.mkdir(parents=True, exist_ok=True)
     
+    def _open_snapshot(self) -> Optional[SnapshotReader]:
+        """
+        映射二进制快照（不存在或损坏时返回 None）
+        
+        二进制格式首次使用时从 jobs.json 转换；JSON 格式的索引 jobs.idx
+        不存在或比 jobs.json 旧时重新生成。
+        """
+        if not self.binary and not self.storage_file.exists():
+            return None
+        
+        stale = not self.index_file.exists() or (
+            not self.binary
+            and self.index_file.stat().st_mtime_ns < self.storage_file.stat().st_mtime_ns
+        )
+        if stale and self.storage_file.exists():
+            try:
+                count = json_to_binary(self.storage_file, self.index_file)
+                logger.info(f"Converted {count} jobs to binary snapshot {self.index_file.name}")
+            except (json.JSONDecodeError, IOError, ValueError) as e:
+                logger.warning(f"Failed to convert storage to binary snapshot: {e}")
+                return None
+        if not self.index_file.exists():
+            return None
+        
+        try:
+            reader = SnapshotReader(self.index_file)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Failed to open binary snapshot: {e}")
+            return None
+        
+        logger.info(f"Mapped binary snapshot with {len(reader)} known jobs")
+        return reader
+    
+    def _open_bloom(self) -> Optional[BloomFilter]:
+        """打开布隆过滤器（不存在、损坏或比数据文件旧时返回 None）"""
+        if not self.bloom_file.exists():
+            return None
+        
+        data_files = [self.snapshot_file, self.journal_file, self._rotated_journal_file]
+        newest = max((f.stat().st_mtime_ns for f in data_files if f.exists()), default=0)
+        if self.bloom_file.stat().st_mtime_ns < newest:
+            logger.info("Bloom filter is older than storage, rebuilding")
+            return None
+        
+        try:
+            bloom = BloomFilter(self.bloom_file)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Failed to open bloom filter: {e}")
+            return None
+        
+        logger.info(f"Mapped bloom filter with {bloom.items} known jobs")
+        return bloom
+    
+    def _rebuild_bloom(self):
+        """按当前记录重建布隆过滤器"""
+        job_ids = list(self._ids())
+        if self.bloom is not None:
+            self.bloom.close()
+        
+        capacity = max(len(job_ids) * 2, config.STORAGE_BLOOM_MIN_CAPACITY)
+        self.bloom = BloomFilter.create(self.bloom_file, capacity, config.STORAGE_BLOOM_ERROR_RATE)
+        for job_id in job_ids:
+            self.bloom.add(job_id)
+        self.bloom.items = len(job_ids)
+        self._sync_bloom()
+    
+    def _sync_bloom(self):
+        """把布隆过滤器写回磁盘，并保证其修改时间不早于数据文件"""
+        self.bloom.flush()
+        os.utime(self.bloom_file)
+    
+    def _ensure_loaded(self):
+        """按需加载全部记录（没有映射的快照、无法在快照上直接操作时）"""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._overlay = None
+        self._load()
+        
+        if self.bloom is not None and self.bloom.items != len(self._known_jobs):
+            logger.warning("Bloom filter out of sync with storage, rebuilding")
+            self._rebuild_bloom()
+    
     def _load(self):
         """从文件加载已知职位"""
-        if self.storage_file.exists():
+        if self.binary and self._reader is not None:
+            # 正常运行时直接在映射的快照上操作（见 _lazy），不会解码全部记录
+            self._known_jobs = self._reader.to_dict()
+            logger.info(f"Loaded {len(self._known_jobs)} known jobs")
+        elif not self.binary and self.storage_file.exists():
             try:
                 with open(self.storage_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     self._known_jobs = data.get("jobs", {})
+                    self._expiry = ExpiryIndex(data.get("expiry"))
                     logger.info(f"Loaded {len(self._known_jobs)} known jobs")
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load storage: {e}")
@@ -49,20 +210,359 @@ class StorageManager:
         else:
             logger.info("No existing storage file, starting fresh")
             self._known_jobs = {}
+        
+        if len(self._expiry) != len(self._known_jobs):
+            # 旧版快照没有过期索引（或索引不一致），重建一次
+            self._expiry = ExpiryIndex.build(self._known_jobs)
+        
+        if self.journal:
+            # 先重放上次未完成压缩的日志，再重放当前日志
+            replayed = self._replay(self._rotated_journal_file) + self._replay(self.journal_file)
+            if replayed:
+                logger.info(
+                    f"Replayed {replayed} journal entries ({len(self._known_jobs)} known jobs)"
+                )
+    
+    def _replay(self, journal_file: Path, apply: Optional[Callable[[dict], None]] = None) -> int:
+        """
+        重放日志文件
+        
+        每条记录以换行结尾后才算写入完成。末尾没有换行的行（写入中途进程被杀，
+        即使内容恰好是合法 JSON）会被丢弃，并把文件截断到最后一个换行处，
+        保证之后追加的记录从新的一行开始；中间无法解析的行只跳过，其后的记录照常重放。
+        
+        Args:
+            journal_file: 日志文件路径
+            apply: 处理每条记录的函数（默认应用到已加载的记录）
+        
+        Returns:
+            重放的条目数
+        """
+        if not journal_file.exists():
+            return 0
+        
+        count = 0
+        complete_size = 0  # 最后一个换行之后的位置
+        with open(journal_file, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    logger.warning(f"Discarding torn journal tail in {journal_file.name}")
+                    break
+                complete_size += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping corrupt journal line in {journal_file.name}")
+                    continue
+                (apply or self._apply)(entry)
+                count += 1
+        
+        if complete_size < journal_file.stat().st_size:
+            with open(journal_file, "r+b") as f:
+                f.truncate(complete_size)
+        return count
+    
+    def _apply(self, entry: dict):
+        """应用一条日志记录"""
+        if entry.get("op") == "add":
+            self._put(entry["id"], entry["job"])
+        elif entry.get("op") == "del":
+            self._remove(entry["id"])
+    
+    def _get_overlay(self) -> dict[str, Optional[dict]]:
+        """未加载记录时，汇总日志中的增删（{id: 记录}，删除为 None）"""
+        if self._overlay is None:
+            overlay: dict[str, Optional[dict]] = {}
+            
+            def apply(entry: dict):
+                if entry.get("op") == "add":
+                    overlay[entry["id"]] = entry["job"]
+                elif entry.get("op") == "del":
+                    overlay[entry["id"]] = None
+            
+            if self.journal:
+                self._replay(self._rotated_journal_file, apply)
+                self._replay(self.journal_file, apply)
+            self._overlay = overlay
+        return self._overlay
+    
+    def _lazy(self) -> bool:
+        """是否直接在映射的快照上操作（叠加日志中的增删），无需加载全部记录"""
+        return not self._loaded and self._reader is not None
+    
+    def _contains(self, job_id: str) -> bool:
+        """精确判断职位是否已知（有映射的快照时无需加载全部记录）"""
+        if not self._lazy():
+            self._ensure_loaded()
+            return job_id in self._known_jobs
+        
+        overlay = self._get_overlay()
+        if job_id in overlay:
+            return overlay[job_id] is not None
+        return job_id in self._reader
+    
+    def _ids(self) -> Iterator[str]:
+        """产出所有已知职位 ID（有映射的快照时只读取 ID 列）"""
+        if not self._lazy():
+            self._ensure_loaded()
+            yield from self._known_jobs
+            return
+        
+        overlay = self._get_overlay()
+        for job_id in self._reader.ids():
+            if job_id not in overlay:
+                yield job_id
+        for job_id, job_data in overlay.items():
+            if job_data is not None:
+                yield job_id
+    
+    def _count(self) -> int:
+        """已知职位数量（尽量不加载记录）"""
+        if self.bloom is not None and not self._loaded:
+            return self.bloom.items
+        if not self._lazy():
+            self._ensure_loaded()
+            return len(self._known_jobs)
+        
+        count = len(self._reader)
+        for job_id, job_data in self._get_overlay().items():
+            in_snapshot = job_id in self._reader
+            if job_data is not None and not in_snapshot:
+                count += 1
+            elif job_data is None and in_snapshot:
+                count -= 1
+        return count
+    
+    def _put(self, job_id: str, job_data: dict):
+        """写入一条记录（同步更新过期索引）"""
+        previous = self._known_jobs.get(job_id)
+        if previous is not None:
+            self._expiry.remove(job_id, previous.get("added_at", DEFAULT_ADDED_AT))
+        self._known_jobs[job_id] = job_data
+        self._expiry.add(job_id, job_data.get("added_at", DEFAULT_ADDED_AT))
+    
+    def _remove(self, job_id: str):
+        """删除一条记录（同步更新过期索引）"""
+        job_data = self._known_jobs.pop(job_id, None)
+        if job_data is not None:
+            self._expiry.remove(job_id, job_data.get("added_at", DEFAULT_ADDED_AT))
     
-    def _save(self):
-        """保存到文件"""
+    def _append(self, entries: list[dict]) -> bool:
+        """
+        追加日志记录并 fsync
+        
+        Returns:
+            True 如果写入成功；失败时截断掉本次写入的部分内容，由调用方稍后重试
+        """
+        if not entries:
+            return True
+        
+        lines = "".join(
+            json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for entry in entries
+        )
+        with self._lock:
+            try:
+                size = self.journal_file.stat().st_size if self.journal_file.exists() else 0
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                logger.error(f"Failed to append to storage journal: {e}")
+                try:
+                    # 去掉写了一半的记录，重试时不会和它拼在同一行
+                    with open(self.journal_file, "r+b") as f:
+                        f.truncate(size)
+                except OSError:
+                    pass
+                return False
+        
+        self._maybe_compact()
+        return True
+    
+    def _maybe_compact(self):
+        """日志超过阈值时启动后台压缩"""
+        if self._compaction and self._compaction.is_alive():
+            return
         try:
-            data = {
-                "jobs": self._known_jobs,
-                "updated_at": datetime.utcnow().isoformat(),
-                "total_count": len(self._known_jobs),
-            }
-            with open(self.storage_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved {len(self._known_jobs)} jobs to storage")
+            size = self.journal_file.stat().st_size
+        except FileNotFoundError:
+            return
+        if size < config.STORAGE_JOURNAL_MAX_BYTES:
+            return
+        
+        with self._lock:
+            # 未加载记录时由压缩从磁盘读取旧快照
+            snapshot = dict(self._known_jobs) if self._loaded else None
+            expiry = self._expiry.to_dict() if self._loaded else None
+            # 上次压缩未完成（如进程被杀），轮转前先同步完成；失败时保留两个日志，下次再试
+            if self._rotated_journal_file.exists() and not self._compact(snapshot, expiry):
+                return
+            os.replace(self.journal_file, self._rotated_journal_file)
+        
+        logger.info(f"Compacting storage journal ({size} bytes)")
+        self._compaction = threading.Thread(
+            target=self._compact, args=(snapshot, expiry), name="storage-compaction"
+        )
+        self._compaction.start()
+    
+    def _read_compaction_source(self) -> Optional[dict[str, dict]]:
+        """从磁盘读取旧快照并重放轮转的日志（未加载记录时压缩使用；快照损坏时返回 None）"""
+        known_jobs: dict[str, dict] = {}
+        try:
+            if self.binary:
+                known_jobs = read_snapshot(self.snapshot_file)
+            else:
+                with open(self.storage_file, "r", encoding="utf-8") as f:
+                    known_jobs = json.load(f).get("jobs", {})
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError) as e:
+            logger.error(f"Failed to read storage snapshot for compaction: {e}")
+            return None
+        
+        def apply(entry: dict):
+            if entry.get("op") == "add":
+                known_jobs[entry["id"]] = entry["job"]
+            elif entry.get("op") == "del":
+                known_jobs.pop(entry["id"], None)
+        
+        self._replay(self._rotated_journal_file, apply)
+        return known_jobs
+    
+    def _compact(
+        self,
+        snapshot: Optional[dict[str, dict]] = None,
+        expiry: Optional[dict[str, list[str]]] = None
+    ) -> bool:
+        """
+        写入新快照并删除已轮转的日志（后台线程）
+        
+        Args:
+            snapshot: 压缩后的全部记录（None 时从磁盘读取旧快照并重放轮转的日志）
+            expiry: 过期索引（None 时按记录重建）
+        
+        Returns:
+            True 如果新快照写入成功
+        """
+        if snapshot is None:
+            snapshot = self._read_compaction_source()
+            if snapshot is None:
+                return False
+        if expiry is None and not self.binary:
+            expiry = ExpiryIndex.build(snapshot).to_dict()
+        if not self._write_snapshot(snapshot, expiry):
+            return False
+        
+        self._rotated_journal_file.unlink(missing_ok=True)
+        if self.bloom is not None:
+            # 新快照的内容已包含在过滤器中
+            os.utime(self.bloom_file)
+        return True
+    
+    def _write_snapshot(
+        self,
+        known_jobs: dict[str, dict],
+        expiry: dict[str, list[str]]
+    ) -> bool:
+        """原子写入快照（临时文件 + fsync + 重命名）"""
+        if self.binary:
+            try:
+                write_snapshot(self.snapshot_file, known_jobs)
+                return True
+            except (IOError, ValueError) as e:
+                logger.error(f"Failed to write storage snapshot: {e}")
+                return False
+        
+        data = {
+            "jobs": known_jobs,
+            "expiry": expiry,
+            "updated_at": datetime.utcnow().isoformat(),
+            "total_count": len(known_jobs),
+        }
+        temp_file = self.storage_file.with_suffix(".json.tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.storage_file)
         except IOError as e:
-            logger.error(f"Failed to save storage: {e}")
+            # 原快照保持不变，修改仍标记为未保存，下次写入时重试
+            logger.error(f"Failed to write storage snapshot: {e}")
+            temp_file.unlink(missing_ok=True)
+            return False
+        
+        if self._write_index:
+            try:
+                write_snapshot(self.index_file, known_jobs)
+            except (IOError, ValueError) as e:
+                # 索引比 jobs.json 旧，下次启动时重新生成
+                logger.warning(f"Failed to write storage index: {e}")
+        return True
+    
+    @contextmanager
+    def transaction(self) -> Iterator["StorageManager"]:
+        """
+        工作单元：块内的所有修改在退出时合并为一次写入（可嵌套）
+        
+        异常退出时同样写入，已发送通知的职位不会因后续步骤出错而丢失记录。
+        
+        Yields:
+            存储管理器自身
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._flush()
+    
+    def _record(self, entries: list[dict]):
+        """记录一次修改（事务外立即写入）"""
+        self._dirty = True
+        if self.journal:
+            self._pending.extend(entries)
+        if self._transaction_depth == 0:
+            self._flush()
+    
+    def _flush(self):
+        """写入所有未保存的修改（无修改时跳过）"""
+        if not self._dirty:
+            return
+        
+        if self.journal:
+            # 写入失败时保留待追加的记录，下次写入时重试（不掩盖事务块中的原始异常）
+            if not self._append(self._pending):
+                return
+            logger.info(f"Appended {len(self._pending)} entries to storage journal")
+            self._pending = []
+        elif self._write_snapshot(self._known_jobs, self._expiry.to_dict()):
+            logger.info(f"Saved {len(self._known_jobs)} jobs to storage")
+        else:
+            return
+        self._dirty = False
+        
+        if self.bloom is not None:
+            # 超出设计容量（假阳性率上升）时重建
+            if self.bloom.items > self.bloom.capacity:
+                self._rebuild_bloom()
+            else:
+                self._sync_bloom()
+    
+    def close(self):
+        """等待后台压缩完成，关闭布隆过滤器和快照映射"""
+        if self._compaction:
+            self._compaction.join()
+            self._compaction = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self.bloom is not None:
+            self.bloom.close()
+            self.bloom = None
     
     def is_known(self, job: Job) -> bool:
         """
@@ -74,7 +574,11 @@ class StorageManager:
         Returns:
             True 如果职位已存在
         """
-        return job.unique_id in self._known_jobs
+        if self.bloom is not None and job.unique_id not in self.bloom:
+            return False
+        
+        # 过滤器命中（可能是假阳性），精确校验
+        return self._contains(job.unique_id)
     
     def add_job(self, job: Job):
         """
@@ -83,13 +587,24 @@ class StorageManager:
         Args:
             job: Job 对象
         """
-        self._known_jobs[job.unique_id] = {
+        if self.bloom is not None:
+            if not self._contains(job.unique_id):
+                self.bloom.items += 1
+            self.bloom.add(job.unique_id)
+        
+        job_data = {
             "title": job.title,
             "company": job.company,
             "url": job.url,
             "source": job.source,
             "added_at": datetime.utcnow().isoformat(),
         }
+        if self._lazy():
+            # 只记入日志增删汇总，快照在压缩时更新
+            self._get_overlay()[job.unique_id] = job_data
+        else:
+            self._ensure_loaded()
+            self._put(job.unique_id, job_data)
     
     def add_jobs(self, jobs: list[Job]):
         """
@@ -116,7 +631,7 @@ class StorageManager:
             if not self.is_known(job):
                 new_jobs.append(job)
         
-        logger.info(f"Found {len(new_jobs)} new jobs out of {len(jobs)}")
+        logger.debug(f"Found {len(new_jobs)} new jobs out of {len(jobs)}")
         return new_jobs
     
     def mark_as_seen(self, jobs: list[Job]):
@@ -127,13 +642,17 @@ class StorageManager:
             jobs: Job 对象列表
         """
         self.add_jobs(jobs)
-        self._save()
+        known_jobs = self._get_overlay() if self._lazy() else self._known_jobs
+        self._record([
+            {"op": "add", "id": job.unique_id, "job": known_jobs[job.unique_id]}
+            for job in jobs
+        ] if self.journal else [])
     
     def get_stats(self) -> dict:
         """获取存储统计信息"""
         return {
-            "total_jobs": len(self._known_jobs),
-            "storage_file": str(self.storage_file),
+            "total_jobs": self._count(),
+            "storage_file": str(self.snapshot_file),
         }
     
     def is_first_run(self) -> bool:
@@ -143,27 +662,53 @@ class StorageManager:
         Returns:
             True 如果存储为空（首次运行）
         """
-        return len(self._known_jobs) == 0
+        return self._count() == 0
     
-    def cleanup_old_jobs(self, days: int = 90):
+    def cleanup_old_jobs(self, days: Optional[int] = None):
         """
-        清理超过指定天数的旧职位记录
+        清理超过保留期的旧职位记录
+        
+        只访问过期索引中早于最短保留期的日期桶，未过期的记录不会被读取。
+        有映射的快照时直接读取快照中的过期桶，删除只追加到日志。
         
         Args:
-            days: 保留的天数
+            days: 默认保留天数（默认使用配置 RETENTION_DAYS；
+                  SOURCE_RETENTION_DAYS 中配置的数据源使用各自的天数）
         """
-        from datetime import timedelta
+        default_cutoff, source_cutoffs = get_retention_cutoffs(days)
+        # 最短保留期对应最晚的截止时间，更晚的桶中不可能有过期记录
+        latest_cutoff = max([default_cutoff, *source_cutoffs.values()])
         
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        old_count = len(self._known_jobs)
+        def is_expired(job_data: dict) -> bool:
+            cutoff = source_cutoffs.get(job_data.get("source"), default_cutoff)
+            # ISO 格式字符串可直接比较，无需解析
+            return job_data.get("added_at", DEFAULT_ADDED_AT) <= cutoff
         
-        self._known_jobs = {
-            job_id: job_data
-            for job_id, job_data in self._known_jobs.items()
-            if datetime.fromisoformat(job_data.get("added_at", "2020-01-01")) > cutoff
-        }
+        if self._lazy():
+            overlay = self._get_overlay()
+            expired = [
+                job_id for job_id, job_data in self._reader.candidates(latest_cutoff)
+                if job_id not in overlay and is_expired(job_data)
+            ]
+            # 日志中新增的记录（数量受压缩阈值限制）
+            expired.extend(
+                job_id for job_id, job_data in overlay.items()
+                if job_data is not None and is_expired(job_data)
+            )
+            for job_id in expired:
+                overlay[job_id] = None
+        else:
+            self._ensure_loaded()
+            expired = [
+                job_id for job_id in self._expiry.candidates(latest_cutoff)
+                if is_expired(self._known_jobs[job_id])
+            ]
+            for job_id in expired:
+                self._remove(job_id)
+        if self.bloom is not None:
+            # 布隆过滤器不支持删除，只更新计数；多余的位在下次重建时清除
+            self.bloom.items -= len(expired)
         
-        removed = old_count - len(self._known_jobs)
-        if removed > 0:
-            logger.info(f"Cleaned up {removed} old jobs")
-            self._save()
+        if expired:
+            logger.info(f"Cleaned up {len(expired)} old jobs")
+            self._record([{"op": "del", "id": job_id} for job_id in expired])
@@ -0,0 +1,161 @@
+"""
+通知发件箱
+
+新职位先写入发件箱（storage/outbox.json），发送成功确认（ack）后才移出并标记为已见：
+- 以 unique_id 作为幂等键，同一职位重复入队只保留一条，不会在一次运行中重复发送；
+  本次运行中已确认的职位也不会再次入队（重发的职位可能又被爬虫抓到）
+- 未确认的通知在下次运行时最先重发（至少一次投递）
+- 超过 OUTBOX_MAX_AGE_DAYS 仍未送达的通知被丢弃，避免无限重试
+- 记录积压数量和投递延迟（入队到确认的时间，可跨运行）
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from scrapers.base import Job
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class Outbox:
+    """持久化通知发件箱"""
+
+    def __init__(
+        self,
+        outbox_file: Optional[Path] = None,
+        max_age_days: Optional[int] = None
+    ):
+        """
+        初始化发件箱
+
+        Args:
+            outbox_file: 发件箱文件路径（默认使用配置）
+            max_age_days: 未送达通知的最长保留天数（默认使用配置）
+        """
+        self.outbox_file = outbox_file or config.OUTBOX_FILE
+        self.max_age_days = max_age_days or config.OUTBOX_MAX_AGE_DAYS
+        self.enqueued = 0
+        self._entries: dict[str, dict] = {}
+        self._acked: set[str] = set()  # 本次运行中已确认的 unique_id
+        self._latencies: list[float] = []
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """从文件加载未确认的通知（丢弃过期的）"""
+        if not self.outbox_file.exists():
+            return
+
+        try:
+            with open(self.outbox_file, "r", encoding="utf-8") as f:
+                self._entries = json.load(f).get("entries", {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load outbox: {e}")
+            return
+
+        cutoff = (datetime.utcnow() - timedelta(days=self.max_age_days)).isoformat()
+        expired = [key for key, entry in self._entries.items() if entry["enqueued_at"] <= cutoff]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            logger.warning(f"Dropped {len(expired)} undelivered notifications older than {self.max_age_days} days")
+            self._dirty = True
+
+        logger.debug(f"Loaded {len(self._entries)} pending notifications")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._entries
+
+    def pending(self) -> list[Job]:
+        """
+        获取未确认的通知（按入队时间排序）
+
+        Returns:
+            Job 对象列表
+        """
+        entries = sorted(self._entries.values(), key=lambda entry: entry["enqueued_at"])
+        return [Job.from_dict(entry["job"]) for entry in entries]
+
+    def enqueue(self, job: Job) -> bool:
+        """
+        通知入队
+
+        Args:
+            job: Job 对象
+
+        Returns:
+            True 如果新入队；已在发件箱中或本次运行已确认时返回 False
+        """
+        if job.unique_id in self._entries or job.unique_id in self._acked:
+            return False
+
+        self._entries[job.unique_id] = {
+            "job": job.to_dict(),
+            "enqueued_at": datetime.utcnow().isoformat(),
+        }
+        self.enqueued += 1
+        self._dirty = True
+        return True
+
+    def ack(self, job: Job):
+        """
+        确认送达（移出发件箱并记录延迟，重复确认无副作用）
+
+        已确认的 unique_id 在本次运行中保留，之后的 enqueue 不会再次入队。
+
+        Args:
+            job: Job 对象
+        """
+        entry = self._entries.pop(job.unique_id, None)
+        if entry is None:
+            return
+        self._acked.add(job.unique_id)
+
+        enqueued_at = datetime.fromisoformat(entry["enqueued_at"])
+        self._latencies.append((datetime.utcnow() - enqueued_at).total_seconds())
+        self._dirty = True
+
+    def get_stats(self) -> dict:
+        """
+        获取发件箱统计
+
+        Returns:
+            backlog: 未确认数量；enqueued / delivered: 本次运行入队 / 确认数量；
+            avg_latency / max_latency: 本次确认的投递延迟（秒）；
+            oldest_age: 最早未确认通知的等待时间（秒）
+        """
+        now = datetime.utcnow()
+        oldest = min((entry["enqueued_at"] for entry in self._entries.values()), default=None)
+        return {
+            "backlog": len(self._entries),
+            "enqueued": self.enqueued,
+            "delivered": len(self._latencies),
+            "avg_latency": sum(self._latencies) / len(self._latencies) if self._latencies else 0.0,
+            "max_latency": max(self._latencies, default=0.0),
+            "oldest_age": (now - datetime.fromisoformat(oldest)).total_seconds() if oldest else 0.0,
+        }
+
+    def save(self):
+        """原子写入文件（无修改时跳过）"""
+        if not self._dirty:
+            return
+
+        temp_file = self.outbox_file.with_suffix(".json.tmp")
+        try:
+            self.outbox_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"entries": self._entries}, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.outbox_file)
+            self._dirty = False
+            logger.debug(f"Saved {len(self._entries)} pending notifications")
+        except IOError as e:
+            logger.error(f"Failed to save outbox: {e}")
@@ -0,0 +1,345 @@
+"""
+二进制列式快照
+
+jobs.json 中每条记录都重复保存十六进制 ID、公司名和数据源，解析和体积都随历史线性增长。
+二进制快照（jobs.bin）改为：
+- 字符串表：title / company / url / source / added_at 全部去重后只存一次
+- ID 列：16 字节二进制 md5，按字节序排序，可直接二分查找
+- 其余列：与 ID 列同序的 u32 字符串表下标
+- 过期索引：按 added_at 日期分桶的行号（与 expiry.py 的分桶一致），清理时只读取已过期的桶
+
+文件通过 mmap 映射，查找只读取命中的几个字节，无需加载全部记录。
+
+文件布局（小端，版本 2）：
+    header | ids[count × 16] | columns[5 × count × u32]
+    | days[num_days × (日期字符串下标, 起始位置, 行数) u32] | day_rows[count × u32]
+    | string_offsets[(n + 1) × u32] | string_blob
+
+版本 1 没有过期索引，仍可读取（清理时逐行检查 added_at），下次压缩时升级为版本 2。
+
+转换工具见 storage/__main__.py：
+    python -m storage to-binary [jobs.json] [jobs.bin]
+    python -m storage to-json [jobs.bin] [jobs.json]
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+MAGIC = b"JMSN"
+VERSION = 2
+PREFIX = struct.Struct("<4sB")
+# 版本 1：magic | version | count | num_strings | ids_offset | columns_offset | strings_offset | blob_offset
+HEADER_V1 = struct.Struct("<4sB3xIIQQQQ")
+# 版本 2：在版本 1 之后增加 days_offset | num_days
+HEADER = struct.Struct("<4sB3xIIQQQQQI4x")
+DAY = struct.Struct("<III")
+ID_SIZE = 16
+
+# 列顺序（每列 count 个 u32 字符串下标）
+COLUMNS = ("title", "company", "url", "source", "added_at")
+ADDED_AT_COLUMN = COLUMNS.index("added_at")
+
+
+def write_snapshot(path: Path, known_jobs: dict[str, dict]):
+    """
+    原子写入二进制快照（临时文件 + fsync + 重命名）
+
+    Args:
+        path: 快照文件路径
+        known_jobs: {unique_id: 记录}
+    """
+    entries = sorted((bytes.fromhex(job_id), data) for job_id, data in known_jobs.items())
+    count = len(entries)
+
+    strings: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    columns = [array("I") for _ in COLUMNS]
+    day_rows: dict[str, array] = {}
+    for row, (_, data) in enumerate(entries):
+        for column, name in zip(columns, COLUMNS):
+            column.append(intern(data.get(name, "")))
+        day_rows.setdefault(data.get("added_at", "")[:10], array("I")).append(row)
+
+    days = array("I")
+    rows = array("I")
+    for day in sorted(day_rows):
+        days.extend((intern(day), len(rows), len(day_rows[day])))
+        rows.extend(day_rows[day])
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = array("I", [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    ids_offset = HEADER.size
+    columns_offset = ids_offset + count * ID_SIZE
+    days_offset = columns_offset + len(COLUMNS) * count * 4
+    strings_offset = days_offset + len(days) * 4 + len(rows) * 4
+    blob_offset = strings_offset + len(offsets) * 4
+
+    sections = columns + [days, rows, offsets]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, count, len(encoded),
+            ids_offset, columns_offset, strings_offset, blob_offset,
+            days_offset, len(day_rows),
+        ))
+        f.write(b"".join(job_id for job_id, _ in entries))
+        for section in sections:
+            f.write(section.tobytes())
+        f.write(b"".join(encoded))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SnapshotReader:
+    """mmap 映射的二进制快照（只读，按 ID 二分查找）"""
+
+    def __init__(self, path: Path):
+        """
+        打开快照文件
+
+        Args:
+            path: 快照文件路径
+
+        Raises:
+            ValueError: 文件格式不正确
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty snapshot file: {path}")
+
+        magic, self.version = PREFIX.unpack_from(self._mmap)
+        if magic != MAGIC or self.version not in (1, VERSION):
+            self.close()
+            raise ValueError(f"Invalid snapshot file: {path}")
+
+        if self.version == 1:
+            fields = HEADER_V1.unpack_from(self._mmap) + (0, 0)
+        else:
+            fields = HEADER.unpack_from(self._mmap)
+        (
+            _, _, self.count, self._num_strings,
+            self._ids_offset, self._columns_offset, self._strings_offset, self._blob_offset,
+            self._days_offset, self._num_days,
+        ) = fields
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _id(self, row: int) -> str:
+        """读取一行的十六进制 ID"""
+        start = self._ids_offset + row * ID_SIZE
+        return self._mmap[start:start + ID_SIZE].hex()
+
+    def _find(self, job_id: str) -> int:
+        """二分查找 ID，返回行号（不存在时返回 -1）"""
+        try:
+            key = bytes.fromhex(job_id)
+        except ValueError:
+            return -1
+
+        buffer = self._mmap
+        base = self._ids_offset
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = base + middle * ID_SIZE
+            current = buffer[start:start + ID_SIZE]
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def __contains__(self, job_id: str) -> bool:
+        return self._find(job_id) >= 0
+
+    def _string(self, index: int) -> str:
+        """读取字符串表中的字符串"""
+        start, end = struct.unpack_from("<II", self._mmap, self._strings_offset + index * 4)
+        return self._mmap[self._blob_offset + start:self._blob_offset + end].decode("utf-8")
+
+    def _cell(self, column: int, row: int) -> str:
+        """读取一个单元格"""
+        return self._string(struct.unpack_from(
+            "<I", self._mmap, self._columns_offset + (column * self.count + row) * 4
+        )[0])
+
+    def _row(self, row: int) -> dict:
+        """读取一行记录"""
+        return {name: self._cell(column, row) for column, name in enumerate(COLUMNS)}
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        获取记录
+
+        Args:
+            job_id: unique_id
+
+        Returns:
+            记录字典；不存在时返回 None
+        """
+        row = self._find(job_id)
+        return self._row(row) if row >= 0 else None
+
+    def ids(self) -> Iterator[str]:
+        """
+        按顺序产出所有 ID（不解码其他列）
+
+        Yields:
+            unique_id
+        """
+        for row in range(self.count):
+            yield self._id(row)
+
+    def _expired_rows(self, cutoff_day: str) -> Iterator[int]:
+        """产出 added_at 日期不晚于 cutoff_day 的行号"""
+        if self.version == 1:
+            # 版本 1 没有过期索引，逐行检查
+            for row in range(self.count):
+                if self._cell(ADDED_AT_COLUMN, row)[:10] <= cutoff_day:
+                    yield row
+            return
+
+        rows_offset = self._days_offset + self._num_days * DAY.size
+        for day in range(self._num_days):
+            day_index, start, length = DAY.unpack_from(self._mmap, self._days_offset + day * DAY.size)
+            if self._string(day_index) > cutoff_day:
+                break  # 分桶按日期排序，之后的桶都未过期
+            rows = array("I")
+            offset = rows_offset + start * 4
+            rows.frombytes(self._mmap[offset:offset + length * 4])
+            if sys.byteorder != "little":
+                rows.byteswap()
+            yield from rows
+
+    def candidates(self, cutoff: str) -> Iterator[tuple[str, dict]]:
+        """
+        产出可能过期的记录（只读取早于截止日期的分桶）
+
+        Args:
+            cutoff: 最早的截止时间（ISO 格式），晚于该日期的桶不会被访问
+
+        Yields:
+            (unique_id, 记录字典)
+        """
+        for row in self._expired_rows(cutoff[:10]):
+            yield self._id(row), self._row(row)
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        """
+        按 ID 顺序产出所有记录（一次性解码整个字符串表）
+
+        Yields:
+            (unique_id, 记录字典)
+        """
+        strings = [self._string(index) for index in range(self._num_strings)]
+        columns = []
+        for column in range(len(COLUMNS)):
+            values = array("I")
+            start = self._columns_offset + column * self.count * 4
+            values.frombytes(self._mmap[start:start + self.count * 4])
+            if sys.byteorder != "little":
+                values.byteswap()
+            columns.append(values)
+
+        for row in range(self.count):
+            yield self._id(row), {
+                name: strings[columns[column][row]]
+                for column, name in enumerate(COLUMNS)
+            }
+
+    def to_dict(self) -> dict[str, dict]:
+        """解码为 {unique_id: 记录}"""
+        return dict(self.items())
+
+    def close(self):
+        """关闭映射和文件"""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+
+def read_snapshot(path: Path) -> dict[str, dict]:
+    """
+    解码整个二进制快照（压缩、转换时使用）
+
+    Args:
+        path: 快照文件路径
+
+    Returns:
+        {unique_id: 记录}
+    """
+    reader = SnapshotReader(path)
+    try:
+        return reader.to_dict()
+    finally:
+        reader.close()
+
+
+def json_to_binary(json_file: Path, binary_file: Path) -> int:
+    """
+    把 jobs.json 转换为二进制快照
+
+    Args:
+        json_file: JSON 存储文件路径
+        binary_file: 二进制快照路径
+
+    Returns:
+        转换的记录数量
+    """
+    with open(json_file, "r", encoding="utf-8") as f:
+        known_jobs = json.load(f).get("jobs", {})
+    write_snapshot(binary_file, known_jobs)
+    return len(known_jobs)
+
+
+def binary_to_json(binary_file: Path, json_file: Path) -> int:
+    """
+    把二进制快照转换回 jobs.json（原子写入）
+
+    Args:
+        binary_file: 二进制快照路径
+        json_file: JSON 存储文件路径
+
+    Returns:
+        转换的记录数量
+    """
+    known_jobs = read_snapshot(binary_file)
+    data = {
+        "jobs": known_jobs,
+        "updated_at": datetime.utcnow().isoformat(),
+        "total_count": len(known_jobs),
+    }
+    temp_file = json_file.with_suffix(json_file.suffix + ".tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, json_file)
+    return len(known_jobs)
@@ -0,0 +1,254 @@
+"""
+SQLite 存储后端
+
+与 StorageManager 接口相同，但不再每次运行加载、重写整个 jobs.json：
+- unique_id 为主键（唯一索引），added_at 单独建索引
+- find_new_jobs 按批执行集合成员查询
+- cleanup_old_jobs 是走 added_at 索引的 DELETE（按数据源保留期分组）
+- 提供从 jobs.json 一次性迁移的工具：python -m storage to-sqlite [jobs.json] [jobs.db]
+"""
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from scrapers.base import Job
+from .expiry import get_retention_cutoffs
+import config
+
+logger = logging.getLogger(__name__)
+
+# 单条 IN 查询的最大参数数量（低于旧版 SQLite 的 999 上限）
+QUERY_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    unique_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    added_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_added_at ON jobs (added_at);
+"""
+
+# 已存在时覆盖（与 JSON 存储的 add_job 一致，会刷新 added_at）
+UPSERT_SQL = (
+    "INSERT OR REPLACE INTO jobs "
+    "(unique_id, title, company, url, source, added_at) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+class SQLiteStorageManager:
+    """SQLite 存储管理器"""
+
+    def __init__(self, db_file: Optional[Path] = None):
+        """
+        初始化存储管理器
+
+        Args:
+            db_file: 数据库文件路径（默认使用配置）
+        """
+        self.db_file = db_file or config.SQLITE_FILE
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_file)
+        self._conn.executescript(SCHEMA)
+        self._transaction_depth = 0
+        logger.info(f"Opened SQLite storage with {self._count()} known jobs")
+
+    def _count(self) -> int:
+        """已知职位数量"""
+        return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        """关闭数据库连接"""
+        self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteStorageManager"]:
+        """
+        工作单元：块内的所有修改在退出时一次提交（可嵌套）
+
+        Yields:
+            存储管理器自身
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            self._commit()
+
+    def _commit(self):
+        """提交事务（处于工作单元内时推迟到工作单元结束）"""
+        if self._transaction_depth == 0 and self._conn.in_transaction:
+            self._conn.commit()
+
+    def is_known(self, job: Job) -> bool:
+        """
+        检查职位是否已知
+
+        Args:
+            job: Job 对象
+
+        Returns:
+            True 如果职位已存在
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM jobs WHERE unique_id = ?", (job.unique_id,)
+        ).fetchone()
+        return row is not None
+
+    def _find_known_ids(self, unique_ids: list[str]) -> set[str]:
+        """批量查询已存在的 unique_id"""
+        known = set()
+        for start in range(0, len(unique_ids), QUERY_BATCH_SIZE):
+            batch = unique_ids[start:start + QUERY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT unique_id FROM jobs WHERE unique_id IN ({placeholders})", batch
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def _upsert(self, rows: Iterable[tuple]):
+        """写入职位行（不提交事务）"""
+        self._conn.executemany(UPSERT_SQL, rows)
+
+    def add_job(self, job: Job):
+        """
+        添加职位到存储
+
+        Args:
+            job: Job 对象
+        """
+        self.add_jobs([job])
+
+    def add_jobs(self, jobs: list[Job]):
+        """
+        批量添加职位
+
+        Args:
+            jobs: Job 对象列表
+        """
+        added_at = datetime.utcnow().isoformat()
+        self._upsert(
+            (job.unique_id, job.title, job.company, job.url, job.source, added_at)
+            for job in jobs
+        )
+        self._commit()
+
+    def find_new_jobs(self, jobs: list[Job]) -> list[Job]:
+        """
+        从职位列表中找出新职位
+
+        Args:
+            jobs: 所有职位列表
+
+        Returns:
+            新职位列表
+        """
+        known = self._find_known_ids([job.unique_id for job in jobs])
+        new_jobs = [job for job in jobs if job.unique_id not in known]
+
+        logger.debug(f"Found {len(new_jobs)} new jobs out of {len(jobs)}")
+        return new_jobs
+
+    def mark_as_seen(self, jobs: list[Job]):
+        """
+        标记职位为已见（保存到存储）
+
+        Args:
+            jobs: Job 对象列表
+        """
+        self.add_jobs(jobs)
+        logger.info(f"Saved {len(jobs)} jobs to storage ({self._count()} total)")
+
+    def get_stats(self) -> dict:
+        """获取存储统计信息"""
+        return {
+            "total_jobs": self._count(),
+            "storage_file": str(self.db_file),
+        }
+
+    def is_first_run(self) -> bool:
+        """
+        检查是否首次运行
+
+        Returns:
+            True 如果存储为空（首次运行）
+        """
+        return self._conn.execute("SELECT 1 FROM jobs LIMIT 1").fetchone() is None
+
+    def cleanup_old_jobs(self, days: Optional[int] = None):
+        """
+        清理超过保留期的旧职位记录（每个保留期一条走索引的 DELETE）
+
+        Args:
+            days: 默认保留天数（默认使用配置 RETENTION_DAYS；
+                  SOURCE_RETENTION_DAYS 中配置的数据源使用各自的天数）
+        """
+        default_cutoff, source_cutoffs = get_retention_cutoffs(days)
+
+        sources = list(source_cutoffs)
+        placeholders = ",".join("?" * len(sources))
+        removed = self._conn.execute(
+            f"DELETE FROM jobs WHERE added_at <= ? AND source NOT IN ({placeholders})",
+            [default_cutoff, *sources],
+        ).rowcount
+        for source, cutoff in source_cutoffs.items():
+            removed += self._conn.execute(
+                "DELETE FROM jobs WHERE added_at <= ? AND source = ?", (cutoff, source)
+            ).rowcount
+        self._commit()
+
+        if removed > 0:
+            logger.info(f"Cleaned up {removed} old jobs")
+
+
+def migrate_json_to_sqlite(
+    json_file: Optional[Path] = None,
+    db_file: Optional[Path] = None
+) -> int:
+    """
+    把 jobs.json 中的已知职位导入 SQLite（保留原 added_at，可重复执行）
+
+    Args:
+        json_file: JSON 存储文件路径（默认使用配置）
+        db_file: 数据库文件路径（默认使用配置）
+
+    Returns:
+        导入的职位数量
+    """
+    json_file = json_file or config.STORAGE_FILE
+    if not json_file.exists():
+        logger.info(f"No JSON storage at {json_file}, nothing to migrate")
+        return 0
+
+    with open(json_file, "r", encoding="utf-8") as f:
+        known_jobs: dict[str, dict] = json.load(f).get("jobs", {})
+
+    storage = SQLiteStorageManager(db_file)
+    try:
+        with storage._conn:
+            storage._upsert(
+                (
+                    unique_id,
+                    data.get("title", ""),
+                    data.get("company", ""),
+                    data.get("url", ""),
+                    data.get("source", ""),
+                    data.get("added_at", "2020-01-01"),
+                )
+                for unique_id, data in known_jobs.items()
+            )
+    finally:
+        storage.close()
+
+    logger.info(f"Migrated {len(known_jobs)} jobs from {json_file} to {storage.db_file}")
+    return len(known_jobs)
+
@@ -0,0 +1,110 @@
+"""
+测试公共配置
+"""
+import asyncio
+import json
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config  # noqa: E402
+from scrapers import Job  # noqa: E402
+from scrapers import cache as scraper_cache, retry as scraper_retry  # noqa: E402
+
+
+@pytest.fixture
+def make_job():
+    """按编号生成测试职位"""
+
+    def make(index: int, source: str = "Test Portfolio") -> Job:
+        return Job(
+            title=f"Research Analyst {index}",
+            company="Test Labs",
+            url=f"https://jobs.example.com/{index}",
+            source=source,
+        )
+
+    return make
+
+
+class StubResponse:
+    """requests 风格的桩响应"""
+
+    def __init__(self, status: int = 200, body=b"", headers: Optional[dict] = None):
+        if not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+        self.status = self.status_code = status
+        self.content = body.encode() if isinstance(body, str) else body
+        self.headers = headers or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise requests.HTTPError(f"HTTP {self.status}")
+
+
+class AsyncStubResponse(StubResponse):
+    """aiohttp 风格的桩响应：read / json / text 都是协程方法"""
+
+    async def read(self) -> bytes:
+        return self.content
+
+    async def json(self, content_type=None):
+        return json.loads(self.content)
+
+    async def text(self) -> str:
+        return self.content.decode("utf-8")
+
+
+class StubTransport:
+    """
+    桩传输层：按 (方法, URL) 返回预设响应并记录所有请求
+
+    handler(method, url, kwargs) 返回 StubResponse 的构造参数 (status, body, headers)。
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests: list[tuple[str, str, dict]] = []
+
+    def _respond(self, method: str, url: str, kwargs: dict, response_class):
+        self.requests.append((method, url, kwargs))
+        return response_class(*self.handler(method, url, kwargs))
+
+    def request(self, method: str, url: str, **kwargs) -> StubResponse:
+        return self._respond(method, url, kwargs, StubResponse)
+
+    @asynccontextmanager
+    async def request_async(self, method: str, url: str, session=None, **kwargs):
+        await asyncio.sleep(0)
+        yield self._respond(method, url, kwargs, AsyncStubResponse)
+
+
+@pytest.fixture
+def scraper_state(tmp_path, monkeypatch):
+    """爬虫共享的响应缓存、详情缓存和熔断器改用临时目录"""
+    monkeypatch.setattr(config, "HTTP_CACHE_FILE", tmp_path / "http_cache.json")
+    monkeypatch.setattr(config, "DETAIL_CACHE_FILE", tmp_path / "detail_cache.json")
+    monkeypatch.setattr(config, "CIRCUIT_BREAKER_FILE", tmp_path / "circuit_breaker.json")
+    monkeypatch.setattr(scraper_cache, "_default_cache", None)
+    monkeypatch.setattr(scraper_cache, "_default_detail_cache", None)
+    monkeypatch.setattr(scraper_retry, "_default_breaker", None)
+    return tmp_path
+
+
+@pytest.fixture
+def stub_transport():
+    """桩传输层工厂：stub_transport(handler)"""
+    return StubTransport
@@ -0,0 +1,58 @@
+"""
+摘要装箱测试
+"""
+import pytest
+
+import config
+from notifier import pack_digests
+from scrapers import Job
+
+
+def make_jobs() -> list[Job]:
+    """多家公司的普通职位 + 各字段超长的职位"""
+    jobs = [
+        Job(
+            title=f"Research Analyst {index} & Strategy",
+            company=f"Company {index % 7}",
+            url=f"https://jobs.example.com/{index}",
+            source=f"Portfolio {index % 3}",
+            location="New York" if index % 2 else "",
+            description="Research" if index % 3 else "",
+        )
+        for index in range(300)
+    ]
+    jobs += [
+        Job(title="Long department", company="Company 1", url="https://jobs.example.com/d",
+            source="Portfolio 0", description="R&D " * 2000),
+        Job(title="Long location", company="Company 2", url="https://jobs.example.com/l",
+            source="Portfolio 1", location="<Remote> " * 1000, remote=True),
+        Job(title="Long link", company="Company 3", url="https://jobs.example.com/" + "x" * 5000,
+            source="Portfolio 2"),
+        Job(title="Long title & more " * 500, company="Company 4", url="https://jobs.example.com/t",
+            source="Portfolio 0"),
+        Job(title="Long company", company="Big & Co " * 1000, url="https://jobs.example.com/c",
+            source="Portfolio 1"),
+    ]
+    return jobs
+
+
+@pytest.mark.parametrize("group_by", ["company", "source"])
+@pytest.mark.parametrize("max_length", [None, 500])
+def test_messages_fit_limit_and_keep_every_job_once(group_by, max_length):
+    jobs = make_jobs()
+    messages = pack_digests(jobs, group_by, max_length)
+
+    limit = max_length or config.TELEGRAM_MESSAGE_LIMIT
+    assert all(len(text) <= limit for text, _ in messages)
+    packed = [job.unique_id for _, message_jobs in messages for job in message_jobs]
+    assert sorted(packed) == sorted(job.unique_id for job in jobs)
+    for text, message_jobs in messages:
+        assert text.startswith(f"🆕 <b>{len(message_jobs)} new jobs</b>")
+
+
+def test_overlong_line_is_truncated_without_breaking_entities():
+    job = Job(title="Analyst & Research", company="Test Labs", url="https://jobs.example.com/1",
+              source="Test", description="R&D " * 2000)
+    [(text, _)] = pack_digests([job], "company")
+    assert '<a href="https://jobs.example.com/1">Analyst &amp; Research</a>' in text
+    assert "R&amp;D" not in text
@@ -0,0 +1,91 @@
+"""
+并发爬取引擎测试（流式产出、全局与按主机并发限制）
+"""
+import asyncio
+
+from scrapers import GreenhouseScraper, ScrapeEngine, stream_jobs_async
+from scrapers.base import BaseScraper, Job
+
+
+class SlowScraper(BaseScraper):
+    """异步爬虫桩：记录同一主机和全局的最大并发数"""
+
+    def __init__(self, name: str, host: str, delay: float, tracker: dict):
+        super().__init__(name=name, source_name=name)
+        self.api_url = f"https://{host}/jobs"
+        self.host = host
+        self.delay = delay
+        self.tracker = tracker
+
+    def fetch_jobs(self) -> list[Job]:
+        raise NotImplementedError
+
+    async def fetch_jobs_async(self, session=None) -> list[Job]:
+        active = self.tracker.setdefault("active", {})
+        active[self.host] = active.get(self.host, 0) + 1
+        self.tracker["total"] = self.tracker.get("total", 0) + 1
+        self.tracker["max_host"] = max(self.tracker.get("max_host", 0), active[self.host])
+        self.tracker["max_total"] = max(self.tracker.get("max_total", 0), self.tracker["total"])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            active[self.host] -= 1
+            self.tracker["total"] -= 1
+        return [Job(title=self.name, company="Test Labs", url=f"{self.api_url}/1", source=self.name)]
+
+
+async def collect(scrapers, **limits) -> list[tuple[int, list[str]]]:
+    engine = ScrapeEngine(**limits)
+    return [
+        (index, [job.title for job in jobs])
+        async for index, jobs in engine.stream_async(scrapers)
+    ]
+
+
+def test_batches_are_yielded_in_completion_order():
+    tracker = {}
+    scrapers = [
+        SlowScraper("slow", "a.example.com", 0.05, tracker),
+        SlowScraper("fast", "b.example.com", 0.0, tracker),
+    ]
+    assert asyncio.run(collect(scrapers)) == [(1, ["fast"]), (0, ["slow"])]
+
+
+def test_global_and_per_host_limits():
+    tracker = {}
+    scrapers = [
+        SlowScraper(f"board-{index}", f"host-{index % 2}.example.com", 0.01, tracker)
+        for index in range(8)
+    ]
+    results = asyncio.run(collect(scrapers, max_concurrency=3, max_per_host=1))
+    assert sorted(index for index, _ in results) == list(range(8))
+    assert tracker["max_host"] == 1
+    assert tracker["max_total"] == 2
+
+    tracker.clear()
+    asyncio.run(collect(scrapers, max_concurrency=3, max_per_host=4))
+    assert tracker["max_total"] == 3
+
+
+def test_failing_board_does_not_stop_others(stub_transport, scraper_state):
+    """单个 board 出错时返回空列表，其他 board 的职位照常产出"""
+
+    def handler(method, url, kwargs):
+        if "broken" in url:
+            return 500, "", {}
+        return 200, {"jobs": [{"id": 1, "title": "Research Analyst", "absolute_url": f"{url}/1"}]}, {}
+
+    transport = stub_transport(handler)
+    scrapers = [
+        GreenhouseScraper("Broken", "broken", "Test", transport),
+        GreenhouseScraper("Working", "working", "Test", transport),
+    ]
+
+    async def run():
+        return [(index, jobs) async for index, jobs in stream_jobs_async(scrapers)]
+
+    results = asyncio.run(run())
+    assert [(index, [job.company for job in jobs]) for index, jobs in results] == [(1, ["Working"])]
+    # 5xx 计为失败，成功的 board 不留下熔断记录
+    assert scrapers[0].circuit_breaker._state["greenhouse_broken"]["failures"] == 1
+    assert "greenhouse_working" not in scrapers[0].circuit_breaker._state
@@ -0,0 +1,70 @@
+"""
+过滤判定缓存测试（LRU 淘汰、关键词变化时失效）
+"""
+import json
+
+import config
+from filters import JobFilter
+from filters.decision_cache import DecisionCache, keyword_fingerprint
+from scrapers import Job
+
+
+def job(title: str) -> Job:
+    return Job(title=title, company="Test Labs", url="https://jobs.example.com/1", source="Test")
+
+
+def test_least_recently_used_title_is_evicted(tmp_path):
+    cache_file = tmp_path / "filter_cache.json"
+    cache = DecisionCache("fp", cache_file, max_size=2)
+    cache.put("Research Analyst", True)
+    cache.put("Software Engineer", False)
+    assert cache.get("research analyst ") is True  # 规范化后命中，并标记为最近使用
+    cache.put("Investment Associate", True)
+
+    assert cache.get("Software Engineer") is None
+    assert cache.get("Research Analyst") is True
+    cache.save()
+
+    saved = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert list(saved["decisions"]) == ["investment associate", "research analyst"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_is_discarded_when_fingerprint_changes(tmp_path):
+    cache_file = tmp_path / "filter_cache.json"
+    cache = DecisionCache("old", cache_file)
+    cache.put("Research Analyst", True)
+    cache.save()
+
+    assert DecisionCache("old", cache_file).get("Research Analyst") is True
+    changed = DecisionCache("new", cache_file)
+    assert changed.get("Research Analyst") is None
+    changed.save()
+    # 失效后重写文件，旧判定不会在之后的运行中复活
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["fingerprint"] == "new"
+    assert DecisionCache("old", cache_file).get("Research Analyst") is None
+
+
+def test_job_filter_does_not_reuse_decisions_after_keyword_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "FILTER_CACHE_FILE", tmp_path / "filter_cache.json")
+    title = job("Research Analyst")
+
+    first = JobFilter(["analyst"], ["intern"], use_cache=True)
+    assert first.should_include(title)
+    first.save_cache()
+
+    same = JobFilter(["analyst"], ["intern"], use_cache=True)
+    assert same.should_include(title)
+    assert same.get_cache_stats() == (1, 1)
+
+    changed = JobFilter(["analyst"], ["research"], use_cache=True)
+    assert not changed.should_include(title)
+    assert changed.get_cache_stats() == (0, 1)
+
+
+def test_fingerprint_depends_on_both_keyword_lists():
+    base = keyword_fingerprint(["analyst"], ["intern"])
+    assert base == keyword_fingerprint(["analyst"], ["intern"])
+    assert base != keyword_fingerprint(["analyst", "research"], ["intern"])
+    assert base != keyword_fingerprint(["analyst"], ["intern", "sales"])
+    assert base != keyword_fingerprint(["intern"], ["analyst"])
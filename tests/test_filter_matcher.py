@@ -0,0 +1,81 @@
+"""
+关键词匹配器与 JobFilter 测试（与旧版逐个关键词 re.search 的判定保持一致）
+"""
+import random
+import re
+
+import pytest
+
+import config
+from filters import JobFilter
+from filters.matcher import KeywordMatcher
+from scrapers import Job
+
+
+class LegacyFilter:
+    """旧版过滤器：每个关键词一个正则，先查排除再查包含"""
+
+    def __init__(self, include_keywords: list[str], exclude_keywords: list[str]):
+        self._include = [self._compile(k) for k in include_keywords]
+        self._exclude = [self._compile(k) for k in exclude_keywords]
+
+    @staticmethod
+    def _compile(keyword: str) -> re.Pattern:
+        return re.compile(rf"\b{re.escape(keyword.strip())}\b", re.IGNORECASE)
+
+    def should_include(self, job: Job) -> bool:
+        title = job.title.lower()
+        if any(pattern.search(title) for pattern in self._exclude):
+            return False
+        return any(pattern.search(title) for pattern in self._include)
+
+
+def job(title: str) -> Job:
+    return Job(title=title, company="Test Labs", url="https://jobs.example.com/1", source="Test")
+
+
+def assert_same_decisions(include: list[str], exclude: list[str], titles: list[str]):
+    legacy = LegacyFilter(include, exclude)
+    job_filter = JobFilter(include, exclude)
+    for title in titles:
+        assert job_filter.should_include(job(title)) == legacy.should_include(job(title)), title
+
+
+def test_padded_short_keyword_matches_whole_word_only():
+    titles = ["BD Lead", "Head of BD", "bd", "BD/Partnerships", "Abdul BDR", "Ebdx Manager"]
+    assert_same_decisions([" bd "], [" hr "], titles)
+    assert [JobFilter([" bd "], [" hr "]).should_include(job(t)) for t in titles] == [
+        True, True, True, True, False, False,
+    ]
+
+
+def test_overlapping_keywords_are_all_reported():
+    matcher = KeywordMatcher({"long": ["business development"], "short": ["development"]})
+    assert matcher.find_groups("Business Development Manager") == {"long", "short"}
+    assert matcher.find_groups("Software Development") == {"short"}
+
+
+@pytest.mark.parametrize("include, exclude, title", [
+    (["business development"], ["development"], "Business Development Lead"),
+    (["development"], ["business development"], "Business Development Lead"),
+    (["research analyst"], ["research"], "Research Analyst"),
+    (["research"], ["research analyst"], "Research Analyst"),
+    (["analyst"], ["intern"], "Analyst Intern"),
+    (["analyst"], ["intern"], "Intern, Analyst"),
+])
+def test_exclude_wins_over_include(include, exclude, title):
+    assert not JobFilter(include, exclude).should_include(job(title))
+    assert_same_decisions(include, exclude, [title])
+
+
+def test_matches_legacy_filter_on_configured_keywords():
+    rng = random.Random(7)
+    vocabulary = [keyword.strip() for keyword in config.INCLUDE_KEYWORDS + config.EXCLUDE_KEYWORDS]
+    fillers = ["senior", "lead", "head of", "remote", "web3", "-", "&", "(contract)", "ii"]
+    titles = []
+    for _ in range(3000):
+        words = rng.sample(fillers, rng.randint(1, 3)) + rng.sample(vocabulary, rng.randint(0, 2))
+        rng.shuffle(words)
+        title = " ".join(words)
+        titles.append(title.title() if rng.random() < 0.5 else title)
+    assert_same_decisions(config.INCLUDE_KEYWORDS, config.EXCLUDE_KEYWORDS, titles)
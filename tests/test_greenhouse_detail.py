@@ -0,0 +1,82 @@
+"""
+Greenhouse 两级获取测试（列表不带描述，只为需要的职位按需请求详情并缓存）
+"""
+import asyncio
+
+import pytest
+
+from scrapers import DetailCache, GreenhouseScraper, apply_cached_details, enrich_jobs_async
+
+API_URL = "https://boards-api.greenhouse.io/v1/boards/labs/jobs"
+
+
+def handler(method, url, kwargs):
+    if url == API_URL:
+        return 200, {"jobs": [
+            {"id": job_id, "title": f"Research Analyst {job_id}",
+             "absolute_url": f"https://gh.example.com/{job_id}"}
+            for job_id in (1, 2, 3)
+        ]}, {}
+    job_id = url.rsplit("/", 1)[1]
+    if job_id == "3":
+        return 404, {}, {}
+    return 200, {"id": job_id, "content": "<p>long description</p>",
+                 "departments": [{"name": f"Research {job_id}"}]}, {}
+
+
+def make_scraper(transport, cache_dir) -> GreenhouseScraper:
+    scraper = GreenhouseScraper("Test Labs", "labs", "Test", transport)
+    scraper.cache = None
+    scraper.detail_cache = DetailCache(cache_dir / "detail_cache.json")
+    return scraper
+
+
+def detail_requests(transport) -> list[str]:
+    return [url for _, url, _ in transport.requests if url != API_URL]
+
+
+def test_listing_does_not_request_content(stub_transport, scraper_state):
+    transport = stub_transport(handler)
+    jobs = make_scraper(transport, scraper_state).fetch_jobs()
+    assert [job.external_id for job in jobs] == ["1", "2", "3"]
+    assert all(job.description == "" for job in jobs)
+    assert "params" not in transport.requests[0][2]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_details_are_fetched_once_and_cached(stub_transport, scraper_state, use_async):
+    transport = stub_transport(handler)
+    scraper = make_scraper(transport, scraper_state)
+    jobs = scraper.fetch_jobs()
+
+    def enrich(selected):
+        if use_async:
+            return asyncio.run(enrich_jobs_async([scraper], selected))
+        return scraper.enrich_jobs(selected)
+
+    # 只为传入的（通过过滤的新）职位请求详情
+    enrich(jobs[:1])
+    assert detail_requests(transport) == [f"{API_URL}/1"]
+    assert jobs[0].description == "Research 1"
+
+    enrich(jobs)
+    assert detail_requests(transport) == [f"{API_URL}/1", f"{API_URL}/2", f"{API_URL}/3"]
+    assert [job.description for job in jobs] == ["Research 1", "Research 2", ""]
+
+    # 失败的详情不写入缓存，下次重试；已缓存的不再请求
+    enrich(jobs)
+    assert detail_requests(transport)[3:] == [f"{API_URL}/3"]
+
+
+def test_cached_details_apply_without_requests(stub_transport, scraper_state):
+    transport = stub_transport(handler)
+    scraper = make_scraper(transport, scraper_state)
+    scraper.enrich_jobs(scraper.fetch_jobs()[:2])
+    scraper.detail_cache.save()
+
+    scraper = make_scraper(transport, scraper_state)
+    jobs = scraper.fetch_jobs()
+    requests_before = len(transport.requests)
+    apply_cached_details([scraper], jobs)
+    assert len(transport.requests) == requests_before
+    assert [job.description for job in jobs] == ["Research 1", "Research 2", ""]
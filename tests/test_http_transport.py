@@ -0,0 +1,138 @@
+"""
+HTTP 传输层测试（本地 aiohttp stub 服务器：重试、主机重定向、连接复用、注入）
+"""
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from http_utils import RetryPolicy
+from scrapers import create_all_scrapers
+from scrapers.http import HttpTransport, set_default_transport
+
+
+async def serve(app: web.Application, test):
+    """启动本地服务器并把 ats.example.com 重定向过去"""
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    transport = HttpTransport(
+        host_overrides={"ats.example.com": f"http://127.0.0.1:{port}"},
+        headers={},
+        retry_policy=RetryPolicy(max_retries=2, backoff_base=0.01, backoff_max=0.05),
+    )
+    try:
+        return await test(transport)
+    finally:
+        await transport.aclose()
+        await runner.cleanup()
+
+
+def stalling_app(stalls: int) -> tuple[web.Application, list[str]]:
+    """前 stalls 次请求只发送响应头和部分响应体，之后正常返回"""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        response = web.StreamResponse()
+        response.content_length = len(b'{"jobs": []}')
+        response.content_type = "application/json"
+        await response.prepare(request)
+        if len(calls) <= stalls:
+            await response.write(b'{"jobs"')
+            await asyncio.sleep(0.5)
+            return response
+        await response.write(b'{"jobs": []}')
+        return response
+
+    app = web.Application()
+    app.router.add_get("/boards", handler)
+    return app, calls
+
+
+async def fetch_json(transport):
+    async with transport.request_async(
+        "GET", "https://ats.example.com/boards",
+        timeout=aiohttp.ClientTimeout(sock_read=0.2),
+    ) as response:
+        return await response.json()
+
+
+def test_body_read_timeout_is_retried():
+    app, calls = stalling_app(stalls=1)
+    assert asyncio.run(serve(app, fetch_json)) == {"jobs": []}
+    assert calls == ["/boards", "/boards"]
+
+
+def test_body_read_timeout_raises_after_retries():
+    app, calls = stalling_app(stalls=5)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(serve(app, fetch_json))
+    assert len(calls) == 3
+
+
+def test_retryable_status_is_retried():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        if len(calls) == 1:
+            return web.Response(status=503)
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/boards", handler)
+
+    async def test(transport):
+        async with transport.request_async("GET", "https://ats.example.com/boards") as response:
+            return response.status, await response.json()
+
+    assert asyncio.run(serve(app, test)) == (200, {"ok": True})
+    assert len(calls) == 2
+
+
+def test_resolve_url_applies_host_overrides():
+    transport = HttpTransport(host_overrides={"api.lever.co": "http://127.0.0.1:8080/stub/"})
+    assert transport.resolve_url("https://api.lever.co/v0/postings/labs?mode=json") == (
+        "http://127.0.0.1:8080/stub/v0/postings/labs?mode=json"
+    )
+    assert transport.resolve_url("https://api.ashbyhq.com/v1") == "https://api.ashbyhq.com/v1"
+    transport.close()
+
+
+def test_connections_are_reused_per_host():
+    peers = []
+
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/boards", handler)
+
+    async def test(transport):
+        for _ in range(3):
+            async with transport.request_async("GET", "https://ats.example.com/boards") as response:
+                await response.json()
+
+    asyncio.run(serve(app, test))
+    assert len(peers) == 3 and len(set(peers)) == 1
+
+
+def test_scrapers_use_injected_transport(scraper_state):
+    transport = HttpTransport()
+    scrapers = create_all_scrapers(transport)
+    assert scrapers and all(scraper.transport is transport for scraper in scrapers)
+
+    # 未注入时使用（可替换的）默认传输层
+    default = HttpTransport()
+    set_default_transport(default)
+    try:
+        assert all(scraper.transport is default for scraper in create_all_scrapers())
+    finally:
+        set_default_transport(None)
+        default.close()
+        transport.close()
@@ -0,0 +1,41 @@
+"""
+通知发件箱测试
+"""
+import json
+
+from storage import Outbox
+
+
+def test_retried_job_acked_in_run_is_not_enqueued_again(tmp_path, make_job):
+    """上次未送达的职位本次重发并确认后，再被爬虫抓到也不会重复入队"""
+    outbox_file = tmp_path / "outbox.json"
+    outbox = Outbox(outbox_file)
+    assert outbox.enqueue(make_job(1))
+    outbox.save()
+
+    # 下一次运行：先重发，确认送达后同一职位又从爬虫流中出现
+    outbox = Outbox(outbox_file)
+    [retried] = outbox.pending()
+    assert retried.unique_id == make_job(1).unique_id
+    outbox.ack(retried)
+    assert not outbox.enqueue(make_job(1))
+    assert outbox.enqueue(make_job(2))
+    outbox.save()
+
+    stats = outbox.get_stats()
+    assert (stats["delivered"], stats["enqueued"], stats["backlog"]) == (1, 1, 1)
+    entries = json.loads(outbox_file.read_text(encoding="utf-8"))["entries"]
+    assert list(entries) == [make_job(2).unique_id]
+
+
+def test_unacked_job_is_retried_once_per_run(tmp_path, make_job):
+    """未确认的职位在本次运行中不会重复入队，下次运行时重发"""
+    outbox_file = tmp_path / "outbox.json"
+    outbox = Outbox(outbox_file)
+    assert outbox.enqueue(make_job(1))
+    assert not outbox.enqueue(make_job(1))
+    outbox.save()
+
+    outbox = Outbox(outbox_file)
+    assert [job.unique_id for job in outbox.pending()] == [make_job(1).unique_id]
+    assert make_job(1).unique_id in outbox
@@ -0,0 +1,89 @@
+"""
+流式处理管道测试（去重、过滤、新职位检测、跨 board 去重的确定性）
+"""
+from filters import JobFilter
+from pipeline import JobPipeline, deduplicate, detect_new, filter_stream
+from scrapers import Job
+from storage import StorageManager
+
+
+def job(title: str, source: str = "Board A", index: int = 1) -> Job:
+    return Job(
+        title=title,
+        company="Test Labs",
+        url=f"https://jobs.example.com/{index}",
+        source=source,
+    )
+
+
+def open_storage(path) -> StorageManager:
+    return StorageManager(path / "jobs.json", journal=False, bloom=False, snapshot_format="json")
+
+
+def research_filter() -> JobFilter:
+    return JobFilter(include_keywords=["research"], exclude_keywords=["intern"])
+
+
+def test_stages_compose_as_generators(tmp_path):
+    storage = open_storage(tmp_path)
+    storage.mark_as_seen([job("Research Analyst", index=1)])
+    jobs = [
+        job("Research Analyst", index=1),
+        job("Research Associate", index=2),
+        job("Research Associate", index=2),
+        job("Research Intern", index=3),
+        job("Product Designer", index=4),
+    ]
+
+    seen: set[str] = set()
+    new_jobs = list(detect_new(filter_stream(deduplicate(jobs, seen), research_filter()), storage))
+    assert [(j.title, j.url) for j in new_jobs] == [("Research Associate", "https://jobs.example.com/2")]
+    assert len(seen) == 4
+
+
+def test_pipeline_yields_new_jobs_batch_by_batch(tmp_path):
+    pipeline = JobPipeline(open_storage(tmp_path), research_filter())
+    assert [j.url for j in pipeline.process(0, [job("Research Analyst", index=1)])] == [
+        "https://jobs.example.com/1"
+    ]
+    # 同一职位在后续批次中不再产出
+    assert list(pipeline.process(0, [job("Research Analyst", index=1), job("Designer", index=2)])) == []
+    assert (pipeline.collected, pipeline.unique, len(pipeline.new_jobs)) == (3, 2, 1)
+
+
+def run_batches(tmp_path, batches) -> JobPipeline:
+    pipeline = JobPipeline(open_storage(tmp_path), research_filter())
+    for index, jobs in batches:
+        list(pipeline.process(index, jobs))
+    return pipeline
+
+
+def test_cross_board_duplicate_keeps_lowest_scraper_index(tmp_path):
+    """无论哪个 board 先完成，重复职位都保留下标最小的爬虫的副本"""
+    board_a = (0, [job("Research Analyst", "Board A", 1)])
+    board_b = (1, [job("Research Analyst", "Board B", 1), job("Research Lead", "Board B", 2)])
+
+    results = []
+    for order, batches in enumerate([[board_a, board_b], [board_b, board_a]]):
+        pipeline = run_batches(tmp_path / str(order), batches)
+        results.append((
+            [(j.title, j.source) for j in pipeline.filtered_jobs],
+            sorted((j.title, j.source) for j in pipeline.new_jobs),
+            pipeline.unique,
+        ))
+
+    assert results[0] == results[1] == (
+        [("Research Analyst", "Board A"), ("Research Lead", "Board B")],
+        [("Research Analyst", "Board A"), ("Research Lead", "Board B")],
+        2,
+    )
+
+
+def test_get_sources_follows_scraper_order(tmp_path):
+    class Scraper:
+        def __init__(self, source_name):
+            self.source_name = source_name
+
+    pipeline = run_batches(tmp_path, [(2, [job("Designer", index=1)]), (0, [job("Designer", index=2)])])
+    scrapers = [Scraper("Board A"), Scraper("Board B"), Scraper("Board C")]
+    assert pipeline.get_sources(scrapers) == ["Board A", "Board C"]
@@ -0,0 +1,133 @@
+"""
+Getro / Consider 分页测试（collection ID 发现与缓存、并发分页、游标分页、提前结束）
+"""
+import asyncio
+import json
+
+import pytest
+
+from scrapers import ConsiderScraper, DetailCache, GetroScraper
+
+GETRO_BOARD = {"name": "Getro Portfolio", "base_url": "https://jobs.getro.example.com/"}
+CONSIDER_BOARD = {"name": "Consider Portfolio", "base_url": "https://jobs.consider.example.com"}
+BOARD_PAGE = (
+    '<html><script id="__NEXT_DATA__" type="application/json">'
+    + json.dumps({"props": {"pageProps": {"network": {"id": 42}}}})
+    + "</script></html>"
+)
+
+
+def getro_job(index: int) -> dict:
+    return {
+        "id": index,
+        "title": f"Research Analyst {index}",
+        "url": f"https://jobs.getro.example.com/{index}",
+        "organization": {"name": "Test Labs"},
+        "locations": ["Remote"],
+        "created_at": 1700000000,
+    }
+
+
+def getro_handler(total, pages=None):
+    """每页 2 条；total 为 None 时不返回总数，pages 指定每页条数"""
+
+    def handler(method, url, kwargs):
+        if method == "GET":
+            return 200, BOARD_PAGE, {}
+        assert url == "https://api.getro.com/api/v2/collections/42/search/jobs"
+        page = kwargs["json"]["page"]
+        if pages is not None:
+            count = pages[page] if page < len(pages) else 2
+        else:
+            count = max(0, min(2, total - page * 2))
+        results = {"jobs": [getro_job(page * 2 + offset) for offset in range(count)]}
+        if total is not None:
+            results["count"] = total
+        return 200, {"results": results}, {}
+
+    return handler
+
+
+def make_getro(transport, cache_dir) -> GetroScraper:
+    scraper = GetroScraper("test_board", GETRO_BOARD, transport)
+    scraper.detail_cache = DetailCache(cache_dir / "detail_cache.json")
+    scraper.page_size = 2
+    return scraper
+
+
+def collect_pages(scraper, use_async: bool) -> list[list[str]]:
+    if use_async:
+        async def run():
+            return [[job.external_id for job in jobs] async for jobs in scraper.stream_async()]
+        return asyncio.run(run())
+    return [[job.external_id for job in jobs] for jobs in scraper.iter_pages()]
+
+
+def search_pages(transport) -> list[int]:
+    return sorted(kwargs["json"]["page"] for method, _, kwargs in transport.requests if method == "POST")
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_getro_pages_until_total(stub_transport, scraper_state, use_async):
+    transport = stub_transport(getro_handler(total=5))
+    scraper = make_getro(transport, scraper_state)
+    assert collect_pages(scraper, use_async) == [["0", "1"], ["2", "3"], ["4"]]
+    assert search_pages(transport) == [0, 1, 2]
+
+    job = scraper.parse_page({"results": {"jobs": [getro_job(7)]}}).jobs[0]
+    assert (job.company, job.remote, job.posted_date) == ("Test Labs", True, "2023-11-14")
+
+
+def test_collection_id_is_discovered_once(stub_transport, scraper_state):
+    transport = stub_transport(getro_handler(total=1))
+    scraper = make_getro(transport, scraper_state)
+    collect_pages(scraper, use_async=True)
+    scraper.detail_cache.save()
+
+    # 下次运行从详情缓存读取 collection ID，不再请求 board 页面
+    collect_pages(make_getro(transport, scraper_state), use_async=False)
+    board_requests = [url for method, url, _ in transport.requests if method == "GET"]
+    assert board_requests == ["https://jobs.getro.example.com/jobs"]
+
+
+def test_getro_concurrent_pages_stop_at_short_page(stub_transport, scraper_state):
+    """没有总数时并发请求后续页，按页码顺序产出，遇到不足一页的结果即结束"""
+    transport = stub_transport(getro_handler(total=None, pages=[2, 2, 1]))
+    scraper = make_getro(transport, scraper_state)
+    scraper.max_pages = 10
+    scraper.page_concurrency = 3
+    assert collect_pages(scraper, use_async=True) == [["0", "1"], ["2", "3"], ["4"]]
+    assert len(search_pages(transport)) <= 1 + scraper.page_concurrency
+
+
+def consider_handler(method, url, kwargs):
+    assert url == "https://jobs.consider.example.com/api-boards/search-jobs"
+    sequences = {None: (0, "s1"), "s1": (2, "s2"), "s2": (4, None)}
+    start, cursor = sequences[kwargs["json"]["meta"].get("sequence")]
+    jobs = [
+        {"jobId": index, "title": f"Research Analyst {index}", "companyName": "Test Labs",
+         "url": f"https://jobs.consider.example.com/{index}", "locations": ["New York"]}
+        for index in range(start, min(start + 2, 5))
+    ]
+    return 200, {"jobs": jobs, "meta": {"sequence": cursor}, "total": 5}, {}
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_consider_follows_cursor(stub_transport, scraper_state, use_async):
+    transport = stub_transport(consider_handler)
+    scraper = ConsiderScraper("test_board", CONSIDER_BOARD, transport)
+    scraper.page_size = 2
+    assert collect_pages(scraper, use_async) == [["0", "1"], ["2", "3"], ["4"]]
+    assert [kwargs["json"]["meta"].get("sequence") for _, _, kwargs in transport.requests] == [
+        None, "s1", "s2"
+    ]
+    assert transport.requests[0][2]["json"]["board"]["id"] == "test-board"
+
+
+def test_max_pages_limits_pagination(stub_transport, scraper_state):
+    transport = stub_transport(consider_handler)
+    scraper = ConsiderScraper("test_board", CONSIDER_BOARD, transport)
+    scraper.page_size = 2
+    scraper.max_pages = 2
+    assert [job.external_id for job in scraper.fetch_jobs()] == ["0", "1", "2", "3"]
+    assert len(transport.requests) == 2
@@ -0,0 +1,121 @@
+"""
+重试退避、Retry-After 解析、令牌桶与熔断器测试
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from http_utils import RetryPolicy, TokenBucket, parse_retry_after
+from scrapers.retry import CircuitBreaker
+
+
+@pytest.mark.parametrize("attempt, status, expected", [
+    (1, None, True),
+    (1, 429, True),
+    (3, 503, True),
+    (1, 404, False),
+    (1, 200, False),
+    (4, None, False),
+])
+def test_should_retry(attempt, status, expected):
+    assert RetryPolicy(max_retries=3).should_retry(attempt, status) is expected
+
+
+def test_backoff_uses_full_jitter_within_exponential_ceiling():
+    policy = RetryPolicy(max_retries=10, backoff_base=1.0, backoff_max=5.0)
+    random.seed(0)
+    delays = [policy.get_delay(attempt) for attempt in range(1, 6) for _ in range(200)]
+    ceilings = [min(5.0, 2 ** (attempt - 1)) for attempt in range(1, 6) for _ in range(200)]
+    assert all(0 <= delay <= ceiling for delay, ceiling in zip(delays, ceilings))
+    # 抖动覆盖整个区间，而不是固定取上限
+    assert min(delays[-200:]) < 1.0 and max(delays[-200:]) > 4.0
+
+
+def test_retry_after_overrides_backoff_up_to_max():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=30.0)
+    assert policy.get_delay(1, retry_after=12.0) == 12.0
+    assert policy.get_delay(1, retry_after=31.0) is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("120", 120.0),
+    ("-5", 0.0),
+    ("", None),
+    (None, None),
+    ("soon", None),
+    ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(60, abs=2)
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    assert [bucket._reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket._reserve() == pytest.approx(0.5, abs=0.05)
+    assert bucket._reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_token_bucket_pause_delays_next_token():
+    bucket = TokenBucket(rate=100.0, capacity=10)
+    bucket.pause(5.0)
+    bucket.pause(1.0)  # 较短的暂停不会覆盖较长的暂停
+    assert bucket._reserve() == pytest.approx(5.0, abs=0.05)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("scrapers.retry.time.time", clock)
+    return clock
+
+
+def test_circuit_opens_at_threshold_and_half_opens_after_cooldown(tmp_path, clock):
+    breaker = CircuitBreaker(tmp_path / "circuit.json", threshold=3, cooldown=60)
+    for _ in range(2):
+        breaker.record_failure("Board")
+    assert breaker.allow("Board")
+
+    breaker.record_failure("Board")
+    assert not breaker.allow("Board")
+    assert breaker.get_open_circuits() == ["Board"]
+
+    clock.now += 61
+    assert breaker.allow("Board")
+    # 试探请求再次失败时立即重新熔断
+    breaker.record_failure("Board")
+    assert not breaker.allow("Board")
+
+
+def test_success_resets_failure_count(tmp_path, clock):
+    breaker = CircuitBreaker(tmp_path / "circuit.json", threshold=2, cooldown=60)
+    breaker.record_failure("Board")
+    breaker.record_success("Board")
+    breaker.record_failure("Board")
+    assert breaker.allow("Board")
+
+
+def test_circuit_state_persists(tmp_path, clock):
+    state_file = tmp_path / "circuit.json"
+    breaker = CircuitBreaker(state_file, threshold=1, cooldown=60)
+    breaker.record_failure("Board")
+    breaker.save()
+
+    assert CircuitBreaker(state_file, threshold=1, cooldown=60).get_open_circuits() == ["Board"]
+    clock.now += 61
+    assert CircuitBreaker(state_file, threshold=1, cooldown=60).get_open_circuits() == []
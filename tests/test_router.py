@@ -0,0 +1,126 @@
+"""
+多聊天通知路由测试（目标聊天计算、送达跟踪、配置校验）
+"""
+import asyncio
+
+import pytest
+
+from notifier import NotificationRouter, iter_queue
+from notifier.router import parse_routes
+from scrapers import Job
+
+ROUTES = {
+    "research": {"chat_id": "research-chat", "keywords": ["research", "analyst"]},
+    "investing": {"chat_id": "investing-chat", "keywords": ["investment", "analyst"]},
+}
+
+
+class FakeNotifier:
+    """记录每个聊天收到的职位；failing 中的聊天发送失败"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent: dict[str, list[str]] = {}
+
+    def _deliver(self, job, on_sent, chat_id) -> bool:
+        if chat_id in self.failing:
+            return False
+        self.sent.setdefault(chat_id, []).append(job.title)
+        if on_sent:
+            on_sent(job)
+        return True
+
+    async def send_job_stream(self, jobs, max_messages=None, on_sent=None, chat_id=None):
+        results = [self._deliver(job, on_sent, chat_id) async for job in jobs]
+        return results.count(True), results.count(False)
+
+    async def send_digest(self, jobs, group_by=None, max_messages=None, on_sent=None, chat_id=None):
+        results = [self._deliver(job, on_sent, chat_id) for job in jobs]
+        return int(all(results)), int(not all(results))
+
+
+def make_router(default_chat_id="default-chat", failing=()) -> NotificationRouter:
+    router = NotificationRouter(ROUTES, default_chat_id, bot_token="test-token")
+    router.notifier = FakeNotifier(failing)
+    return router
+
+
+def job(title: str) -> Job:
+    return Job(title=title, company="Test Labs", url=f"https://jobs.example.com/{title}", source="Test")
+
+
+async def stream(jobs):
+    queue = asyncio.Queue()
+    for item in jobs:
+        queue.put_nowait(item)
+    queue.put_nowait(None)
+    async for item in iter_queue(queue):
+        yield item
+
+
+def send(router, jobs, digest=False) -> list[str]:
+    """发送并返回送达（on_sent）的职位标题"""
+    delivered = []
+
+    def on_sent(sent_job):
+        delivered.append(sent_job.title)
+
+    if digest:
+        asyncio.run(router.send_digest_stream(stream(jobs), on_sent=on_sent))
+    else:
+        asyncio.run(router.send_job_stream(stream(jobs), on_sent=on_sent))
+    return delivered
+
+
+def test_route_matches_every_category_then_default():
+    router = make_router()
+    assert router.route(job("Research Engineer")) == ["research-chat"]
+    assert router.route(job("Investment Analyst")) == ["research-chat", "investing-chat"]
+    assert router.route(job("Product Designer")) == ["default-chat"]
+
+
+def test_unmatched_job_is_dropped_without_default_chat():
+    router = make_router(default_chat_id="")
+    assert router.route(job("Product Designer")) == []
+    # 没有目标聊天的职位视为已处理，不会留在发件箱中反复重发
+    assert send(router, [job("Product Designer")]) == ["Product Designer"]
+    assert router.notifier.sent == {}
+
+
+@pytest.mark.parametrize("digest", [False, True])
+def test_each_chat_receives_its_jobs(digest):
+    router = make_router()
+    jobs = [job("Research Engineer"), job("Investment Analyst"), job("Product Designer")]
+    assert sorted(send(router, jobs, digest)) == sorted(j.title for j in jobs)
+    assert router.notifier.sent == {
+        "research-chat": ["Research Engineer", "Investment Analyst"],
+        "investing-chat": ["Investment Analyst"],
+        "default-chat": ["Product Designer"],
+    }
+
+
+@pytest.mark.parametrize("digest", [False, True])
+def test_job_is_delivered_only_after_every_chat_accepts_it(digest):
+    router = make_router(failing={"investing-chat"})
+    jobs = [job("Research Engineer"), job("Investment Analyst")]
+    # 多类别职位在 investing-chat 发送失败，不算送达（下次运行重发）
+    assert send(router, jobs, digest) == ["Research Engineer"]
+
+
+@pytest.mark.parametrize("routes, message", [
+    ("{not json", "not valid JSON"),
+    ('["research"]', "JSON object"),
+    ({"research": {"keywords": ["research"]}}, "no chat_id"),
+    ({"research": {"chat_id": "1", "keywords": "research"}}, "list of strings"),
+    ({"research": {"chat_id": "1", "rate": "fast"}}, "positive number"),
+])
+def test_invalid_routes_raise_value_error(routes, message):
+    with pytest.raises(ValueError, match=message):
+        parse_routes(routes)
+    with pytest.raises(ValueError, match=message):
+        NotificationRouter(routes, "default-chat", bot_token="test-token")
+
+
+def test_routes_from_json_string():
+    assert parse_routes('{"research": {"chat_id": "1"}}') == {"research": {"chat_id": "1"}}
+    assert parse_routes("") == {}
@@ -0,0 +1,88 @@
+"""
+原生异步爬虫接口测试（同步与异步路径结果一致、默认线程回退、错误处理）
+"""
+import asyncio
+import threading
+
+import pytest
+
+from scrapers import GreenhouseScraper, LeverScraper
+from scrapers.base import BaseScraper, Job
+
+RESPONSES = {
+    "https://boards-api.greenhouse.io/v1/boards/labs/jobs": {"jobs": [
+        {"id": 11, "title": "Research Analyst", "absolute_url": "https://gh.example.com/11",
+         "location": {"name": "Remote - US"}},
+        {"id": 12, "title": "", "absolute_url": "https://gh.example.com/12"},
+    ]},
+    "https://api.lever.co/v0/postings/labs": [
+        {"id": "a1", "text": "Investment Associate", "hostedUrl": "https://lever.example.com/a1",
+         "categories": {"location": "New York", "team": "Investing", "commitment": "Full-time"}},
+    ],
+}
+
+
+def handler(method, url, kwargs):
+    return 200, RESPONSES[url], {}
+
+
+def make_scrapers(transport):
+    return [
+        GreenhouseScraper("Test Labs", "labs", "Test", transport),
+        LeverScraper("Test Labs", "labs", "Test", transport),
+    ]
+
+
+@pytest.mark.parametrize("index, expected", [
+    (0, [("Research Analyst", "Remote - US", True, "11")]),
+    (1, [("Investment Associate", "New York", False, "a1")]),
+])
+def test_sync_and_async_paths_parse_the_same_jobs(stub_transport, scraper_state, index, expected):
+    transport = stub_transport(handler)
+    sync_scraper, async_scraper = make_scrapers(transport)[index], make_scrapers(transport)[index]
+    sync_scraper.cache = async_scraper.cache = None
+
+    sync_jobs = sync_scraper.fetch_jobs()
+    async_jobs = asyncio.run(async_scraper.fetch_jobs_async())
+    summary = [(job.title, job.location, job.remote, job.external_id) for job in sync_jobs]
+    assert summary == expected
+    assert [job.to_dict() | {"scraped_at": ""} for job in async_jobs] == [
+        job.to_dict() | {"scraped_at": ""} for job in sync_jobs
+    ]
+
+
+class ThreadScraper(BaseScraper):
+    """只实现同步 fetch_jobs 的爬虫"""
+
+    def __init__(self, fail: bool = False):
+        super().__init__(name="thread", source_name="Test")
+        self.fail = fail
+        self.thread = None
+
+    def fetch_jobs(self) -> list[Job]:
+        self.thread = threading.current_thread()
+        if self.fail:
+            raise RuntimeError("board unavailable")
+        return [Job(
+            title="Research Analyst", company="Test Labs", url="https://jobs.example.com/1", source="Test"
+        )]
+
+
+def test_sync_scraper_runs_in_worker_thread():
+    scraper = ThreadScraper()
+
+    async def run():
+        return [jobs async for jobs in scraper.stream_async()]
+
+    batches = asyncio.run(run())
+    assert [[job.title for job in jobs] for jobs in batches] == [["Research Analyst"]]
+    assert scraper.thread is not threading.main_thread()
+
+
+def test_scrape_errors_yield_no_batches():
+    scraper = ThreadScraper(fail=True)
+
+    async def run():
+        return await scraper.scrape_async(), [jobs async for jobs in scraper.stream_async()]
+
+    assert asyncio.run(run()) == ([], [])
@@ -0,0 +1,109 @@
+"""
+HTTP 校验缓存测试（ETag / 304 复用、响应体哈希复用、请求变化时失效）
+"""
+import asyncio
+
+import pytest
+
+from scrapers import GreenhouseScraper, ResponseCache
+
+LISTING = {"jobs": [{"id": 1, "title": "Research Analyst", "absolute_url": "https://gh.example.com/1"}]}
+
+
+class Board:
+    """模拟 Greenhouse 列表接口：支持 ETag，可关闭校验头"""
+
+    def __init__(self, etag: str = '"v1"'):
+        self.etag = etag
+        self.listing = LISTING
+        self.not_modified = 0
+
+    def __call__(self, method, url, kwargs):
+        headers = {"ETag": self.etag} if self.etag else {}
+        if self.etag and kwargs["headers"].get("If-None-Match") == self.etag:
+            self.not_modified += 1
+            return 304, b"", headers
+        return 200, self.listing, headers
+
+
+def fetch(scraper, use_async: bool):
+    if use_async:
+        return asyncio.run(scraper.fetch_jobs_async())
+    return scraper.fetch_jobs()
+
+
+def make_scraper(transport, cache_file, parsed: list) -> GreenhouseScraper:
+    scraper = GreenhouseScraper("Test Labs", "labs", "Test", transport)
+    scraper.cache = ResponseCache(cache_file)
+    parse_jobs = scraper.parse_jobs
+
+    def counting_parse(data):
+        parsed.append(data)
+        return parse_jobs(data)
+
+    scraper.parse_jobs = counting_parse
+    return scraper
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_not_modified_reuses_cached_jobs(stub_transport, scraper_state, use_async):
+    board = Board()
+    transport = stub_transport(board)
+    parsed = []
+    scraper = make_scraper(transport, scraper_state / "http_cache.json", parsed)
+
+    first = fetch(scraper, use_async)
+    scraper.cache.save()
+
+    # 新进程：从磁盘加载缓存，带条件请求头，304 时不解析
+    scraper = make_scraper(transport, scraper_state / "http_cache.json", parsed)
+    second = fetch(scraper, use_async)
+    assert transport.requests[-1][2]["headers"]["If-None-Match"] == '"v1"'
+    assert board.not_modified == 1 and len(parsed) == 1
+    assert [job.to_dict() | {"scraped_at": ""} for job in second] == [
+        job.to_dict() | {"scraped_at": ""} for job in first
+    ]
+    assert scraper.cache.get_stats() == {"Test": {"hits": 1, "misses": 0}}
+
+
+def test_unchanged_body_without_validators_skips_parsing(stub_transport, scraper_state):
+    board = Board(etag="")
+    parsed = []
+    scraper = make_scraper(stub_transport(board), scraper_state / "http_cache.json", parsed)
+
+    fetch(scraper, use_async=False)
+    assert [job.title for job in fetch(scraper, use_async=False)] == ["Research Analyst"]
+    assert len(parsed) == 1
+
+    board.listing = {"jobs": LISTING["jobs"] + [
+        {"id": 2, "title": "Research Lead", "absolute_url": "https://gh.example.com/2"},
+    ]}
+    assert [job.title for job in fetch(scraper, use_async=False)] == ["Research Analyst", "Research Lead"]
+    assert len(parsed) == 2
+
+
+def test_unchanged_body_refreshes_validators(stub_transport, scraper_state):
+    board = Board()
+    transport = stub_transport(board)
+    scraper = make_scraper(transport, scraper_state / "http_cache.json", [])
+    fetch(scraper, use_async=False)
+
+    # 服务端轮换了 ETag 但内容没变：复用职位，下次带上新的 ETag
+    board.etag = '"v2"'
+    fetch(scraper, use_async=False)
+    fetch(scraper, use_async=False)
+    assert transport.requests[-1][2]["headers"]["If-None-Match"] == '"v2"'
+    assert board.not_modified == 1
+
+
+def test_changed_request_invalidates_entry(scraper_state):
+    cache = ResponseCache(scraper_state / "http_cache.json")
+    request = {"method": "GET", "url": "https://gh.example.com/jobs"}
+    cache.store("board", request, {"ETag": '"v1"'}, "hash", [])
+
+    assert cache.conditional_headers("board", request) == {"If-None-Match": '"v1"'}
+    changed = {**request, "params": {"content": "true"}}
+    assert cache.conditional_headers("board", changed) == {}
+    assert cache.get_jobs("board", changed) is None
+    assert cache.get_jobs("board", request, "other-hash") is None
+    assert cache.get_jobs("board", request, "hash") == []
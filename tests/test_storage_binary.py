@@ -0,0 +1,95 @@
+"""
+二进制快照与 StorageManager 二进制模式测试
+"""
+import json
+
+import config
+from storage import StorageManager, binary_to_json
+from storage.snapshot import SnapshotReader, read_snapshot, write_snapshot
+
+
+def record(index: int, added_at: str) -> dict:
+    return {
+        "title": f"Research Analyst {index}",
+        "company": "Test Labs",
+        "url": f"https://jobs.example.com/{index}",
+        "source": "Test Portfolio",
+        "added_at": added_at,
+    }
+
+
+def write_history(path, make_job) -> dict[str, dict]:
+    """两条很早添加的记录 + 两条最近添加的记录"""
+    known_jobs = {
+        make_job(1).unique_id: record(1, "2020-01-01T00:00:00"),
+        make_job(2).unique_id: record(2, "2020-01-02T00:00:00"),
+        make_job(3).unique_id: record(3, "2999-01-01T00:00:00"),
+        make_job(4).unique_id: record(4, "2999-01-01T12:00:00"),
+    }
+    write_snapshot(path / "jobs.bin", known_jobs)
+    return known_jobs
+
+
+def open_storage(path):
+    return StorageManager(path / "jobs.json", journal=False, bloom=False, snapshot_format="binary")
+
+
+def test_candidates_only_read_expired_buckets(tmp_path, make_job):
+    """过期候选只来自截止日期之前的分桶"""
+    known_jobs = write_history(tmp_path, make_job)
+    reader = SnapshotReader(tmp_path / "jobs.bin")
+    try:
+        candidates = dict(reader.candidates("2020-01-01T12:00:00"))
+        assert candidates == {make_job(1).unique_id: known_jobs[make_job(1).unique_id]}
+        assert sorted(reader.ids()) == sorted(known_jobs)
+        assert reader.to_dict() == known_jobs
+    finally:
+        reader.close()
+
+
+def test_binary_mode_never_loads_all_records(tmp_path, make_job):
+    """精确校验、标记和清理都只在映射的快照和日志上进行"""
+    write_history(tmp_path, make_job)
+    storage = open_storage(tmp_path)
+    assert storage.journal
+
+    assert storage.is_known(make_job(3))
+    storage.mark_as_seen([make_job(5)])
+    storage.cleanup_old_jobs(days=30)
+    assert not storage._loaded
+    assert storage.get_stats()["total_jobs"] == 3
+    storage.close()
+
+    # 快照本身不变，修改只追加到日志
+    assert len(read_snapshot(tmp_path / "jobs.bin")) == 4
+    storage = open_storage(tmp_path)
+    assert [storage.is_known(make_job(i)) for i in range(1, 6)] == [False, False, True, True, True]
+    storage.close()
+
+
+def test_compaction_rebuilds_snapshot_from_disk(tmp_path, make_job, monkeypatch):
+    """未加载记录时，压缩从旧快照和轮转的日志生成新快照"""
+    monkeypatch.setattr(config, "STORAGE_JOURNAL_MAX_BYTES", 1)
+    write_history(tmp_path, make_job)
+    storage = open_storage(tmp_path)
+    storage.cleanup_old_jobs(days=30)
+    storage.mark_as_seen([make_job(5)])
+    storage.close()
+
+    assert not (tmp_path / "jobs.journal.1").exists()
+    snapshot = read_snapshot(tmp_path / "jobs.bin")
+    assert make_job(1).unique_id not in snapshot and make_job(3).unique_id in snapshot
+    storage = open_storage(tmp_path)
+    assert [storage.is_known(make_job(i)) for i in range(1, 6)] == [False, False, True, True, True]
+    storage.close()
+
+
+def test_binary_to_json_replaces_atomically(tmp_path, make_job):
+    """转换结果通过临时文件替换目标文件，不留下临时文件"""
+    known_jobs = write_history(tmp_path, make_job)
+    json_file = tmp_path / "jobs.json"
+    json_file.write_text("previous", encoding="utf-8")
+
+    assert binary_to_json(tmp_path / "jobs.bin", json_file) == 4
+    assert json.loads(json_file.read_text(encoding="utf-8"))["jobs"] == known_jobs
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,62 @@
+"""
+StorageManager 布隆过滤器模式测试（JSON 快照 + jobs.idx 索引）
+"""
+import json
+
+from storage import StorageManager
+
+
+def write_history(path, make_job):
+    """两条很早添加的记录 + 一条最近添加的记录"""
+    known_jobs = {
+        make_job(index).unique_id: {
+            "title": f"Research Analyst {index}",
+            "company": "Test Labs",
+            "url": f"https://jobs.example.com/{index}",
+            "source": "Test Portfolio",
+            "added_at": added_at,
+        }
+        for index, added_at in (
+            (1, "2020-01-01T00:00:00"),
+            (2, "2020-01-02T00:00:00"),
+            (3, "2999-01-01T00:00:00"),
+        )
+    }
+    with open(path / "jobs.json", "w", encoding="utf-8") as f:
+        json.dump({"jobs": known_jobs}, f)
+
+
+def open_storage(path):
+    return StorageManager(path / "jobs.json", journal=False, bloom=True, snapshot_format="json")
+
+
+def test_bloom_mode_never_loads_all_records(tmp_path, make_job):
+    """过滤器命中、标记和清理都不加载全部记录"""
+    write_history(tmp_path, make_job)
+    storage = open_storage(tmp_path)
+    assert storage.journal and (tmp_path / "jobs.idx").exists()
+
+    assert storage.is_known(make_job(3))
+    assert not storage.is_known(make_job(4))
+    storage.mark_as_seen([make_job(4)])
+    storage.cleanup_old_jobs(days=30)
+    assert not storage._loaded
+    assert storage.get_stats()["total_jobs"] == 2
+    storage.close()
+
+    storage = open_storage(tmp_path)
+    assert [storage.is_known(make_job(i)) for i in range(1, 5)] == [False, False, True, True]
+    assert not storage._loaded
+    storage.close()
+
+
+def test_stale_index_is_rebuilt(tmp_path, make_job):
+    """jobs.json 比索引新时（如关闭布隆过滤器运行过）重新生成索引"""
+    write_history(tmp_path, make_job)
+    open_storage(tmp_path).close()
+
+    StorageManager(tmp_path / "jobs.json", journal=False, bloom=False, snapshot_format="json").mark_as_seen([make_job(5)])
+
+    storage = open_storage(tmp_path)
+    assert storage.is_known(make_job(5)) and not storage._loaded
+    storage.close()
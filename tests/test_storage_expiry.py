@@ -0,0 +1,74 @@
+"""
+过期索引与按数据源保留期测试
+"""
+import json
+from datetime import datetime, timedelta
+
+import config
+from storage import StorageManager
+from storage.expiry import ExpiryIndex, get_retention_cutoffs
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+def days_ago(days: int) -> str:
+    return (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+
+def test_candidates_only_visit_buckets_up_to_cutoff_day():
+    index = ExpiryIndex()
+    index.add("a", "2024-01-01T08:00:00")
+    index.add("b", "2024-01-02T08:00:00")
+    index.add("c", "2024-01-02T20:00:00")
+    index.add("d", "2024-01-03T00:00:00")
+
+    # 截止日当天的桶整体返回，由调用方按完整时间比较
+    assert sorted(index.candidates("2024-01-02T12:00:00")) == ["a", "b", "c"]
+    assert list(index.candidates("2023-12-31T23:59:59")) == []
+
+    index.remove("b", "2024-01-02T08:00:00")
+    index.remove("a", "2024-01-01T08:00:00")
+    assert index.to_dict() == {"2024-01-02": ["c"], "2024-01-03": ["d"]}
+    assert len(ExpiryIndex(index.to_dict())) == 2
+
+
+def test_build_uses_default_added_at_for_old_records():
+    index = ExpiryIndex.build({"a": {}, "b": {"added_at": "2024-01-05T00:00:00"}})
+    assert index.to_dict() == {"2020-01-01": ["a"], "2024-01-05": ["b"]}
+
+
+def test_retention_cutoffs_per_source(monkeypatch):
+    monkeypatch.setattr(config, "RETENTION_DAYS", 30)
+    monkeypatch.setattr(config, "SOURCE_RETENTION_DAYS", {"Long Portfolio": 180})
+
+    default_cutoff, source_cutoffs = get_retention_cutoffs(now=NOW)
+    assert default_cutoff == "2024-05-02T12:00:00"
+    assert source_cutoffs == {"Long Portfolio": "2023-12-04T12:00:00"}
+    assert get_retention_cutoffs(7, now=NOW)[0] == "2024-05-25T12:00:00"
+
+
+def test_cleanup_applies_source_retention(tmp_path, make_job, monkeypatch):
+    monkeypatch.setattr(config, "SOURCE_RETENTION_DAYS", {"Long Portfolio": 180})
+    records = {
+        1: ("Test Portfolio", days_ago(60)),   # 默认 30 天，过期
+        2: ("Test Portfolio", days_ago(10)),
+        3: ("Long Portfolio", days_ago(60)),   # 180 天，保留
+        4: ("Long Portfolio", days_ago(200)),  # 超过 180 天，过期
+    }
+    known_jobs = {
+        make_job(index, source).unique_id: {"source": source, "added_at": added_at}
+        for index, (source, added_at) in records.items()
+    }
+    with open(tmp_path / "jobs.json", "w", encoding="utf-8") as f:
+        json.dump({"jobs": known_jobs}, f)
+
+    storage = StorageManager(tmp_path / "jobs.json", journal=False, bloom=False, snapshot_format="json")
+    storage.cleanup_old_jobs(days=30)
+
+    reloaded = StorageManager(tmp_path / "jobs.json", journal=False, bloom=False, snapshot_format="json")
+    assert [
+        reloaded.is_known(make_job(index, source)) for index, (source, _) in records.items()
+    ] == [False, True, True, False]
+    # 清理后保存的过期索引与记录一致
+    saved = json.loads((tmp_path / "jobs.json").read_text(encoding="utf-8"))
+    assert sorted(job_id for ids in saved["expiry"].values() for job_id in ids) == sorted(saved["jobs"])
@@ -0,0 +1,65 @@
+"""
+StorageManager 日志模式的崩溃恢复测试
+"""
+import json
+
+from storage import StorageManager
+
+
+def open_storage(path):
+    return StorageManager(path / "jobs.json", journal=True, bloom=False, snapshot_format="json")
+
+
+def test_torn_tail_that_parses_is_discarded(tmp_path, make_job):
+    """末尾缺少换行的行即使是合法 JSON 也视为未写完，之后追加的记录不会丢失"""
+    storage = open_storage(tmp_path)
+    storage.mark_as_seen([make_job(1)])
+    storage.close()
+
+    # 写入中途被杀：最后一条记录只差换行符
+    torn = {"op": "add", "id": make_job(2).unique_id, "job": {"title": "torn"}}
+    with open(tmp_path / "jobs.journal", "a", encoding="utf-8") as f:
+        f.write(json.dumps(torn))
+
+    storage = open_storage(tmp_path)
+    assert not storage.is_known(make_job(2))
+    storage.mark_as_seen([make_job(3)])
+    storage.mark_as_seen([make_job(4)])
+    storage.close()
+
+    storage = open_storage(tmp_path)
+    assert [storage.is_known(make_job(i)) for i in (1, 2, 3, 4)] == [True, False, True, True]
+    storage.close()
+
+
+def test_torn_partial_line_is_truncated(tmp_path, make_job):
+    """无法解析的残缺末行被截断到最后一个换行处"""
+    storage = open_storage(tmp_path)
+    storage.mark_as_seen([make_job(1)])
+    storage.close()
+    journal = tmp_path / "jobs.journal"
+    complete = journal.read_bytes()
+    with open(journal, "ab") as f:
+        f.write(b'{"op":"add","id":"ab')
+
+    storage = open_storage(tmp_path)
+    assert storage.is_known(make_job(1))
+    assert journal.read_bytes() == complete
+    storage.close()
+
+
+def test_corrupt_middle_line_keeps_later_records(tmp_path, make_job):
+    """中间的损坏行只跳过，其后已 fsync 的记录照常重放且不被截断"""
+    storage = open_storage(tmp_path)
+    storage.mark_as_seen([make_job(1)])
+    with open(tmp_path / "jobs.journal", "a", encoding="utf-8") as f:
+        f.write("not json\n")
+    storage.mark_as_seen([make_job(2)])
+    storage.close()
+    size = (tmp_path / "jobs.journal").stat().st_size
+
+    storage = open_storage(tmp_path)
+    assert storage.is_known(make_job(1))
+    assert storage.is_known(make_job(2))
+    assert (tmp_path / "jobs.journal").stat().st_size == size
+    storage.close()
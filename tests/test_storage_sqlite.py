@@ -0,0 +1,119 @@
+"""
+SQLite 存储后端与 JSON 迁移测试
+"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import config
+from storage import SQLiteStorageManager, StorageManager, create_storage, migrate_json_to_sqlite
+
+
+def days_ago(days: int) -> str:
+    return (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+
+@pytest.fixture
+def storage_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STORAGE_FILE", tmp_path / "jobs.json")
+    monkeypatch.setattr(config, "SQLITE_FILE", tmp_path / "jobs.db")
+    return tmp_path / "jobs.json", tmp_path / "jobs.db"
+
+
+def write_json_storage(json_file, make_job, indexes, added_at="2024-01-01T00:00:00"):
+    storage = StorageManager(json_file, journal=False, bloom=False, snapshot_format="json")
+    storage.mark_as_seen([make_job(index) for index in indexes])
+    storage.close()
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    for job_data in data["jobs"].values():
+        job_data["added_at"] = added_at
+    json_file.write_text(json.dumps(data), encoding="utf-8")
+    return data["jobs"]
+
+
+def test_round_trip(storage_paths, make_job):
+    _, db_file = storage_paths
+    storage = SQLiteStorageManager(db_file)
+    assert storage.is_first_run()
+    with storage.transaction():
+        storage.mark_as_seen([make_job(1), make_job(2)])
+        storage.mark_as_seen([make_job(2)])
+    new_jobs = storage.find_new_jobs([make_job(1), make_job(3)])
+    assert [job.url for job in new_jobs] == [make_job(3).url]
+    storage.close()
+
+    reopened = SQLiteStorageManager(db_file)
+    assert reopened.is_known(make_job(1)) and not reopened.is_first_run()
+    assert reopened.get_stats()["total_jobs"] == 2
+    reopened.close()
+
+
+def test_find_new_jobs_across_query_batches(storage_paths, make_job):
+    storage = SQLiteStorageManager(storage_paths[1])
+    storage.mark_as_seen([make_job(index) for index in range(0, 1200, 2)])
+    new_jobs = storage.find_new_jobs([make_job(index) for index in range(1200)])
+    assert [job.url for job in new_jobs] == [make_job(index).url for index in range(1, 1200, 2)]
+    storage.close()
+
+
+def test_migration_keeps_records_and_added_at(storage_paths, make_job):
+    json_file, db_file = storage_paths
+    known_jobs = write_json_storage(json_file, make_job, [1, 2, 3])
+
+    assert migrate_json_to_sqlite(json_file, db_file) == 3
+    # 重复执行是幂等的
+    assert migrate_json_to_sqlite(json_file, db_file) == 3
+
+    storage = SQLiteStorageManager(db_file)
+    rows = storage._conn.execute(
+        "SELECT unique_id, title, company, url, source, added_at FROM jobs"
+    ).fetchall()
+    storage.close()
+    assert {row[0]: dict(zip(("title", "company", "url", "source", "added_at"), row[1:]))
+            for row in rows} == known_jobs
+
+
+def test_create_storage_migrates_only_once(storage_paths, make_job):
+    json_file, _ = storage_paths
+    write_json_storage(json_file, make_job, [1])
+
+    storage = create_storage("sqlite")
+    assert storage.is_known(make_job(1))
+    storage.close()
+
+    # 数据库已存在：之后 JSON 中的新记录不会再被导入
+    write_json_storage(json_file, make_job, [1, 2])
+    storage = create_storage("sqlite")
+    assert storage.is_known(make_job(1)) and not storage.is_known(make_job(2))
+    storage.close()
+
+
+def test_migration_without_json_storage(storage_paths):
+    json_file, db_file = storage_paths
+    assert migrate_json_to_sqlite(json_file, db_file) == 0
+    assert not db_file.exists()
+
+
+def test_cleanup_applies_default_and_source_retention(storage_paths, make_job, monkeypatch):
+    storage = SQLiteStorageManager(storage_paths[1])
+    rows = [
+        (make_job(1), days_ago(60)),
+        (make_job(2), days_ago(10)),
+        (make_job(3, "Long Portfolio"), days_ago(60)),
+        (make_job(4, "Long Portfolio"), days_ago(200)),
+    ]
+    storage._upsert(
+        (job.unique_id, job.title, job.company, job.url, job.source, added_at)
+        for job, added_at in rows
+    )
+    storage._commit()
+
+    monkeypatch.setattr(config, "SOURCE_RETENTION_DAYS", {"Long Portfolio": 180})
+    storage.cleanup_old_jobs(days=30)
+    assert [storage.is_known(job) for job, _ in rows] == [False, True, True, False]
+
+    monkeypatch.setattr(config, "SOURCE_RETENTION_DAYS", {})
+    storage.cleanup_old_jobs(days=30)
+    assert [storage.is_known(job) for job, _ in rows] == [False, True, False, False]
+    storage.close()
@@ -0,0 +1,101 @@
+"""
+StorageManager 工作单元（transaction）测试
+"""
+import os
+
+import pytest
+
+from storage import StorageManager
+
+
+def open_storage(path, journal=False):
+    return StorageManager(path / "jobs.json", journal=journal, bloom=False, snapshot_format="json")
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_transaction_coalesces_into_one_write(tmp_path, make_job, monkeypatch, journal):
+    """块内的所有修改在退出时合并为一次写入，无修改时不写文件"""
+    storage = open_storage(tmp_path, journal)
+    writes = []
+    monkeypatch.setattr(storage, "_append", lambda entries: writes.append(list(entries)) or True)
+    monkeypatch.setattr(storage, "_write_snapshot", lambda *args: writes.append(args) or True)
+
+    with storage.transaction():
+        pass
+    assert writes == []
+
+    with storage.transaction():
+        storage.mark_as_seen([make_job(1)])
+        with storage.transaction():
+            storage.mark_as_seen([make_job(2)])
+        storage.cleanup_old_jobs()
+        assert writes == []
+    assert len(writes) == 1
+
+
+def test_failed_commit_rolls_back_to_previous_snapshot(tmp_path, make_job, monkeypatch):
+    """写入失败时原快照保持不变、不留临时文件，修改保留到下次写入"""
+    storage = open_storage(tmp_path)
+    storage.mark_as_seen([make_job(1)])
+    snapshot = (tmp_path / "jobs.json").read_bytes()
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "fsync", fail_fsync)
+        with storage.transaction():
+            storage.mark_as_seen([make_job(2)])
+
+    assert (tmp_path / "jobs.json").read_bytes() == snapshot
+    assert not (tmp_path / "jobs.json.tmp").exists()
+    reloaded = open_storage(tmp_path)
+    assert reloaded.is_known(make_job(1))
+    assert not reloaded.is_known(make_job(2))
+
+    # 下一次提交写入之前未保存的修改
+    with storage.transaction():
+        pass
+    assert open_storage(tmp_path).is_known(make_job(2))
+
+
+def test_exception_in_block_still_commits_completed_mutations(tmp_path, make_job):
+    """块内抛出异常时已完成的修改仍然写入（已发送的通知不会因后续步骤出错而重发）"""
+    storage = open_storage(tmp_path, journal=True)
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.mark_as_seen([make_job(1)])
+            raise RuntimeError("dashboard failed")
+    storage.close()
+
+    reloaded = open_storage(tmp_path, journal=True)
+    assert reloaded.is_known(make_job(1))
+    reloaded.close()
+
+
+def test_failed_journal_append_keeps_original_exception(tmp_path, make_job, monkeypatch):
+    """日志追加失败时不掩盖块内的原始异常，记录保留到下次写入且不会写出半行"""
+    storage = open_storage(tmp_path, journal=True)
+    storage.mark_as_seen([make_job(1)])
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "fsync", fail_fsync)
+        with pytest.raises(RuntimeError, match="dashboard failed"):
+            with storage.transaction():
+                storage.mark_as_seen([make_job(2)])
+                raise RuntimeError("dashboard failed")
+
+    journal = (tmp_path / "jobs.journal").read_bytes()
+    assert journal.count(b"\n") == 1 and journal.endswith(b"\n")
+
+    # 下一次提交重试之前未写入的记录
+    with storage.transaction():
+        storage.mark_as_seen([make_job(3)])
+    storage.close()
+
+    reloaded = open_storage(tmp_path, journal=True)
+    assert [reloaded.is_known(make_job(i)) for i in (1, 2, 3)] == [True, True, True]
+    reloaded.close()
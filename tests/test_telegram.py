@@ -0,0 +1,25 @@
+"""
+Telegram 通知器测试
+"""
+import json
+
+import pytest
+
+from notifier.telegram import get_retry_after
+
+
+@pytest.mark.parametrize("parameters, headers, expected", [
+    ({"retry_after": 7}, {"Retry-After": "30"}, 7.0),
+    ({"retry_after": "7"}, {}, 7.0),
+    ({"retry_after": "soon"}, {"Retry-After": "30"}, 30.0),
+    ({"retry_after": [1]}, {"Retry-After": "30"}, 30.0),
+    ({}, {"Retry-After": "30"}, 30.0),
+    ({"retry_after": None}, {}, None),
+])
+def test_retry_after_falls_back_to_header(parameters, headers, expected):
+    body = json.dumps({"ok": False, "error_code": 429, "parameters": parameters})
+    assert get_retry_after(body, headers) == expected
+
+
+def test_retry_after_with_unparseable_body():
+    assert get_retry_after("<html>Too Many Requests</html>", {"Retry-After": "5"}) == 5.0